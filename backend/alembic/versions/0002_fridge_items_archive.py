@@ -0,0 +1,46 @@
+"""fridge items archive
+
+Revision ID: 0002_fridge_items_archive
+Revises: 0001_initial
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0002_fridge_items_archive"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fridge_items_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("fridge_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("fridges.id"), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("category", sa.String(length=64), nullable=True),
+        sa.Column("quantity", sa.Float(), nullable=True),
+        sa.Column("unit", sa.String(length=32), nullable=True),
+        sa.Column("purchase_date", sa.Date(), nullable=True),
+        sa.Column("expiry_date", sa.Date(), nullable=True),
+        sa.Column("storage_location", sa.String(length=32), nullable=True),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("notes", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        "ix_fridge_items_archive_fridge_id_archived_at",
+        "fridge_items_archive",
+        ["fridge_id", "archived_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fridge_items_archive_fridge_id_archived_at", table_name="fridge_items_archive")
+    op.drop_table("fridge_items_archive")
@@ -0,0 +1,57 @@
+"""usage counters for quotas
+
+Revision ID: 0003_usage_counters
+Revises: 0002_fridge_items_archive
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0003_usage_counters"
+down_revision = "0002_fridge_items_archive"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("fridges", sa.Column("item_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("users", sa.Column("owned_fridge_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("users", sa.Column("membership_count", sa.Integer(), server_default="0", nullable=False))
+
+    op.execute(
+        """
+        UPDATE fridges SET item_count = counts.n
+        FROM (SELECT fridge_id, count(*) AS n FROM fridge_items GROUP BY fridge_id) AS counts
+        WHERE counts.fridge_id = fridges.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE users SET membership_count = counts.n
+        FROM (SELECT user_id, count(*) AS n FROM fridge_members GROUP BY user_id) AS counts
+        WHERE counts.user_id = users.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE users SET owned_fridge_count = counts.n
+        FROM (SELECT owner_user_id, count(*) AS n FROM fridges GROUP BY owner_user_id) AS counts
+        WHERE counts.owner_user_id = users.id
+        """
+    )
+
+    op.create_table(
+        "upload_usage",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), primary_key=True, nullable=False),
+        sa.Column("usage_date", sa.Date(), primary_key=True, nullable=False),
+        sa.Column("bytes_used", sa.BigInteger(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("upload_usage")
+    op.drop_column("users", "membership_count")
+    op.drop_column("users", "owned_fridge_count")
+    op.drop_column("fridges", "item_count")
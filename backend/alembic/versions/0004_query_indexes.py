@@ -0,0 +1,96 @@
+"""composite and partial indexes for repository queries
+
+Revision ID: 0004_query_indexes
+Revises: 0003_usage_counters
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_query_indexes"
+down_revision = "0003_usage_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so existing deployments keep accepting writes.
+    with op.get_context().autocommit_block():
+        # list_for_user: memberships by user, role read from the index.
+        op.create_index(
+            "ix_fridge_members_user_id_fridge_id",
+            "fridge_members",
+            ["user_id", "fridge_id"],
+            postgresql_include=["role"],
+            postgresql_concurrently=True,
+        )
+        # list_items / list_expiring / per-fridge counts.
+        op.create_index(
+            "ix_fridge_items_fridge_id_expiry_date",
+            "fridge_items",
+            ["fridge_id", "expiry_date"],
+            postgresql_concurrently=True,
+        )
+        # list_expiring_all and the archive sweep only ever look at dated rows.
+        op.create_index(
+            "ix_fridge_items_expiry_date_not_null",
+            "fridge_items",
+            ["expiry_date"],
+            postgresql_where=sa.text("expiry_date IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_fridge_items_consumed_at",
+            "fridge_items",
+            [sa.text("coalesce(updated_at, created_at)")],
+            postgresql_where=sa.text("status = 'consumed'"),
+            postgresql_concurrently=True,
+        )
+        # NotificationRepository.exists.
+        op.create_index(
+            "ix_notifications_user_id_item_id_type",
+            "notifications",
+            ["user_id", "item_id", "type"],
+            postgresql_concurrently=True,
+        )
+        # Archive clears notification item links by item_id.
+        op.create_index(
+            "ix_notifications_item_id",
+            "notifications",
+            ["item_id"],
+            postgresql_where=sa.text("item_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+        # Covered by the composite indexes above.
+        op.drop_index("ix_fridge_items_fridge_id", table_name="fridge_items", postgresql_concurrently=True)
+        op.drop_index("ix_fridge_items_expiry_date", table_name="fridge_items", postgresql_concurrently=True)
+        op.drop_index("ix_notifications_user_id", table_name="notifications", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notifications_user_id", "notifications", ["user_id"], postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_fridge_items_expiry_date", "fridge_items", ["expiry_date"], postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_fridge_items_fridge_id", "fridge_items", ["fridge_id"], postgresql_concurrently=True
+        )
+        op.drop_index("ix_notifications_item_id", table_name="notifications", postgresql_concurrently=True)
+        op.drop_index(
+            "ix_notifications_user_id_item_id_type", table_name="notifications", postgresql_concurrently=True
+        )
+        op.drop_index("ix_fridge_items_consumed_at", table_name="fridge_items", postgresql_concurrently=True)
+        op.drop_index(
+            "ix_fridge_items_expiry_date_not_null", table_name="fridge_items", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_fridge_items_fridge_id_expiry_date", table_name="fridge_items", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_fridge_members_user_id_fridge_id", table_name="fridge_members", postgresql_concurrently=True
+        )
@@ -0,0 +1,22 @@
+"""user token revocation timestamp
+
+Revision ID: 0005_user_token_revocation
+Revises: 0004_query_indexes
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_user_token_revocation"
+down_revision = "0004_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("tokens_valid_after", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("users", "tokens_valid_after")
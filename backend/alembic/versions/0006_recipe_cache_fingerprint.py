@@ -0,0 +1,32 @@
+"""recipe cache fingerprint and ordering
+
+Revision ID: 0006_recipe_cache_fingerprint
+Revises: 0005_user_token_revocation
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_recipe_cache_fingerprint"
+down_revision = "0005_user_token_revocation"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nothing wrote the table before; drop any rows rather than backfill them.
+    op.execute("DELETE FROM recipes_cache")
+    op.add_column("recipes_cache", sa.Column("fingerprint", sa.String(length=64), nullable=False))
+    op.add_column("recipes_cache", sa.Column("position", sa.Integer(), nullable=False))
+    op.add_column("recipes_cache", sa.Column("missing_items", sa.JSON(), nullable=False))
+    op.create_unique_constraint(
+        "uq_recipes_cache_fridge_position", "recipes_cache", ["fridge_id", "position"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_recipes_cache_fridge_position", "recipes_cache", type_="unique")
+    op.drop_column("recipes_cache", "missing_items")
+    op.drop_column("recipes_cache", "position")
+    op.drop_column("recipes_cache", "fingerprint")
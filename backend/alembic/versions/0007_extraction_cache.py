@@ -0,0 +1,28 @@
+"""extraction cache
+
+Revision ID: 0007_extraction_cache
+Revises: 0006_recipe_cache_fingerprint
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_extraction_cache"
+down_revision = "0006_recipe_cache_fingerprint"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "extraction_cache",
+        sa.Column("key", sa.String(length=64), primary_key=True, nullable=False),
+        sa.Column("model_version", sa.String(length=128), nullable=False),
+        sa.Column("candidates", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("extraction_cache")
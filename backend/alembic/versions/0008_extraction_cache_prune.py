@@ -0,0 +1,42 @@
+"""extraction cache prune indexes
+
+Revision ID: 0008_extraction_cache_prune
+Revises: 0007_extraction_cache
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from alembic import op
+
+revision = "0008_extraction_cache_prune"
+down_revision = "0007_extraction_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so existing deployments keep accepting writes.
+    with op.get_context().autocommit_block():
+        # prune_batch: rows from other extractor versions.
+        op.create_index(
+            "ix_extraction_cache_model_version",
+            "extraction_cache",
+            ["model_version"],
+            postgresql_concurrently=True,
+        )
+        # prune_batch: rows past the retention period.
+        op.create_index(
+            "ix_extraction_cache_created_at",
+            "extraction_cache",
+            ["created_at"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_extraction_cache_created_at", table_name="extraction_cache", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_extraction_cache_model_version", table_name="extraction_cache", postgresql_concurrently=True
+        )
@@ -16,3 +16,19 @@ class ForbiddenError(AppError):
 
 class ValidationError(AppError):
     pass
+
+
+class QuotaExceededError(AppError):
+    pass
+
+
+class PayloadTooLargeError(AppError):
+    pass
+
+
+class ServiceUnavailableError(AppError):
+    pass
+
+
+class RequestRejectedError(ServiceUnavailableError):
+    """The provider is up but refused this particular input."""
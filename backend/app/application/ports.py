@@ -1,22 +1,34 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
-from typing import Iterable, Protocol
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Protocol
 
 from app.domain.entities import (
+    ArchivedItem,
+    CachedRecipes,
     FileData,
     Fridge,
     FridgeItem,
     FridgeMember,
+    FridgeSummary,
     InviteCode,
     ItemCandidate,
     Notification,
     RecipeSuggestion,
     User,
+    UserAuthState,
 )
 
 
+class UnitOfWork(Protocol):
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+    async def release(self) -> None: ...
+
+
 class UserRepository(Protocol):
     async def get_by_email(self, email: str) -> User | None: ...
 
@@ -24,6 +36,10 @@ class UserRepository(Protocol):
 
     async def create(self, email: str, hashed_password: str, name: str | None, locale: str | None) -> User: ...
 
+    async def get_auth_state(self, user_id: uuid.UUID) -> UserAuthState: ...
+
+    async def revoke_tokens(self, user_id: uuid.UUID, revoked_at: datetime) -> None: ...
+
 
 class FridgeRepository(Protocol):
     async def get_by_id(self, fridge_id: uuid.UUID) -> Fridge | None: ...
@@ -36,6 +52,14 @@ class FridgeRepository(Protocol):
 
     async def is_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool: ...
 
+    async def list_for_user(self, user_id: uuid.UUID, expiring_days: int) -> list[FridgeSummary]: ...
+
+    async def reserve_item_slots(self, fridge_id: uuid.UUID, count: int, limit: int) -> bool: ...
+
+    async def reserve_membership(self, user_id: uuid.UUID, limit: int) -> bool: ...
+
+    async def reserve_owned_fridge(self, user_id: uuid.UUID, limit: int) -> bool: ...
+
 
 class InviteRepository(Protocol):
     async def create(
@@ -67,6 +91,10 @@ class ItemRepository(Protocol):
 
     async def list_expiring_all(self, days: int) -> list[FridgeItem]: ...
 
+    async def archive_batch(self, cutoff: date, limit: int) -> int: ...
+
+    async def list_archived(self, fridge_id: uuid.UUID, limit: int) -> list[ArchivedItem]: ...
+
 
 class NotificationRepository(Protocol):
     async def exists(self, user_id: uuid.UUID, item_id: uuid.UUID | None, notif_type: str) -> bool: ...
@@ -74,22 +102,49 @@ class NotificationRepository(Protocol):
     async def create(self, user_id: uuid.UUID, fridge_id: uuid.UUID, item_id: uuid.UUID | None, notif_type: str) -> Notification: ...
 
 
+class UsageRepository(Protocol):
+    async def add_upload_bytes(self, user_id: uuid.UUID, usage_date: date, size: int, limit: int) -> bool: ...
+
+
+class RecipeCacheRepository(Protocol):
+    async def get(self, fridge_id: uuid.UUID) -> CachedRecipes | None: ...
+
+    async def put(self, fridge_id: uuid.UUID, fingerprint: str, recipes: list[RecipeSuggestion]) -> None: ...
+
+
+class ExtractionCacheRepository(Protocol):
+    async def get_many(self, keys: list[str]) -> dict[str, list[ItemCandidate]]: ...
+
+    async def put_many(self, model_version: str, entries: dict[str, list[ItemCandidate]]) -> None: ...
+
+    async def prune_batch(self, model_version: str, cutoff: datetime, limit: int) -> int: ...
+
+
+class Coalescer(Protocol):
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any: ...
+
+
 class ImageStorage(Protocol):
     async def save(self, file: FileData) -> str: ...
 
 
 class LLMClient(Protocol):
-    def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]: ...
+    # Identifies the model and prompts behind the output; cache keys include it.
+    version: str
+
+    async def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]: ...
+
+    async def extract_candidates_from_images(self, images: list[FileData]) -> list[ItemCandidate]: ...
 
-    def extract_candidates_from_images(self, image_names: Iterable[str]) -> list[ItemCandidate]: ...
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]: ...
 
-    def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]: ...
+    def stream_recipes(self, items: list[str], prefer_expiring_first: bool) -> AsyncIterator[RecipeSuggestion]: ...
 
 
 class PasswordHasher(Protocol):
-    def hash(self, password: str) -> str: ...
+    async def hash(self, password: str) -> str: ...
 
-    def verify(self, password: str, hashed_password: str) -> bool: ...
+    async def verify(self, password: str, hashed_password: str) -> bool: ...
 
 
 class TokenIssuer(Protocol):
@@ -1,10 +1,14 @@
+from datetime import datetime, timezone
+import uuid
+
 from app.application.errors import ConflictError, ValidationError
-from app.application.ports import PasswordHasher, TokenIssuer, UserRepository
+from app.application.ports import PasswordHasher, TokenIssuer, UnitOfWork, UserRepository
 from app.domain.entities import User
 
 
 async def register_user(
     *,
+    uow: UnitOfWork,
     repo: UserRepository,
     hasher: PasswordHasher,
     email: str,
@@ -15,8 +19,10 @@ async def register_user(
     existing = await repo.get_by_email(email)
     if existing:
         raise ConflictError("Email already registered")
-    hashed = hasher.hash(password)
-    return await repo.create(email=email, hashed_password=hashed, name=name, locale=locale)
+    hashed = await hasher.hash(password)
+    user = await repo.create(email=email, hashed_password=hashed, name=name, locale=locale)
+    await uow.commit()
+    return user
 
 
 async def login_user(
@@ -28,6 +34,11 @@ async def login_user(
     password: str,
 ) -> str:
     user = await repo.get_by_email(email)
-    if not user or not hasher.verify(password, user.hashed_password):
+    if not user or not await hasher.verify(password, user.hashed_password):
         raise ValidationError("Invalid credentials")
     return token_issuer.create_access_token(str(user.id))
+
+
+async def revoke_all_tokens(*, uow: UnitOfWork, repo: UserRepository, user_id: uuid.UUID) -> None:
+    await repo.revoke_tokens(user_id, datetime.now(tz=timezone.utc))
+    await uow.commit()
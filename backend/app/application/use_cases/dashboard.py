@@ -0,0 +1,58 @@
+import uuid
+from datetime import date
+from typing import Callable
+
+from app.application.ports import (
+    Coalescer,
+    FridgeRepository,
+    ItemRepository,
+    LLMClient,
+    RecipeCacheRepository,
+    UnitOfWork,
+)
+from app.application.use_cases.fridges import list_members
+from app.application.use_cases.recipes import recipes_for_inventory
+from app.domain.entities import Dashboard, RecipeSuggestion, User
+from app.domain.policies import determine_status
+from app.domain.recipe_prompt import PromptBudget
+
+
+async def get_dashboard(
+    *,
+    uow: UnitOfWork,
+    fridge_repo: FridgeRepository,
+    item_repo: ItemRepository,
+    recipe_cache: RecipeCacheRepository,
+    llm_client: LLMClient,
+    coalescer: Coalescer,
+    user: User,
+    fridge_id: uuid.UUID,
+    expiring_days: int,
+    prefer_expiring_first: bool,
+    fresh_seconds: float,
+    schedule_refresh: Callable[[uuid.UUID, bool], None],
+    schedule_store: Callable[[uuid.UUID, str, list[RecipeSuggestion]], None],
+    prompt_budget: PromptBudget | None = None,
+) -> Dashboard:
+    # list_members performs the single membership check for the whole screen;
+    # expiring items and recipes are derived from the one items read.
+    members = await list_members(fridge_repo=fridge_repo, fridge_id=fridge_id, user_id=user.id)
+    items = await item_repo.list_items(fridge_id)
+    today = date.today()
+    expiring = [item for item in items if determine_status(item.expiry_date, today, expiring_days) != "fresh"]
+    # Recipes come from the same cache as /recipes/suggest; the session is
+    # released after the cache read, before any LLM call.
+    recipes = await recipes_for_inventory(
+        uow=uow,
+        recipe_cache=recipe_cache,
+        llm_client=llm_client,
+        coalescer=coalescer,
+        fridge_id=fridge_id,
+        items=items,
+        prefer_expiring_first=prefer_expiring_first,
+        fresh_seconds=fresh_seconds,
+        schedule_refresh=schedule_refresh,
+        schedule_store=schedule_store,
+        prompt_budget=prompt_budget,
+    )
+    return Dashboard(user=user, members=members, items=items, expiring=expiring, recipes=recipes)
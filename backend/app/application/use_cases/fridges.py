@@ -1,12 +1,35 @@
 import uuid
 
-from app.application.errors import ForbiddenError, NotFoundError
-from app.application.ports import FridgeRepository
-from app.domain.entities import Fridge
+from app.application.errors import ForbiddenError, NotFoundError, QuotaExceededError
+from app.application.ports import FridgeRepository, UnitOfWork
+from app.domain.entities import Fridge, FridgeSummary
 
 
-async def create_fridge(*, fridge_repo: FridgeRepository, name: str, owner_user_id: uuid.UUID) -> Fridge:
-    return await fridge_repo.create(name=name, owner_user_id=owner_user_id)
+async def create_fridge(
+    *,
+    uow: UnitOfWork,
+    fridge_repo: FridgeRepository,
+    name: str,
+    owner_user_id: uuid.UUID,
+    max_fridges: int,
+    max_memberships: int,
+) -> Fridge:
+    if not await fridge_repo.reserve_owned_fridge(owner_user_id, max_fridges):
+        raise QuotaExceededError(f"Fridge limit of {max_fridges} reached")
+    if not await fridge_repo.reserve_membership(owner_user_id, max_memberships):
+        raise QuotaExceededError(f"Membership limit of {max_memberships} reached")
+    fridge = await fridge_repo.create(name=name, owner_user_id=owner_user_id)
+    await uow.commit()
+    return fridge
+
+
+async def list_my_fridges(
+    *,
+    fridge_repo: FridgeRepository,
+    user_id: uuid.UUID,
+    expiring_days: int,
+) -> list[FridgeSummary]:
+    return await fridge_repo.list_for_user(user_id, expiring_days)
 
 
 async def list_members(*, fridge_repo: FridgeRepository, fridge_id: uuid.UUID, user_id: uuid.UUID):
@@ -1,13 +1,14 @@
 from datetime import datetime, timedelta, timezone
 import uuid
 
-from app.application.errors import ConflictError, ForbiddenError, NotFoundError, ValidationError
-from app.application.ports import FridgeRepository, InviteRepository
+from app.application.errors import ConflictError, ForbiddenError, NotFoundError, QuotaExceededError, ValidationError
+from app.application.ports import FridgeRepository, InviteRepository, UnitOfWork
 from app.domain.entities import InviteCode
 
 
 async def create_invite_code(
     *,
+    uow: UnitOfWork,
     fridge_repo: FridgeRepository,
     invite_repo: InviteRepository,
     fridge_id: uuid.UUID,
@@ -19,21 +20,25 @@ async def create_invite_code(
     if not await fridge_repo.is_member(fridge_id, user_id):
         raise ForbiddenError("Not a fridge member")
     expires_at = datetime.now(tz=timezone.utc) + timedelta(hours=expires_in_hours)
-    return await invite_repo.create(
+    invite = await invite_repo.create(
         fridge_id=fridge_id,
         code=code,
         expires_at=expires_at,
         created_by=user_id,
         max_uses=max_uses,
     )
+    await uow.commit()
+    return invite
 
 
 async def join_fridge_by_invite(
     *,
+    uow: UnitOfWork,
     fridge_repo: FridgeRepository,
     invite_repo: InviteRepository,
     invite_code: str,
     user_id: uuid.UUID,
+    max_memberships: int,
 ) -> uuid.UUID:
     invite = await invite_repo.get_by_code(invite_code)
     if not invite:
@@ -45,7 +50,10 @@ async def join_fridge_by_invite(
         raise ValidationError("Invite code already used")
     if await fridge_repo.is_member(invite.fridge_id, user_id):
         raise ConflictError("Already a member")
+    if not await fridge_repo.reserve_membership(user_id, max_memberships):
+        raise QuotaExceededError(f"Membership limit of {max_memberships} reached")
 
     await fridge_repo.add_member(invite.fridge_id, user_id, role="member")
     await invite_repo.increment_used(invite.id)
+    await uow.commit()
     return invite.fridge_id
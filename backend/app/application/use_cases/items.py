@@ -1,46 +1,117 @@
 from __future__ import annotations
 
-from datetime import date
+import asyncio
+from datetime import date, datetime, timedelta, timezone
 import uuid
 
-from app.application.errors import ForbiddenError, NotFoundError
-from app.application.ports import FridgeRepository, ItemRepository, LLMClient
-from app.domain.entities import ItemCandidate
-from app.domain.policies import determine_status
+from app.application.errors import ForbiddenError, NotFoundError, PayloadTooLargeError, QuotaExceededError
+from app.application.ports import (
+    ExtractionCacheRepository,
+    FridgeRepository,
+    ItemRepository,
+    LLMClient,
+    UnitOfWork,
+    UsageRepository,
+)
+from app.domain.entities import ArchivedItem, FileData, ItemCandidate
+from app.domain.grocery_text import parse_grocery_text
+from app.domain.policies import determine_status, extraction_cache_key, normalize_extraction_text
 
 
 async def ingest_candidates(
     *,
+    uow: UnitOfWork,
     llm_client: LLMClient,
+    extraction_cache: ExtractionCacheRepository,
     text: str | None,
-    image_names: list[str],
+    images: list[FileData],
 ) -> list[ItemCandidate]:
-    candidates: list[ItemCandidate] = []
+    # Fragments the local grammar understands never reach the cache or the
+    # LLM; only the rest of the text is escalated, after the parsed items.
+    parsed: list[ItemCandidate] = []
     if text:
-        candidates.extend(llm_client.extract_candidates_from_text(text))
-    if image_names:
-        candidates.extend(llm_client.extract_candidates_from_images(image_names))
-    return candidates
+        parsed, unparsed = parse_grocery_text(text, date.today())
+        text = ", ".join(unparsed)
+    # Text and each image are cached separately by content hash, so a photo
+    # shared between uploads is extracted once whatever it is sent with.
+    text_key = (
+        extraction_cache_key(llm_client.version, "text", normalize_extraction_text(text).encode()) if text else None
+    )
+    image_keys = [extraction_cache_key(llm_client.version, "image", image.content) for image in images]
+    requested = ([text_key] if text_key else []) + image_keys
+    images_by_key = dict(zip(image_keys, images))
+
+    results = await extraction_cache.get_many(requested)
+    await uow.release()
+    missing = [key for key in dict.fromkeys(requested) if key not in results]
+    if missing:
+        extracted = await asyncio.gather(
+            *(
+                llm_client.extract_candidates_from_text(text)
+                if key == text_key
+                else llm_client.extract_candidates_from_images([images_by_key[key]])
+                for key in missing
+            )
+        )
+        fresh = dict(zip(missing, extracted))
+        # Entries never expire, so only definite answers are kept: a fallback
+        # provider's guess or an empty reply would stick for good.
+        cacheable = {key: candidates for key, candidates in fresh.items() if _cacheable(candidates)}
+        if cacheable:
+            await extraction_cache.put_many(llm_client.version, cacheable)
+            await uow.commit()
+        results.update(fresh)
+    return parsed + [candidate for key in requested for candidate in results[key]]
+
+
+def _cacheable(candidates: list[ItemCandidate]) -> bool:
+    return bool(candidates) and not any(candidate.provisional for candidate in candidates)
+
+
+async def reserve_upload(
+    *,
+    uow: UnitOfWork,
+    usage_repo: UsageRepository,
+    user_id: uuid.UUID,
+    image_count: int,
+    total_bytes: int,
+    max_images: int,
+    max_bytes_per_day: int,
+) -> None:
+    if image_count == 0:
+        return
+    if image_count > max_images:
+        raise PayloadTooLargeError(f"At most {max_images} images per upload")
+    today = datetime.now(tz=timezone.utc).date()
+    if not await usage_repo.add_upload_bytes(user_id, today, total_bytes, max_bytes_per_day):
+        raise PayloadTooLargeError("Daily upload limit reached")
+    await uow.commit()
 
 
 async def confirm_items(
     *,
+    uow: UnitOfWork,
     fridge_repo: FridgeRepository,
     item_repo: ItemRepository,
     fridge_id: uuid.UUID,
     user_id: uuid.UUID,
     items: list[dict],
     expiring_days: int,
+    max_items: int,
 ) -> list:
     if not await fridge_repo.is_member(fridge_id, user_id):
         raise ForbiddenError("Not a fridge member")
+    if not await fridge_repo.reserve_item_slots(fridge_id, len(items), max_items):
+        raise QuotaExceededError(f"Fridge item limit of {max_items} reached")
     today = date.today()
     prepared: list[dict] = []
     for item in items:
         expiry_date = item.get("expiry_date")
         status = determine_status(expiry_date, today, expiring_days)
         prepared.append({**item, "status": status})
-    return await item_repo.create_items(fridge_id, prepared)
+    created = await item_repo.create_items(fridge_id, prepared)
+    await uow.commit()
+    return created
 
 
 async def list_items(
@@ -57,6 +128,7 @@ async def list_items(
 
 async def update_item(
     *,
+    uow: UnitOfWork,
     fridge_repo: FridgeRepository,
     item_repo: ItemRepository,
     item_id: uuid.UUID,
@@ -71,11 +143,14 @@ async def update_item(
         raise ForbiddenError("Not a fridge member")
     if "expiry_date" in updates and "status" not in updates:
         updates["status"] = determine_status(updates.get("expiry_date"), date.today(), expiring_days)
-    return await item_repo.update_item(item_id, updates)
+    updated = await item_repo.update_item(item_id, updates)
+    await uow.commit()
+    return updated
 
 
 async def delete_item(
     *,
+    uow: UnitOfWork,
     fridge_repo: FridgeRepository,
     item_repo: ItemRepository,
     item_id: uuid.UUID,
@@ -89,6 +164,7 @@ async def delete_item(
     deleted = await item_repo.delete_item(item_id)
     if not deleted:
         raise NotFoundError("Item not found")
+    await uow.commit()
 
 
 async def list_expiring(
@@ -102,3 +178,57 @@ async def list_expiring(
     if not await fridge_repo.is_member(fridge_id, user_id):
         raise ForbiddenError("Not a fridge member")
     return await item_repo.list_expiring(fridge_id, days)
+
+
+async def archive_stale_items(
+    *,
+    uow: UnitOfWork,
+    item_repo: ItemRepository,
+    older_than_days: int,
+    batch_size: int,
+) -> int:
+    if batch_size <= 0:
+        # A batch can never come back short of zero, so the loop would not end.
+        raise ValueError("batch_size must be positive")
+    cutoff = date.today() - timedelta(days=older_than_days)
+    archived = 0
+    while True:
+        # One transaction per batch keeps row locks and WAL bursts short.
+        moved = await item_repo.archive_batch(cutoff, batch_size)
+        await uow.commit()
+        archived += moved
+        if moved < batch_size:
+            return archived
+
+
+async def prune_extraction_cache(
+    *,
+    uow: UnitOfWork,
+    extraction_cache: ExtractionCacheRepository,
+    model_version: str,
+    older_than_days: int,
+    batch_size: int,
+) -> int:
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    pruned = 0
+    while True:
+        removed = await extraction_cache.prune_batch(model_version, cutoff, batch_size)
+        await uow.commit()
+        pruned += removed
+        if removed < batch_size:
+            return pruned
+
+
+async def list_item_history(
+    *,
+    fridge_repo: FridgeRepository,
+    item_repo: ItemRepository,
+    fridge_id: uuid.UUID,
+    user_id: uuid.UUID,
+    limit: int,
+) -> list[ArchivedItem]:
+    if not await fridge_repo.is_member(fridge_id, user_id):
+        raise ForbiddenError("Not a fridge member")
+    return await item_repo.list_archived(fridge_id, limit)
@@ -1,11 +1,12 @@
 from datetime import date, timedelta
 
-from app.application.ports import FridgeRepository, ItemRepository, NotificationRepository
+from app.application.ports import FridgeRepository, ItemRepository, NotificationRepository, UnitOfWork
 from app.domain.policies import determine_status
 
 
 async def generate_expiry_notifications(
     *,
+    uow: UnitOfWork,
     fridge_repo: FridgeRepository,
     item_repo: ItemRepository,
     notification_repo: NotificationRepository,
@@ -28,4 +29,5 @@ async def generate_expiry_notifications(
                 continue
             await notification_repo.create(member.user_id, item.fridge_id, item.id, notif_type)
             created += 1
+    await uow.commit()
     return created
@@ -1,23 +1,296 @@
 import uuid
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator, Callable
 
 from app.application.errors import ForbiddenError
-from app.application.ports import FridgeRepository, ItemRepository, LLMClient
+from app.application.ports import (
+    Coalescer,
+    FridgeRepository,
+    ItemRepository,
+    LLMClient,
+    RecipeCacheRepository,
+    UnitOfWork,
+)
+from app.domain.entities import CachedRecipes, FridgeItem, RecipeSuggestion
+from app.domain.policies import recipe_fingerprint
+from app.domain.recipe_prompt import PromptBudget, select_prompt_items
+
+
+def _ingredient_names(
+    items: list[FridgeItem], prefer_expiring_first: bool, prompt_budget: PromptBudget | None
+) -> list[str]:
+    return select_prompt_items(
+        items, prefer_expiring_first=prefer_expiring_first, today=date.today(), budget=prompt_budget
+    )
+
+
+def _cacheable(recipes: list[RecipeSuggestion]) -> bool:
+    # A fallback provider's answer is served but not kept for the freshness window.
+    return bool(recipes) and not any(recipe.provisional for recipe in recipes)
+
+
+async def recipes_for_items(
+    *,
+    llm_client: LLMClient,
+    items: list[FridgeItem],
+    prefer_expiring_first: bool,
+    prompt_budget: PromptBudget | None = None,
+) -> list[RecipeSuggestion]:
+    names = _ingredient_names(items, prefer_expiring_first, prompt_budget)
+    return await llm_client.suggest_recipes(names, prefer_expiring_first)
+
+
+def _serve_cached(
+    cached: CachedRecipes | None,
+    fingerprint: str,
+    fresh_seconds: float,
+    refresh: Callable[[], None],
+) -> list[RecipeSuggestion] | None:
+    # The fingerprint is recomputed from the live items, so an entry written
+    # for an older inventory (say, racing an item write) is never served.
+    if cached is None or cached.fingerprint != fingerprint:
+        return None
+    if datetime.now(tz=timezone.utc) - cached.created_at > timedelta(seconds=fresh_seconds):
+        # Stale-while-revalidate: answer now, regenerate off the request.
+        refresh()
+    return cached.recipes
+
+
+async def _generate_shared(
+    *,
+    llm_client: LLMClient,
+    coalescer: Coalescer,
+    fridge_id: uuid.UUID,
+    items: list[FridgeItem],
+    fingerprint: str,
+    prefer_expiring_first: bool,
+    prompt_budget: PromptBudget | None,
+) -> tuple[list[RecipeSuggestion], bool]:
+    """Returns the recipes and whether they should be stored by this caller.
+
+    Concurrent misses for the same inventory share one LLM call; only the
+    caller whose call ran stores the result, and only a cacheable one.
+    """
+    ran = False
+
+    async def generate() -> list[RecipeSuggestion]:
+        nonlocal ran
+        ran = True
+        return await recipes_for_items(
+            llm_client=llm_client,
+            items=items,
+            prefer_expiring_first=prefer_expiring_first,
+            prompt_budget=prompt_budget,
+        )
+
+    recipes = await coalescer.run((fridge_id, fingerprint), generate)
+    return recipes, ran and _cacheable(recipes)
+
+
+async def _generate_and_cache(
+    *,
+    uow: UnitOfWork,
+    recipe_cache: RecipeCacheRepository,
+    llm_client: LLMClient,
+    coalescer: Coalescer,
+    fridge_id: uuid.UUID,
+    items: list[FridgeItem],
+    fingerprint: str,
+    prefer_expiring_first: bool,
+    prompt_budget: PromptBudget | None,
+) -> list[RecipeSuggestion]:
+    recipes, store = await _generate_shared(
+        llm_client=llm_client,
+        coalescer=coalescer,
+        fridge_id=fridge_id,
+        items=items,
+        fingerprint=fingerprint,
+        prefer_expiring_first=prefer_expiring_first,
+        prompt_budget=prompt_budget,
+    )
+    if store:
+        await recipe_cache.put(fridge_id, fingerprint, recipes)
+        await uow.commit()
+    return recipes
+
+
+async def refresh_recipes(
+    *,
+    uow: UnitOfWork,
+    item_repo: ItemRepository,
+    recipe_cache: RecipeCacheRepository,
+    llm_client: LLMClient,
+    coalescer: Coalescer,
+    fridge_id: uuid.UUID,
+    prefer_expiring_first: bool,
+    prompt_budget: PromptBudget | None = None,
+) -> list[RecipeSuggestion]:
+    items = await item_repo.list_items(fridge_id)
+    await uow.release()
+    return await _generate_and_cache(
+        uow=uow,
+        recipe_cache=recipe_cache,
+        llm_client=llm_client,
+        coalescer=coalescer,
+        fridge_id=fridge_id,
+        items=items,
+        fingerprint=recipe_fingerprint(items, prefer_expiring_first),
+        prefer_expiring_first=prefer_expiring_first,
+        prompt_budget=prompt_budget,
+    )
 
 
 async def suggest_recipes(
     *,
+    uow: UnitOfWork,
     fridge_repo: FridgeRepository,
     item_repo: ItemRepository,
+    recipe_cache: RecipeCacheRepository,
     llm_client: LLMClient,
+    coalescer: Coalescer,
     fridge_id: uuid.UUID,
     user_id: uuid.UUID,
     prefer_expiring_first: bool,
+    fresh_seconds: float,
+    schedule_refresh: Callable[[uuid.UUID, bool], None],
+    prompt_budget: PromptBudget | None = None,
 ) -> list:
     if not await fridge_repo.is_member(fridge_id, user_id):
         raise ForbiddenError("Not a fridge member")
     items = await item_repo.list_items(fridge_id)
-    if prefer_expiring_first:
-        items = sorted(items, key=lambda item: item.expiry_date or date.max)
-    names = [item.name for item in items if item.name]
-    return llm_client.suggest_recipes(names, prefer_expiring_first)
+    fingerprint = recipe_fingerprint(items, prefer_expiring_first)
+    cached = await recipe_cache.get(fridge_id)
+    await uow.release()
+    recipes = _serve_cached(
+        cached, fingerprint, fresh_seconds, lambda: schedule_refresh(fridge_id, prefer_expiring_first)
+    )
+    if recipes is not None:
+        return recipes
+    return await _generate_and_cache(
+        uow=uow,
+        recipe_cache=recipe_cache,
+        llm_client=llm_client,
+        coalescer=coalescer,
+        fridge_id=fridge_id,
+        items=items,
+        fingerprint=fingerprint,
+        prefer_expiring_first=prefer_expiring_first,
+        prompt_budget=prompt_budget,
+    )
+
+
+async def recipes_for_inventory(
+    *,
+    uow: UnitOfWork,
+    recipe_cache: RecipeCacheRepository,
+    llm_client: LLMClient,
+    coalescer: Coalescer,
+    fridge_id: uuid.UUID,
+    items: list[FridgeItem],
+    prefer_expiring_first: bool,
+    fresh_seconds: float,
+    schedule_refresh: Callable[[uuid.UUID, bool], None],
+    schedule_store: Callable[[uuid.UUID, str, list[RecipeSuggestion]], None],
+    prompt_budget: PromptBudget | None = None,
+) -> list[RecipeSuggestion]:
+    """``suggest_recipes`` for a caller that already checked access and read the items.
+
+    ``uow`` may be a read-only session: it is released after the cache read,
+    and a freshly generated result is written through ``schedule_store``.
+    """
+    fingerprint = recipe_fingerprint(items, prefer_expiring_first)
+    cached = await recipe_cache.get(fridge_id)
+    await uow.release()
+    recipes = _serve_cached(
+        cached, fingerprint, fresh_seconds, lambda: schedule_refresh(fridge_id, prefer_expiring_first)
+    )
+    if recipes is not None:
+        return recipes
+    recipes, store = await _generate_shared(
+        llm_client=llm_client,
+        coalescer=coalescer,
+        fridge_id=fridge_id,
+        items=items,
+        fingerprint=fingerprint,
+        prefer_expiring_first=prefer_expiring_first,
+        prompt_budget=prompt_budget,
+    )
+    if store:
+        schedule_store(fridge_id, fingerprint, recipes)
+    return recipes
+
+
+async def store_recipes(
+    *,
+    uow: UnitOfWork,
+    recipe_cache: RecipeCacheRepository,
+    fridge_id: uuid.UUID,
+    fingerprint: str,
+    recipes: list[RecipeSuggestion],
+) -> None:
+    await recipe_cache.put(fridge_id, fingerprint, recipes)
+    await uow.commit()
+
+
+async def _replay(recipes: list[RecipeSuggestion]) -> AsyncIterator[RecipeSuggestion]:
+    for recipe in recipes:
+        yield recipe
+
+
+async def _stream_and_store(
+    *,
+    llm_client: LLMClient,
+    items: list[FridgeItem],
+    prefer_expiring_first: bool,
+    prompt_budget: PromptBudget | None,
+    store: Callable[[list[RecipeSuggestion]], None],
+) -> AsyncIterator[RecipeSuggestion]:
+    recipes: list[RecipeSuggestion] = []
+    names = _ingredient_names(items, prefer_expiring_first, prompt_budget)
+    async for recipe in llm_client.stream_recipes(names, prefer_expiring_first):
+        recipes.append(recipe)
+        yield recipe
+    # Only a stream that ran to completion is cached.
+    if _cacheable(recipes):
+        store(recipes)
+
+
+async def stream_recipes(
+    *,
+    uow: UnitOfWork,
+    fridge_repo: FridgeRepository,
+    item_repo: ItemRepository,
+    recipe_cache: RecipeCacheRepository,
+    llm_client: LLMClient,
+    fridge_id: uuid.UUID,
+    user_id: uuid.UUID,
+    prefer_expiring_first: bool,
+    fresh_seconds: float,
+    schedule_refresh: Callable[[uuid.UUID, bool], None],
+    schedule_store: Callable[[uuid.UUID, str, list[RecipeSuggestion]], None],
+    prompt_budget: PromptBudget | None = None,
+) -> AsyncIterator[RecipeSuggestion]:
+    """Checks access and reads eagerly, then returns the recipe stream.
+
+    The stream itself never touches the caller's session, which may be gone
+    by the time it is consumed; the finished result is written through
+    ``schedule_store`` instead.
+    """
+    if not await fridge_repo.is_member(fridge_id, user_id):
+        raise ForbiddenError("Not a fridge member")
+    items = await item_repo.list_items(fridge_id)
+    fingerprint = recipe_fingerprint(items, prefer_expiring_first)
+    cached = await recipe_cache.get(fridge_id)
+    await uow.release()
+    recipes = _serve_cached(
+        cached, fingerprint, fresh_seconds, lambda: schedule_refresh(fridge_id, prefer_expiring_first)
+    )
+    if recipes is not None:
+        return _replay(recipes)
+    return _stream_and_store(
+        llm_client=llm_client,
+        items=items,
+        prefer_expiring_first=prefer_expiring_first,
+        prompt_budget=prompt_budget,
+        store=lambda recipes: schedule_store(fridge_id, fingerprint, recipes),
+    )
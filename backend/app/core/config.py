@@ -1,4 +1,4 @@
-from pydantic import AnyHttpUrl
+from pydantic import AnyHttpUrl, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -9,6 +9,9 @@ class Settings(BaseSettings):
     api_v1_str: str = "/api/v1"
 
     database_url: str
+    database_read_url: str | None = None
+    read_your_writes_seconds: float = 5.0
+    replica_lag_poll_seconds: float = 2.0
 
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
@@ -19,6 +22,26 @@ class Settings(BaseSettings):
 
     gemini_api_key: str | None = None
     llm_mode: str = "stub"
+    gemini_model: str = "gemini-1.5-flash"
+    gemini_base_url: str = "https://generativelanguage.googleapis.com"
+    llm_timeout_seconds: float = 20.0
+    llm_max_concurrency: int = 8
+    llm_max_retries: int = 3
+    llm_retry_backoff_seconds: float = 0.5
+    llm_retry_after_max_seconds: float = 10.0
+    llm_batch_window_seconds: float = 0.02
+    llm_batch_max_size: int = 8
+    llm_hedge_secondary: str = ""
+    llm_hedge_percentile: float = 0.95
+    llm_hedge_min_seconds: float = 0.5
+    llm_hedge_max_seconds: float = 5.0
+    llm_breaker_failures: int = 5
+    llm_breaker_reset_seconds: float = 30.0
+    recipe_engine: str = "llm"
+    recipe_engine_limit: int = 5
+    recipe_prompt_max_tokens: int = 400
+    recipe_prompt_max_items: int = 40
+    recipe_prompt_diversity: float = 0.25
 
     upload_dir: str = "uploads"
     image_base_url: AnyHttpUrl | None = None
@@ -27,6 +50,35 @@ class Settings(BaseSettings):
     invite_expires_hours: int = 24 * 7
     invite_max_uses: int = 1
 
+    max_items_per_fridge: int = 5000
+    max_images_per_item: int = 10
+    max_fridges_per_user: int = 20
+    max_memberships_per_user: int = 50
+    max_upload_bytes_per_day: int = 50 * 1024 * 1024
+
+    membership_cache_mode: str = "pair"
+    membership_cache_size: int = 10_000
+    membership_cache_ttl_seconds: float = 60.0
+
+    auth_cache_size: int = 10_000
+    auth_cache_ttl_seconds: float = 30.0
+
+    cache_bus_enabled: bool = False
+    cache_bus_channel: str = "cache_invalidation"
+
+    recipe_cache_size: int = 1000
+    recipe_cache_fresh_seconds: float = 6 * 60 * 60
+
+    extraction_cache_size: int = 5000
+    extraction_cache_ttl_seconds: float = 24 * 60 * 60
+    extraction_cache_retention_days: int = Field(default=90, gt=0)
+
+    password_hash_workers: int = 2
+    password_hash_queue: int = 32
+
+    archive_after_days: int = 30
+    archive_batch_size: int = Field(default=1000, gt=0)
+
     cors_allow_origins: str = ""
 
 
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from jose import jwt
@@ -20,6 +20,7 @@ def get_password_hash(password: str) -> str:
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     if expires_delta is None:
         expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
-    expire = datetime.utcnow() + expires_delta
-    to_encode: dict[str, Any] = {"exp": expire, "sub": subject}
+    issued_at = datetime.now(tz=timezone.utc)
+    expire = issued_at + expires_delta
+    to_encode: dict[str, Any] = {"exp": expire, "iat": issued_at, "sub": subject}
     return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
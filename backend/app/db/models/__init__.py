@@ -3,9 +3,12 @@ from app.db.models.fridge import Fridge
 from app.db.models.fridge_member import FridgeMember
 from app.db.models.invite_code import InviteCode
 from app.db.models.fridge_item import FridgeItem
+from app.db.models.fridge_item_archive import FridgeItemArchive
+from app.db.models.extraction_cache import ExtractionCache
 from app.db.models.item_image import ItemImage
 from app.db.models.notification import Notification
 from app.db.models.recipe_cache import RecipeCache
+from app.db.models.upload_usage import UploadUsage
 
 __all__ = [
     "User",
@@ -13,7 +16,10 @@ __all__ = [
     "FridgeMember",
     "InviteCode",
     "FridgeItem",
+    "FridgeItemArchive",
+    "ExtractionCache",
     "ItemImage",
     "Notification",
     "RecipeCache",
+    "UploadUsage",
 ]
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, JSON, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ExtractionCache(Base):
+    __tablename__ = "extraction_cache"
+    __table_args__ = (
+        Index("ix_extraction_cache_model_version", "model_version"),
+        Index("ix_extraction_cache_created_at", "created_at"),
+    )
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model_version: Mapped[str] = mapped_column(String(128), nullable=False)
+    candidates: Mapped[list[dict]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
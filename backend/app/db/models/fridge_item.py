@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, date
 
-from sqlalchemy import Date, DateTime, ForeignKey, String, Float, func
+from sqlalchemy import Date, DateTime, ForeignKey, Index, String, Float, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,15 +10,28 @@ from app.db.base import Base
 
 class FridgeItem(Base):
     __tablename__ = "fridge_items"
+    __table_args__ = (
+        Index("ix_fridge_items_fridge_id_expiry_date", "fridge_id", "expiry_date"),
+        Index(
+            "ix_fridge_items_expiry_date_not_null",
+            "expiry_date",
+            postgresql_where=text("expiry_date IS NOT NULL"),
+        ),
+        Index(
+            "ix_fridge_items_consumed_at",
+            text("coalesce(updated_at, created_at)"),
+            postgresql_where=text("status = 'consumed'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    fridge_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("fridges.id"), index=True, nullable=False)
+    fridge_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("fridges.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     category: Mapped[str | None] = mapped_column(String(64), nullable=True)
     quantity: Mapped[float | None] = mapped_column(Float, nullable=True)
     unit: Mapped[str | None] = mapped_column(String(32), nullable=True)
     purchase_date: Mapped[date | None] = mapped_column(Date, nullable=True)
-    expiry_date: Mapped[date | None] = mapped_column(Date, index=True, nullable=True)
+    expiry_date: Mapped[date | None] = mapped_column(Date, nullable=True)
     storage_location: Mapped[str | None] = mapped_column(String(32), nullable=True)
     status: Mapped[str] = mapped_column(String(16), default="fresh", nullable=False)
     notes: Mapped[str | None] = mapped_column(String(500), nullable=True)
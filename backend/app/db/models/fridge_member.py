@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,7 +10,10 @@ from app.db.base import Base
 
 class FridgeMember(Base):
     __tablename__ = "fridge_members"
-    __table_args__ = (UniqueConstraint("fridge_id", "user_id", name="uq_fridge_user"),)
+    __table_args__ = (
+        UniqueConstraint("fridge_id", "user_id", name="uq_fridge_user"),
+        Index("ix_fridge_members_user_id_fridge_id", "user_id", "fridge_id", postgresql_include=["role"]),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     fridge_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("fridges.id"), nullable=False)
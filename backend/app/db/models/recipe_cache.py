@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, JSON, String, func
+from sqlalchemy import DateTime, ForeignKey, Integer, JSON, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -9,11 +9,17 @@ from app.db.base import Base
 
 
 class RecipeCache(Base):
+    """One suggested recipe per row; a fridge's rows form one cache entry."""
+
     __tablename__ = "recipes_cache"
+    __table_args__ = (UniqueConstraint("fridge_id", "position", name="uq_recipes_cache_fridge_position"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     fridge_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("fridges.id"), index=True, nullable=False)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     ingredients: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    missing_items: Mapped[list[str]] = mapped_column(JSON, nullable=False)
     steps: Mapped[list[str]] = mapped_column(JSON, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,16 @@
+import uuid
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class UploadUsage(Base):
+    __tablename__ = "upload_usage"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    usage_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    bytes_used: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
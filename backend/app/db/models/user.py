@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -16,4 +16,7 @@ class User(Base):
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     name: Mapped[str | None] = mapped_column(String(120), nullable=True)
     locale: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    owned_fridge_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    membership_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    tokens_valid_after: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
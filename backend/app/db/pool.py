@@ -0,0 +1,23 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import metrics
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection.
+
+    Metrics are named after the pool's ``logging_name`` (set with
+    ``pool_logging_name``): ``db.pool.<name>.checkout_wait_seconds`` and
+    ``db.pool.<name>.checked_out``.
+    """
+
+    def _do_get(self):
+        name = self.logging_name or "default"
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.histogram(f"db.pool.{name}.checkout_wait_seconds").observe(time.perf_counter() - started)
+            metrics.gauge(f"db.pool.{name}.checked_out").set(self.checkedout())
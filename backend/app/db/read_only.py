@@ -0,0 +1,11 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class ReadOnlySession(Session):
+    pass
+
+
+@event.listens_for(ReadOnlySession, "after_begin")
+def _begin_read_only(session, transaction, connection) -> None:
+    connection.exec_driver_sql("SET TRANSACTION READ ONLY")
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Whether this is a replica, whether it has replayed all the WAL it has
+# received, and the age of the last transaction it replayed.
+REPLICA_STATUS_SQL = text(
+    "SELECT pg_is_in_recovery(), "
+    "pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn(), "
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+)
+
+
+def replica_lag_seconds(in_recovery: bool, caught_up: bool | None, replay_age: float | None) -> float:
+    # An idle primary sends no new WAL, so the age of the last replayed
+    # transaction keeps growing although nothing is pending; a replica that
+    # has replayed everything it received is not behind.
+    if not in_recovery or caught_up:
+        return 0.0
+    return float(replay_age or 0.0)
+
+
+class ReplicaLag:
+    """Latest replica lag reading, shared by the monitor and read routing.
+
+    The replica counts as ``behind`` while its lag exceeds
+    ``max_lag_seconds``, before the first reading and after a failed one;
+    reads then go to the primary.
+    """
+
+    def __init__(self, max_lag_seconds: float) -> None:
+        self._max_lag = max_lag_seconds
+        self.seconds: float | None = None
+        self._gauge = metrics.gauge("db.replica_lag_seconds")
+
+    @property
+    def behind(self) -> bool:
+        return self.seconds is None or self.seconds > self._max_lag
+
+    def record(self, seconds: float | None) -> None:
+        self.seconds = seconds
+        if seconds is not None:
+            self._gauge.set(seconds)
+
+
+async def monitor_replica_lag(engine: AsyncEngine, interval_seconds: float, lag: ReplicaLag) -> None:
+    while True:
+        try:
+            async with engine.connect() as conn:
+                in_recovery, caught_up, replay_age = (await conn.execute(REPLICA_STATUS_SQL)).one()
+            lag.record(replica_lag_seconds(in_recovery, caught_up, replay_age))
+        except Exception:
+            lag.record(None)
+            logger.warning("Could not read replica lag", exc_info=True)
+        await asyncio.sleep(interval_seconds)
@@ -1,12 +1,42 @@
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.db.pool import TimedQueuePool
+from app.db.read_only import ReadOnlySession
+from app.db.replica import ReplicaLag
 
 
 engine: AsyncEngine = create_async_engine(
     settings.database_url,
     echo=False,
     pool_pre_ping=True,
+    poolclass=TimedQueuePool,
+    pool_logging_name="primary",
 )
 
 AsyncSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+# Reads go to the replica when one is configured, otherwise to the primary;
+# either way they run in READ ONLY transactions.
+read_engine: AsyncEngine = (
+    create_async_engine(
+        settings.database_read_url,
+        echo=False,
+        pool_pre_ping=True,
+        poolclass=TimedQueuePool,
+        pool_logging_name="replica",
+    )
+    if settings.database_read_url
+    else engine
+)
+
+
+ReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    sync_session_class=ReadOnlySession,
+    expire_on_commit=False,
+)
+
+# Fed by monitor_replica_lag; None without a replica.
+replica_lag = ReplicaLag(settings.read_your_writes_seconds) if settings.database_read_url else None
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Sequence, TypeVar
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.metrics import metrics
+from app.db.read_only import ReadOnlySession
+
+T = TypeVar("T")
+
+
+class ShardRouter:
+    """Places fridge-scoped data across databases by ``fridge_id``.
+
+    The global database keeps users and auth data and is also the first
+    fridge shard, since existing fridges live there. Placement is
+    ``fridge_id.int % shard_count``; changing the shard list remaps ids, so
+    shards must be added together with a data move. Each shard has its own
+    engine and pool, and optionally a read engine (its replica) that
+    fan-out reads use in READ ONLY sessions.
+
+    Not wired into the app yet: that needs fridge ids chosen before insert
+    and a unit of work per shard, so the repositories still take one session.
+    """
+
+    def __init__(
+        self,
+        global_engine: AsyncEngine,
+        extra_engines: Sequence[AsyncEngine] = (),
+        *,
+        read_engines: Sequence[AsyncEngine] | None = None,
+    ) -> None:
+        self.global_engine = global_engine
+        self.engines = [global_engine, *extra_engines]
+        self.read_engines = list(read_engines) if read_engines is not None else self.engines
+        if len(self.read_engines) != len(self.engines):
+            raise ValueError("one read engine per shard is required")
+        self._sessionmakers = [
+            async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False) for engine in self.engines
+        ]
+        self._read_sessionmakers = [
+            async_sessionmaker(
+                bind=engine, class_=AsyncSession, sync_session_class=ReadOnlySession, expire_on_commit=False
+            )
+            for engine in self.read_engines
+        ]
+        self._fan_out_time = metrics.histogram("db.shards.fan_out_seconds")
+
+    @property
+    def sharded(self) -> bool:
+        return len(self.engines) > 1
+
+    def shard_index(self, fridge_id: uuid.UUID) -> int:
+        return fridge_id.int % len(self.engines)
+
+    def sessionmaker_for(self, fridge_id: uuid.UUID) -> async_sessionmaker[AsyncSession]:
+        return self._sessionmakers[self.shard_index(fridge_id)]
+
+    async def fan_out(self, query: Callable[[AsyncSession], Awaitable[list[T]]]) -> list[T]:
+        """Run ``query`` on every shard's read engine concurrently and concatenate the rows."""
+
+        async def run(sessionmaker: async_sessionmaker[AsyncSession]) -> list[T]:
+            async with sessionmaker() as session:
+                return await query(session)
+
+        started = asyncio.get_running_loop().time()
+        results = await asyncio.gather(*(run(sessionmaker) for sessionmaker in self._read_sessionmakers))
+        self._fan_out_time.observe(asyncio.get_running_loop().time() - started)
+        return [row for rows in results for row in rows]
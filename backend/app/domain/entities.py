@@ -5,7 +5,7 @@ from datetime import date, datetime
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: uuid.UUID
     email: str
@@ -15,7 +15,20 @@ class User:
     created_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
+class Principal:
+    user_id: uuid.UUID
+    issued_at: datetime | None = None
+
+
+@dataclass(slots=True)
+class UserAuthState:
+    user_id: uuid.UUID
+    exists: bool
+    tokens_valid_after: datetime | None = None
+
+
+@dataclass(slots=True)
 class Fridge:
     id: uuid.UUID
     name: str
@@ -23,7 +36,19 @@ class Fridge:
     created_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
+class FridgeSummary:
+    id: uuid.UUID
+    name: str
+    owner_user_id: uuid.UUID
+    role: str
+    member_count: int
+    item_count: int
+    expiring_count: int
+    created_at: datetime | None = None
+
+
+@dataclass(slots=True)
 class FridgeMember:
     id: uuid.UUID
     fridge_id: uuid.UUID
@@ -32,7 +57,7 @@ class FridgeMember:
     created_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InviteCode:
     id: uuid.UUID
     fridge_id: uuid.UUID
@@ -44,7 +69,7 @@ class InviteCode:
     created_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FridgeItem:
     id: uuid.UUID
     fridge_id: uuid.UUID
@@ -61,7 +86,12 @@ class FridgeItem:
     updated_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
+class ArchivedItem(FridgeItem):
+    archived_at: datetime | None = None
+
+
+@dataclass(slots=True)
 class ItemCandidate:
     name: str
     quantity: float | None = None
@@ -70,17 +100,28 @@ class ItemCandidate:
     storage_location: str | None = None
     confidence: float | None = None
     source: str = "text"
+    category: str | None = None
+    # Answered by a fallback provider; good enough to show, not to cache.
+    provisional: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RecipeSuggestion:
     title: str
     steps: list[str]
     use_items: list[str]
     missing_items: list[str]
+    provisional: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
+class CachedRecipes:
+    fingerprint: str
+    recipes: list[RecipeSuggestion]
+    created_at: datetime
+
+
+@dataclass(slots=True)
 class Notification:
     id: uuid.UUID
     user_id: uuid.UUID
@@ -91,7 +132,16 @@ class Notification:
     created_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
+class Dashboard:
+    user: User
+    members: list[FridgeMember]
+    items: list[FridgeItem]
+    expiring: list[FridgeItem]
+    recipes: list[RecipeSuggestion]
+
+
+@dataclass(slots=True)
 class FileData:
     filename: str
     content: bytes
@@ -0,0 +1,291 @@
+"""Table-driven parser for short grocery lists such as "우유 2개, 계란 10 개, 두부 1모".
+
+Each comma or line separated fragment is matched against a small quantity
+grammar (name and count in either order, Korean or English units and number
+words), with an optional expiry phrase ("3일 후", "내일", "in 2 weeks",
+"10월 25일까지") and storage word ("냉동", "frozen"). Category and storage are
+inferred from a food table. Fragments the grammar cannot account for are
+returned unparsed, for the LLM to handle.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+import re
+from typing import Callable
+import unicodedata
+
+from app.domain.entities import ItemCandidate
+
+# Confidence of locally parsed candidates; the LLM reports its own.
+KNOWN_WITH_QUANTITY = 0.95
+KNOWN_NAME_ONLY = 0.9
+UNKNOWN_WITH_QUANTITY = 0.85
+
+# Longer free text is more likely a sentence than an item name.
+_MAX_NAME_WORDS = 3
+
+# Unit spelling -> (stored unit, quantity multiplier).
+UNITS: dict[str, tuple[str, float]] = {
+    **{counter: (counter, 1) for counter in (
+        "개", "알", "봉지", "봉", "팩", "병", "캔", "통", "모", "단", "포기", "마리", "묶음", "줄", "장",
+        "컵", "상자", "박스", "판", "구", "망", "송이", "근", "덩이", "토막", "쪽", "공기", "인분",
+    )},
+    "g": ("g", 1), "그램": ("g", 1), "kg": ("kg", 1), "킬로": ("kg", 1), "킬로그램": ("kg", 1),
+    "ml": ("ml", 1), "밀리리터": ("ml", 1), "l": ("L", 1), "리터": ("L", 1),
+    "ea": ("ea", 1), "pc": ("ea", 1), "pcs": ("ea", 1), "piece": ("ea", 1), "pieces": ("ea", 1),
+    "dozen": ("ea", 12),
+    "pack": ("pack", 1), "packs": ("pack", 1), "package": ("pack", 1), "packages": ("pack", 1),
+    "bottle": ("bottle", 1), "bottles": ("bottle", 1), "can": ("can", 1), "cans": ("can", 1),
+    "carton": ("carton", 1), "cartons": ("carton", 1), "bag": ("bag", 1), "bags": ("bag", 1),
+    "box": ("box", 1), "boxes": ("box", 1), "jar": ("jar", 1), "jars": ("jar", 1),
+    "bunch": ("bunch", 1), "bunches": ("bunch", 1), "head": ("head", 1), "heads": ("head", 1),
+    "loaf": ("loaf", 1), "loaves": ("loaf", 1), "cup": ("cup", 1), "cups": ("cup", 1),
+    "block": ("block", 1), "blocks": ("block", 1), "tray": ("tray", 1), "trays": ("tray", 1),
+    "lb": ("lb", 1), "lbs": ("lb", 1), "pound": ("lb", 1), "pounds": ("lb", 1), "oz": ("oz", 1),
+}
+
+NUMBER_WORDS: dict[str, float] = {
+    "한": 1.0, "하나": 1.0, "두": 2.0, "둘": 2.0, "세": 3.0, "셋": 3.0, "석": 3.0, "네": 4.0, "넷": 4.0,
+    "다섯": 5.0, "여섯": 6.0, "일곱": 7.0, "여덟": 8.0, "아홉": 9.0, "열": 10.0, "반": 0.5,
+    "a": 1.0, "an": 1.0, "one": 1.0, "two": 2.0, "three": 3.0, "four": 4.0, "five": 5.0, "six": 6.0,
+    "seven": 7.0, "eight": 8.0, "nine": 9.0, "ten": 10.0, "twelve": 12.0, "half": 0.5, "half a": 0.5,
+}
+
+STORAGE_WORDS: dict[str, str] = {
+    "냉동": "freezer", "냉동실": "freezer", "frozen": "freezer", "freezer": "freezer",
+    "냉장": "fridge", "냉장실": "fridge", "냉장고": "fridge", "fridge": "fridge", "refrigerated": "fridge",
+    "실온": "pantry", "상온": "pantry", "pantry": "pantry", "room temperature": "pantry",
+}
+
+# (category, default storage, names). Matched whole, then by the longest name
+# contained in the item ("서울우유" is milk, "냉동만두" dumplings).
+FOODS: list[tuple[str, str, list[str]]] = [
+    ("dairy", "fridge", [
+        "우유", "milk", "치즈", "cheese", "버터", "butter", "요거트", "요구르트", "yogurt", "yoghurt",
+        "생크림", "cream", "크림치즈", "cream cheese",
+    ]),
+    ("eggs", "fridge", ["계란", "달걀", "유정란", "메추리알", "egg"]),
+    ("meat", "fridge", [
+        "돼지고기", "삼겹살", "목살", "소고기", "쇠고기", "한우", "불고기", "닭고기", "닭가슴살", "닭다리", "닭",
+        "베이컨", "햄", "소시지", "스팸", "pork", "beef", "chicken", "bacon", "ham", "sausage", "spam",
+        "ground beef", "steak",
+    ]),
+    ("seafood", "fridge", [
+        "생선", "연어", "고등어", "오징어", "새우", "조개", "바지락", "굴", "멸치", "참치", "어묵", "게맛살",
+        "fish", "salmon", "mackerel", "squid", "shrimp", "prawn", "clam", "oyster", "tuna", "fish cake",
+    ]),
+    ("vegetables", "fridge", [
+        "양파", "대파", "쪽파", "파", "마늘", "감자", "고구마", "당근", "애호박", "호박", "양배추", "배추", "시금치",
+        "콩나물", "숙주", "버섯", "표고버섯", "팽이버섯", "토마토", "방울토마토", "오이", "상추", "깻잎", "파프리카",
+        "피망", "고추", "청양고추", "무", "브로콜리", "가지", "옥수수", "onion", "green onion", "scallion",
+        "garlic", "potato", "sweet potato", "carrot", "zucchini", "cabbage", "spinach", "bean sprouts",
+        "mushroom", "tomato", "cucumber", "lettuce", "bell pepper", "pepper", "radish", "broccoli",
+        "eggplant", "corn", "celery", "kale",
+    ]),
+    ("fruit", "fridge", [
+        "사과", "배", "바나나", "딸기", "포도", "귤", "오렌지", "레몬", "수박", "참외", "복숭아", "블루베리", "키위",
+        "아보카도", "apple", "pear", "banana", "strawberry", "grape", "tangerine", "orange", "lemon",
+        "watermelon", "peach", "blueberry", "kiwi", "avocado",
+    ]),
+    ("tofu", "fridge", ["두부", "순두부", "tofu"]),
+    ("side dishes", "fridge", ["김치", "배추김치", "깍두기", "반찬", "kimchi"]),
+    ("grains", "pantry", ["쌀", "현미", "찹쌀", "햇반", "rice", "brown rice", "oats", "flour", "밀가루"]),
+    ("noodles", "pantry", ["라면", "국수", "소면", "파스타", "스파게티", "ramen", "noodles", "pasta", "spaghetti"]),
+    ("bakery", "pantry", ["식빵", "빵", "베이글", "bread", "bagel", "tortilla"]),
+    ("sauces", "fridge", [
+        "고추장", "된장", "간장", "쌈장", "케첩", "마요네즈", "gochujang", "doenjang", "soy sauce", "ketchup",
+        "mayonnaise", "mayo",
+    ]),
+    ("beverages", "fridge", ["주스", "두유", "콜라", "사이다", "맥주", "juice", "soy milk", "coke", "soda", "beer"]),
+    ("frozen", "freezer", ["만두", "아이스크림", "냉동피자", "떡", "dumplings", "ice cream", "frozen pizza"]),
+    ("canned", "pantry", ["참치캔", "통조림", "canned tuna"]),
+]
+
+_FOODS = {name: (category, storage) for category, storage, names in FOODS for name in names}
+# Single Hangul syllables ("파", "무", "배") only count as whole names, and
+# English names only as whole words ("egg" is not in "eggnog").
+_HANGUL_FOODS = sorted((name for name in _FOODS if len(name) > 1 and not name.isascii()), key=len, reverse=True)
+
+
+def _alternation(words) -> str:
+    return "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+_ENGLISH_FOODS = re.compile(rf"(?<!\w)({_alternation(name for name in _FOODS if name.isascii())})(?:e?s)?(?!\w)")
+_NUM = r"\d+(?:\.\d+)?"
+_UNIT = rf"(?:{_alternation(UNITS)})"
+_WORD_NUM = rf"(?:{_alternation(NUMBER_WORDS)})"
+_SPLIT = re.compile(r"[,\n;·、]+")
+_STORAGE = re.compile(rf"\(?\s*(?<!\w)({_alternation(STORAGE_WORDS)})(?:\s*보관)?(?!\w)\s*\)?", re.IGNORECASE)
+_NAME_OK = re.compile(r"^[^\W\d_]+(?:[ '\-&][^\W\d_]+)*$")
+
+# Tried in order; the first one that accounts for the whole fragment wins.
+_QUANTITY_GRAMMAR = [
+    # 우유 2개 / milk x2 / 우유 1L
+    re.compile(rf"^(?P<name>.+?)\s+(?:[x×*]\s*)?(?P<qty>{_NUM})\s*(?P<unit>{_UNIT})?$", re.IGNORECASE),
+    # 계란10개
+    re.compile(rf"^(?P<name>.+?)(?P<qty>{_NUM})\s*(?P<unit>{_UNIT})$", re.IGNORECASE),
+    # 대파 한 단 / 대파한단
+    re.compile(rf"^(?P<name>.+?)\s*(?P<word>{_WORD_NUM})\s*(?P<unit>{_UNIT})$", re.IGNORECASE),
+    # 2 cartons of milk / 1kg beef / a dozen eggs / 3 eggs
+    re.compile(
+        rf"^(?:(?P<qty>{_NUM})|(?P<word>{_WORD_NUM})(?=\s))\s*(?:(?P<unit>{_UNIT})(?!\w))?\s*(?:of\s+)?(?P<name>.+)$",
+        re.IGNORECASE,
+    ),
+]
+
+_MARKER = r"(?:(?:유통기한|소비기한|기한|exp(?:ires|iry)?|best before|use by|until)\s*:?\s*)?"
+_UNTIL = r"(?:\s*까지)?"
+
+
+def _in_days(days: int) -> Callable[[re.Match, date], date]:
+    return lambda match, today: today + timedelta(days=days)
+
+
+def _this_or_next_year(today: date, month: int, day: int) -> date:
+    # Dates without a year that already passed months ago are next year's.
+    candidate = date(today.year, month, day)
+    if (today - candidate).days > 180:
+        candidate = date(today.year + 1, month, day)
+    return candidate
+
+
+_EXPIRY: list[tuple[re.Pattern, Callable[[re.Match, date], date]]] = [
+    (
+        re.compile(rf"{_MARKER}(?P<y>\d{{4}})[-./](?P<m>\d{{1,2}})[-./](?P<d>\d{{1,2}}){_UNTIL}", re.IGNORECASE),
+        lambda m, today: date(int(m["y"]), int(m["m"]), int(m["d"])),
+    ),
+    (
+        re.compile(rf"{_MARKER}(?P<m>\d{{1,2}})\s*월\s*(?P<d>\d{{1,2}})\s*일{_UNTIL}", re.IGNORECASE),
+        lambda m, today: _this_or_next_year(today, int(m["m"]), int(m["d"])),
+    ),
+    (
+        # A bare 10/25 could be a fraction; it needs a marker or "까지".
+        re.compile(
+            r"(?:(?:유통기한|소비기한|기한|exp(?:ires|iry)?|best before|use by|until)\s*:?\s*|~\s*)"
+            r"(?P<m>\d{1,2})[/.](?P<d>\d{1,2})(?:\s*까지)?"
+            r"|(?P<m2>\d{1,2})[/.](?P<d2>\d{1,2})\s*까지",
+            re.IGNORECASE,
+        ),
+        lambda m, today: _this_or_next_year(today, int(m["m"] or m["m2"]), int(m["d"] or m["d2"])),
+    ),
+    (
+        re.compile(rf"{_MARKER}(?P<n>\d+)\s*(?P<unit>일|주|개월|달)\s*(?:후|뒤|내|이내|남음|남은){_UNTIL}"),
+        lambda m, today: today + timedelta(days=int(m["n"]) * {"일": 1, "주": 7, "개월": 30, "달": 30}[m["unit"]]),
+    ),
+    (re.compile(rf"{_MARKER}일주일\s*(?:후|뒤|내|이내)?{_UNTIL}"), _in_days(7)),
+    (re.compile(rf"{_MARKER}오늘{_UNTIL}"), _in_days(0)),
+    (re.compile(rf"{_MARKER}내일{_UNTIL}"), _in_days(1)),
+    (re.compile(rf"{_MARKER}모레{_UNTIL}"), _in_days(2)),
+    (
+        re.compile(rf"{_MARKER}(?:in\s+)?(?P<n>\d+)\s*(?P<unit>days?|weeks?)(?:\s+left)?(?!\w)", re.IGNORECASE),
+        lambda m, today: today + timedelta(days=int(m["n"]) * (7 if m["unit"].lower().startswith("w") else 1)),
+    ),
+    (re.compile(rf"{_MARKER}(?<!\w)today(?!\w)", re.IGNORECASE), _in_days(0)),
+    (re.compile(rf"{_MARKER}(?<!\w)tomorrow(?!\w)", re.IGNORECASE), _in_days(1)),
+    (re.compile(rf"{_MARKER}(?<!\w)next week(?!\w)", re.IGNORECASE), _in_days(7)),
+]
+
+
+def lookup_food(name: str) -> tuple[str, str] | None:
+    """Category and default storage for ``name``, or None when it is not in the table."""
+    key = name.casefold()
+    for candidate in (key, key.removesuffix("es"), key.removesuffix("s")):
+        if candidate in _FOODS:
+            return _FOODS[candidate]
+    for food in _HANGUL_FOODS:
+        if food in key:
+            return _FOODS[food]
+    match = _ENGLISH_FOODS.search(key)
+    return _FOODS[match.group(1)] if match else None
+
+
+def _take_expiry(fragment: str, today: date) -> tuple[str, date | None]:
+    for pattern, resolve in _EXPIRY:
+        match = pattern.search(fragment)
+        if match is None:
+            continue
+        try:
+            expiry = resolve(match, today)
+        except ValueError:
+            return fragment, None
+        return fragment[: match.start()] + " " + fragment[match.end() :], expiry
+    return fragment, None
+
+
+def _take_storage(fragment: str) -> tuple[str, str | None]:
+    match = _STORAGE.search(fragment)
+    if match is None:
+        return fragment, None
+    return fragment[: match.start()] + " " + fragment[match.end() :], STORAGE_WORDS[match.group(1).casefold()]
+
+
+def _clean(fragment: str) -> str:
+    fragment = re.sub(r"\(\s*\)|\[\s*\]", " ", fragment)
+    return " ".join(fragment.split()).strip(" -:~")
+
+
+def _candidate(
+    name: str, quantity: float | None, unit: str | None, expiry: date | None, storage: str | None
+) -> ItemCandidate | None:
+    name = _clean(name)
+    if not _NAME_OK.match(name) or len(name.split()) > _MAX_NAME_WORDS:
+        return None
+    food = lookup_food(name)
+    if food is None and quantity is None:
+        return None
+    if food is None:
+        confidence = UNKNOWN_WITH_QUANTITY
+    else:
+        confidence = KNOWN_NAME_ONLY if quantity is None else KNOWN_WITH_QUANTITY
+    return ItemCandidate(
+        name=name,
+        quantity=quantity,
+        unit=unit,
+        expiry_date=expiry,
+        storage_location=storage or (food[1] if food else None),
+        confidence=confidence,
+        source="text",
+        category=food[0] if food else None,
+    )
+
+
+def parse_fragment(fragment: str, today: date) -> ItemCandidate | None:
+    rest, expiry = _take_expiry(fragment, today)
+    rest, storage = _take_storage(rest)
+    rest = _clean(rest)
+    if not rest:
+        return None
+    for pattern in _QUANTITY_GRAMMAR:
+        match = pattern.match(rest)
+        if match is None:
+            continue
+        groups = match.groupdict()
+        unit, multiplier = UNITS.get((groups.get("unit") or "").lower(), (None, 1))
+        if groups.get("qty"):
+            quantity = float(groups["qty"]) * multiplier
+        elif groups.get("word"):
+            quantity = NUMBER_WORDS[groups["word"].lower()] * multiplier
+        else:
+            quantity = None
+        candidate = _candidate(match["name"], quantity, unit, expiry, storage)
+        if candidate is not None:
+            return candidate
+    return _candidate(rest, None, None, expiry, storage)
+
+
+def parse_grocery_text(text: str, today: date) -> tuple[list[ItemCandidate], list[str]]:
+    """Candidates for the fragments the grammar accounts for, and the unparsed rest."""
+    candidates: list[ItemCandidate] = []
+    unparsed: list[str] = []
+    for fragment in _SPLIT.split(unicodedata.normalize("NFKC", text)):
+        fragment = fragment.strip()
+        if not fragment:
+            continue
+        candidate = parse_fragment(fragment, today)
+        if candidate is None:
+            unparsed.append(fragment)
+        else:
+            candidates.append(candidate)
+    return candidates, unparsed
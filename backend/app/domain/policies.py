@@ -1,4 +1,8 @@
-from datetime import date
+from datetime import date, datetime
+import hashlib
+import unicodedata
+
+from app.domain.entities import FridgeItem
 
 
 def determine_status(expiry_date: date | None, today: date, expiring_days: int) -> str:
@@ -9,3 +13,32 @@ def determine_status(expiry_date: date | None, today: date, expiring_days: int)
     if (expiry_date - today).days <= expiring_days:
         return "expiring"
     return "fresh"
+
+
+def is_token_revoked(issued_at: datetime | None, tokens_valid_after: datetime | None) -> bool:
+    if tokens_valid_after is None:
+        return False
+    if issued_at is None:
+        return True
+    # JWT iat has whole-second precision.
+    return issued_at < tokens_valid_after.replace(microsecond=0)
+
+
+def recipe_fingerprint(items: list[FridgeItem], prefer_expiring_first: bool) -> str:
+    # Everything the recipe prompt depends on: which items, the expiry order
+    # they would be listed in, and the ordering preference.
+    ordered = sorted((item.expiry_date or date.max, item.name) for item in items if item.name)
+    key = "\x1f".join([str(prefer_expiring_first), *(f"{expiry}\x1e{name}" for expiry, name in ordered)])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def normalize_extraction_text(text: str) -> str:
+    # Re-pasted receipts differ in width forms and whitespace, not content.
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def extraction_cache_key(model_version: str, kind: str, content: bytes) -> str:
+    # The extractor's version is part of the key, so a model or prompt change
+    # starts from an empty cache instead of serving the old model's output.
+    digest = hashlib.sha256(content).hexdigest()
+    return hashlib.sha256(f"{model_version}\x1f{kind}\x1f{digest}".encode()).hexdigest()
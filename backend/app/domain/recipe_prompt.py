@@ -0,0 +1,119 @@
+"""Choosing which fridge items go into a recipe prompt.
+
+Names are cleaned ("서울우유 1L (냉동)" -> "서울우유") and deduplicated
+case-insensitively, keeping the earliest expiry. Within a token budget the
+items are then picked greedily by expiry urgency, with a penalty for every
+item already picked from the same category, so a fridge full of dairy does
+not crowd out the one vegetable about to go off.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+import math
+import re
+import unicodedata
+
+from app.domain.entities import FridgeItem
+from app.domain.grocery_text import lookup_food
+
+_BRACKETED = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_HAS_DIGIT = re.compile(r"\d")
+# ", " between names in the prompt.
+_SEPARATOR_TOKENS = 1
+
+
+@dataclass(slots=True, frozen=True)
+class PromptBudget:
+    max_tokens: int
+    max_items: int
+    diversity: float = 0.25
+
+
+@dataclass(slots=True)
+class _Entry:
+    name: str
+    expiry_date: date | None
+    category: str | None
+    position: int
+
+
+def clean_item_name(name: str) -> str:
+    # Quantities, sizes and bracketed notes say nothing about what to cook.
+    text = unicodedata.normalize("NFKC", name)
+    words = [word for word in _BRACKETED.sub(" ", text).split() if not _HAS_DIGIT.search(word)]
+    return " ".join(words).strip(" ,.-/:;") or " ".join(text.split())
+
+
+def estimate_tokens(text: str) -> int:
+    # About four Latin characters per token; Hangul is closer to one per syllable.
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return math.ceil(ascii_chars / 4) + len(text) - ascii_chars
+
+
+def _urgency(expiry_date: date | None, today: date) -> float:
+    if expiry_date is None:
+        return 0.0
+    return 1.0 / (1 + max((expiry_date - today).days, 0))
+
+
+def _dedupe(items: list[FridgeItem]) -> list[_Entry]:
+    entries: dict[str, _Entry] = {}
+    for position, item in enumerate(items):
+        name = clean_item_name(item.name or "")
+        if not name:
+            continue
+        entry = entries.get(name.casefold())
+        if entry is None:
+            food = lookup_food(name)
+            category = item.category or (food[0] if food else None)
+            entries[name.casefold()] = _Entry(name, item.expiry_date, category, position)
+        elif (item.expiry_date or date.max) < (entry.expiry_date or date.max):
+            entry.expiry_date = item.expiry_date
+    return list(entries.values())
+
+
+def select_prompt_items(
+    items: list[FridgeItem],
+    *,
+    prefer_expiring_first: bool,
+    today: date,
+    budget: PromptBudget | None,
+) -> list[str]:
+    """Item names for the prompt, soonest-expiring first when that is preferred."""
+    entries = _dedupe(items)
+    if budget is not None:
+        entries = _pick(entries, prefer_expiring_first, today, budget)
+    if prefer_expiring_first:
+        entries.sort(key=lambda entry: (entry.expiry_date or date.max, entry.position))
+    else:
+        entries.sort(key=lambda entry: entry.position)
+    return [entry.name for entry in entries]
+
+
+def _pick(entries: list[_Entry], prefer_expiring_first: bool, today: date, budget: PromptBudget) -> list[_Entry]:
+    urgency = {id(entry): _urgency(entry.expiry_date, today) if prefer_expiring_first else 0.0 for entry in entries}
+    remaining = list(entries)
+    picked: list[_Entry] = []
+    per_category: dict[str, int] = {}
+    tokens = 0
+    while remaining and len(picked) < budget.max_items:
+        best = max(
+            remaining,
+            key=lambda entry: (
+                urgency[id(entry)] - budget.diversity * per_category.get(entry.category, 0)
+                if entry.category
+                else urgency[id(entry)],
+                -entry.position,
+            ),
+        )
+        remaining.remove(best)
+        cost = estimate_tokens(best.name) + (_SEPARATOR_TOKENS if picked else 0)
+        if tokens + cost > budget.max_tokens:
+            continue
+        tokens += cost
+        picked.append(best)
+        if best.category:
+            per_category[best.category] = per_category.get(best.category, 0) + 1
+    return picked
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Hashable
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJobs:
+    """Fire-and-forget coroutines, at most one in flight per key.
+
+    Holds a reference to every running task so none is garbage collected
+    mid-flight; failures are logged and counted under
+    ``background.<name>.failures`` instead of surfacing anywhere.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self._scheduled = metrics.counter(f"background.{name}.scheduled")
+        self._failures = metrics.counter(f"background.{name}.failures")
+
+    def schedule(self, key: Hashable, job: Callable[[], Awaitable[object]]) -> bool:
+        if key in self._tasks:
+            return False
+        task = asyncio.ensure_future(job())
+        self._tasks[key] = task
+        task.add_done_callback(lambda done: self._finished(key, done))
+        self._scheduled.inc()
+        return True
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        self._tasks.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self._failures.inc()
+            logger.warning("Background %s job %r failed", self.name, key, exc_info=task.exception())
+
+    async def drain(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def aclose(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
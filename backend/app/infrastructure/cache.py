@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import time
+from typing import Callable, Generic, Hashable, TypeVar
+
+from app.core.metrics import metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries also expire after ``ttl_seconds``.
+
+    Hits and misses are counted under ``cache.<name>.hits`` / ``.misses``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        maxsize: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._hits = metrics.counter(f"cache.{name}.hits")
+        self._misses = metrics.counter(f"cache.{name}.misses")
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self._misses.inc()
+            return default
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._misses.inc()
+            return default
+        self._entries.move_to_end(key)
+        self._hits.inc()
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._hits.value
+
+    @property
+    def misses(self) -> int:
+        return self._misses.value
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import json
+import logging
+import time
+from typing import Callable
+import uuid
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Registration:
+    evict: Callable[[str], None]
+    flush: Callable[[], None]
+
+
+class InvalidationBus:
+    """Cross-process cache invalidation over Postgres ``LISTEN/NOTIFY``.
+
+    Writers call ``publish`` inside their transaction; Postgres only delivers
+    the notification once that transaction commits, so other processes never
+    evict ahead of the data they would reload. The writer evicts its own
+    cache locally, and listeners skip messages carrying their own origin.
+    Notifications are not durable, so every (re)connect flushes all caches.
+    """
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._caches: dict[str, _Registration] = {}
+        self._lag = metrics.histogram("cache_bus.lag_seconds")
+        self._received = metrics.counter("cache_bus.received")
+        self._published = metrics.counter("cache_bus.published")
+        self._reconnects = metrics.counter("cache_bus.reconnects")
+
+    def register(self, cache: str, *, evict: Callable[[str], None], flush: Callable[[], None]) -> None:
+        self._caches[cache] = _Registration(evict=evict, flush=flush)
+
+    async def publish(self, db: AsyncSession, cache: str, key: str) -> None:
+        payload = json.dumps({"origin": self.origin, "cache": cache, "key": key, "sent_at": time.time()})
+        await db.execute(select(func.pg_notify(self.channel, payload)))
+        self._published.inc()
+
+    def handle(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed cache invalidation payload: %r", payload)
+            return
+        if message.get("origin") == self.origin:
+            return
+        self._received.inc()
+        sent_at = message.get("sent_at")
+        if sent_at is not None:
+            self._lag.observe(max(time.time() - sent_at, 0.0))
+        registration = self._caches.get(message.get("cache"))
+        if registration is None:
+            return
+        try:
+            registration.evict(message["key"])
+        except (KeyError, ValueError):
+            logger.warning("Unparseable key in cache invalidation payload: %r", payload)
+            registration.flush()
+
+    def flush_all(self) -> None:
+        for registration in self._caches.values():
+            registration.flush()
+
+    async def listen(self, dsn: str, *, keepalive_seconds: float = 10.0, max_backoff_seconds: float = 30.0) -> None:
+        import asyncpg
+
+        backoff = 1.0
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(dsn)
+                await conn.add_listener(self.channel, lambda _conn, _pid, _channel, payload: self.handle(payload))
+                # Anything published while we were not listening is lost.
+                self.flush_all()
+                backoff = 1.0
+                while True:
+                    await asyncio.sleep(keepalive_seconds)
+                    await asyncio.wait_for(conn.fetchval("SELECT 1"), timeout=keepalive_seconds)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Cache invalidation listener disconnected, retrying in %.0fs", backoff, exc_info=True)
+                self._reconnects.inc()
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, max_backoff_seconds)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    conn.terminate()
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
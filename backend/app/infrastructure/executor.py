@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Callable, TypeVar
+
+from app.application.errors import ServiceUnavailableError
+from app.core.metrics import metrics
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """Thread pool for blocking CPU work with a cap on queued jobs.
+
+    At most ``max_workers`` jobs run while ``max_queue`` more may wait; beyond
+    that ``run`` sheds load with ``ServiceUnavailableError`` instead of
+    growing an unbounded backlog. A job holds its slot until the thread is
+    done with it, even if the caller stopped waiting. Queue wait and run time
+    are recorded as ``<name>.queue_wait_seconds`` and ``<name>.run_seconds``.
+    """
+
+    def __init__(self, name: str, *, max_workers: int, max_queue: int) -> None:
+        self.name = name
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._capacity = max_workers + max_queue
+        self._in_flight = 0
+        self._queue_wait = metrics.histogram(f"{name}.queue_wait_seconds")
+        self._run_time = metrics.histogram(f"{name}.run_seconds")
+        self._rejected = metrics.counter(f"{name}.rejected")
+        self._depth = metrics.gauge(f"{name}.in_flight")
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        # Only touched from the event loop thread, so no lock is needed.
+        if self._in_flight >= self._capacity:
+            self._rejected.inc()
+            raise ServiceUnavailableError(f"{self.name} is saturated, retry shortly")
+        self._in_flight += 1
+        self._depth.set(self._in_flight)
+        submitted = time.perf_counter()
+
+        def timed() -> T:
+            started = time.perf_counter()
+            self._queue_wait.observe(started - submitted)
+            try:
+                return fn(*args)
+            finally:
+                self._run_time.observe(time.perf_counter() - started)
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._executor.submit(timed)
+        except BaseException:
+            self._release()
+            raise
+        # Cancelling the caller only cancels a job that has not started; one
+        # already running keeps its slot until it returns.
+        future.add_done_callback(lambda _: self._release_from(loop))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _release_from(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Runs on the worker thread; the counter belongs to the loop thread.
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._release)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._depth.set(self._in_flight)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Protocol
+
+from app.application.errors import ServiceUnavailableError
+from app.core.metrics import metrics
+from app.domain.entities import FileData, ItemCandidate, RecipeSuggestion
+
+
+class BatchExtractor(Protocol):
+    version: str
+
+    # None for an input the reply left out.
+    async def extract_candidates_batch(self, inputs: list[str | FileData]) -> list[list[ItemCandidate] | None]: ...
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]: ...
+
+    def stream_recipes(self, items: list[str], prefer_expiring_first: bool) -> AsyncIterator[RecipeSuggestion]: ...
+
+    async def aclose(self) -> None: ...
+
+
+class BatchingLLMClient:
+    """Folds concurrent extraction calls into multi-input LLM requests.
+
+    Each text or image waits at most ``window_seconds`` for company; a batch
+    is sent as soon as it holds ``max_batch_size`` inputs, or when the window
+    of its first input closes. Results are split back to the waiting callers,
+    and a failed request fails every caller in its batch; an input the reply
+    left out fails just its caller (``llm.batch.missing``). Callers cancelled
+    before dispatch are dropped from the batch. Batch sizes are recorded in
+    ``llm.batch.size`` and the share of capacity used in ``llm.batch.fill``.
+    """
+
+    def __init__(self, inner: BatchExtractor, *, window_seconds: float, max_batch_size: int) -> None:
+        self.version = inner.version
+        self._inner = inner
+        self._window = window_seconds
+        self._max_batch_size = max_batch_size
+        self._pending: list[tuple[str | FileData, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._dispatches: set[asyncio.Task] = set()
+        self._size = metrics.histogram("llm.batch.size")
+        self._fill = metrics.histogram("llm.batch.fill")
+        self._full = metrics.counter("llm.batch.flushed_full")
+        self._timed_out = metrics.counter("llm.batch.flushed_window")
+        self._missing = metrics.counter("llm.batch.missing")
+
+    async def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]:
+        return await self._submit(text)
+
+    async def extract_candidates_from_images(self, images: list[FileData]) -> list[ItemCandidate]:
+        results = await asyncio.gather(*(self._submit(image) for image in images))
+        return [candidate for candidates in results for candidate in candidates]
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        return await self._inner.suggest_recipes(items, prefer_expiring_first)
+
+    def stream_recipes(self, items: list[str], prefer_expiring_first: bool) -> AsyncIterator[RecipeSuggestion]:
+        return self._inner.stream_recipes(items, prefer_expiring_first)
+
+    async def aclose(self) -> None:
+        if self._pending:
+            self._flush()
+        await asyncio.gather(*self._dispatches, return_exceptions=True)
+        await self._inner.aclose()
+
+    async def _submit(self, item: str | FileData) -> list[ItemCandidate]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._full.inc()
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush_on_timer)
+        return await future
+
+    def _flush_on_timer(self) -> None:
+        self._timer = None
+        self._timed_out.inc()
+        self._flush()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = [(item, future) for item, future in self._pending[: self._max_batch_size] if not future.done()]
+        del self._pending[: self._max_batch_size]
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._flush_on_timer)
+        if not batch:
+            return
+        self._size.observe(len(batch))
+        self._fill.observe(len(batch) / self._max_batch_size)
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[str | FileData, asyncio.Future]]) -> None:
+        try:
+            results = await self._inner.extract_candidates_batch([item for item, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        results = [*results, *[None] * (len(batch) - len(results))]
+        for (_, future), candidates in zip(batch, results):
+            if future.done():
+                continue
+            if candidates is None:
+                self._missing.inc()
+                future.set_exception(ServiceUnavailableError("LLM reply left out this input"))
+            else:
+                future.set_result(candidates)
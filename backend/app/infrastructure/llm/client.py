@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
 from app.core.config import settings
-from app.domain.entities import ItemCandidate, RecipeSuggestion
+from app.domain.entities import FileData, ItemCandidate, RecipeSuggestion
+from app.infrastructure.llm.batching import BatchingLLMClient
+from app.infrastructure.llm.gemini import GeminiLLMClient
+from app.infrastructure.llm.hedging import HedgedLLMClient
+from app.infrastructure.llm.local import LocalRecipeClient
+from app.infrastructure.recipes.engine import RecipeIndex
 
 
 def _stub_guess_name(token: str) -> str:
@@ -82,18 +87,77 @@ def suggest_recipes_stub(items: list[str], prefer_expiring_first: bool) -> list[
 
 
 class StubLLMClient:
-    def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]:
+    version = "stub-1"
+
+    async def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]:
         return extract_candidates_from_text(text)
 
-    def extract_candidates_from_images(self, image_names: Iterable[str]) -> list[ItemCandidate]:
-        return extract_candidates_from_images(image_names)
+    async def extract_candidates_from_images(self, images: list[FileData]) -> list[ItemCandidate]:
+        return extract_candidates_from_images(image.filename for image in images)
+
+    async def extract_candidates_batch(self, inputs: list[str | FileData]) -> list[list[ItemCandidate]]:
+        return [
+            extract_candidates_from_text(item)
+            if isinstance(item, str)
+            else extract_candidates_from_images([item.filename])
+            for item in inputs
+        ]
 
-    def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
         return suggest_recipes_stub(items, prefer_expiring_first)
 
+    async def stream_recipes(self, items: list[str], prefer_expiring_first: bool) -> AsyncIterator[RecipeSuggestion]:
+        for recipe in suggest_recipes_stub(items, prefer_expiring_first):
+            yield recipe
+
+    async def aclose(self) -> None:
+        pass
+
+
+def build_llm_client() -> (
+    StubLLMClient | GeminiLLMClient | HedgedLLMClient | BatchingLLMClient | LocalRecipeClient
+):
+    client = _build_model_client()
+    if settings.recipe_engine == "llm":
+        return client
+    return LocalRecipeClient(
+        client, RecipeIndex.from_file(), mode=settings.recipe_engine, limit=settings.recipe_engine_limit
+    )
 
-def build_llm_client() -> StubLLMClient:
+
+def _gemini(model: str) -> GeminiLLMClient:
+    return GeminiLLMClient(
+        api_key=settings.gemini_api_key,
+        model=model,
+        base_url=settings.gemini_base_url,
+        timeout_seconds=settings.llm_timeout_seconds,
+        max_concurrency=settings.llm_max_concurrency,
+        max_retries=settings.llm_max_retries,
+        backoff_seconds=settings.llm_retry_backoff_seconds,
+        max_retry_after_seconds=settings.llm_retry_after_max_seconds,
+    )
+
+
+def _build_model_client() -> StubLLMClient | GeminiLLMClient | HedgedLLMClient | BatchingLLMClient:
     if settings.llm_mode != "stub" and settings.gemini_api_key:
-        # Gemini integration can be added here.
-        return StubLLMClient()
+        client: GeminiLLMClient | HedgedLLMClient = _gemini(settings.gemini_model)
+        if settings.llm_hedge_secondary:
+            secondary = (
+                StubLLMClient() if settings.llm_hedge_secondary == "stub" else _gemini(settings.llm_hedge_secondary)
+            )
+            client = HedgedLLMClient(
+                [("primary", client), ("secondary", secondary)],
+                percentile=settings.llm_hedge_percentile,
+                min_delay_seconds=settings.llm_hedge_min_seconds,
+                max_delay_seconds=settings.llm_hedge_max_seconds,
+                failure_threshold=settings.llm_breaker_failures,
+                reset_seconds=settings.llm_breaker_reset_seconds,
+            )
+        if settings.llm_batch_max_size > 1:
+            return BatchingLLMClient(
+                client,
+                window_seconds=settings.llm_batch_window_seconds,
+                max_batch_size=settings.llm_batch_max_size,
+            )
+        return client
     return StubLLMClient()
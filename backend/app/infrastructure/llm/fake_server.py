@@ -0,0 +1,164 @@
+"""Local stand-in for the Gemini ``generateContent`` API.
+
+Answers with canned but input-dependent JSON after a configurable delay
+(with an optional slow tail) and fails a configurable share of requests with
+503, so the real client can be
+tested and benchmarked without network access or an API key. Run it with
+``python -m app.infrastructure.llm.fake_server --port 8081`` and point
+``GEMINI_BASE_URL`` at it, or mount ``create_fake_gemini_app()`` in-process
+through ``httpx.ASGITransport``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+import json
+import random
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.infrastructure.llm.gemini import BATCH_EXTRACT_PROMPT, RECIPE_PROMPT
+
+
+@dataclass
+class FakeServerStats:
+    requests: int = 0
+    failures: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+
+def _reply_text(text: str) -> dict:
+    return {"candidates": [{"content": {"role": "model", "parts": [{"text": text}]}}]}
+
+
+def _reply(payload) -> dict:
+    return _reply_text(json.dumps(payload))
+
+
+def _extract(part: dict) -> list[dict]:
+    if "inline_data" in part:
+        return [{"name": "item", "confidence": 0.6}]
+    chunks = [chunk.strip() for chunk in part["text"].split(",")]
+    return [{"name": chunk.split(" ")[0], "quantity": None, "confidence": 0.7} for chunk in chunks if chunk]
+
+
+def _answer(parts: list[dict]) -> list[dict]:
+    if parts[0].get("text") == BATCH_EXTRACT_PROMPT:
+        # Inputs follow the prompt as ("Input n:", content) part pairs.
+        inputs = parts[2::2]
+        return [{"input": number, "items": _extract(part)} for number, part in enumerate(inputs, start=1)]
+    texts = [part["text"] for part in parts if "text" in part]
+    if texts and texts[0] == RECIPE_PROMPT:
+        names = [name.strip() for name in texts[-1].split("Ingredients:", 1)[-1].split(",") if name.strip()]
+        return [
+            {
+                "title": "Quick mix with " + ", ".join(names[:3]) if names else "Simple pantry salad",
+                "steps": ["Prepare the ingredients.", "Cook or mix as needed.", "Season and serve."],
+                "use_items": names[:3],
+                "missing_items": ["salt", "oil"],
+            },
+            *(
+                {
+                    "title": f"{name.capitalize()} soup",
+                    "steps": [f"Simmer the {name} in stock.", "Season and serve."],
+                    "use_items": [name],
+                    "missing_items": ["stock"],
+                }
+                for name in names[:2]
+            ),
+        ]
+    return [candidate for part in parts[1:] for candidate in _extract(part)]
+
+
+def create_fake_gemini_app(
+    *,
+    latency_seconds: float = 0.0,
+    error_rate: float = 0.0,
+    fail_first: int = 0,
+    slow_rate: float = 0.0,
+    slow_seconds: float = 0.0,
+    retry_after: int | None = None,
+    seed: int | None = None,
+) -> FastAPI:
+    app = FastAPI(title="Fake Gemini")
+    stats = FakeServerStats()
+    rng = random.Random(seed)
+    app.state.stats = stats
+
+    def overloaded() -> JSONResponse:
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+        return JSONResponse({"error": {"code": 503, "message": "overloaded"}}, status_code=503, headers=headers)
+
+    def latency() -> float:
+        # ``slow_rate`` of the requests take ``slow_seconds`` instead: a latency tail.
+        return slow_seconds if slow_rate and rng.random() < slow_rate else latency_seconds
+
+    @app.post("/v1beta/models/{model}:generateContent")
+    async def generate_content(model: str, request: Request):
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        try:
+            body = await request.json()
+            delay = latency()
+            if delay:
+                await asyncio.sleep(delay)
+            if stats.requests <= fail_first or rng.random() < error_rate:
+                stats.failures += 1
+                return overloaded()
+            return _reply(_answer(body["contents"][0]["parts"]))
+        finally:
+            stats.in_flight -= 1
+
+    @app.post("/v1beta/models/{model}:streamGenerateContent")
+    async def stream_generate_content(model: str, request: Request):
+        stats.requests += 1
+        body = await request.json()
+        if stats.requests <= fail_first or rng.random() < error_rate:
+            stats.failures += 1
+            return overloaded()
+        text = json.dumps(_answer(body["contents"][0]["parts"]))
+        chunks = [text[start : start + 48] for start in range(0, len(text), 48)]
+        delay = latency()
+
+        async def events():
+            # The whole latency is spread over the chunks, like token streaming.
+            for chunk in chunks:
+                if delay:
+                    await asyncio.sleep(delay / len(chunks))
+                yield f"data: {json.dumps(_reply_text(chunk))}\r\n\r\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="share of requests answered slowly")
+    parser.add_argument("--slow-seconds", type=float, default=0.0, help="latency of the slow requests")
+    args = parser.parse_args()
+    uvicorn.run(
+        create_fake_gemini_app(
+            latency_seconds=args.latency,
+            error_rate=args.error_rate,
+            slow_rate=args.slow_rate,
+            slow_seconds=args.slow_seconds,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+from datetime import date
+import json
+import mimetypes
+import random
+import time
+from typing import Any, AsyncIterator
+
+import httpx
+
+from app.application.errors import RequestRejectedError, ServiceUnavailableError
+from app.core.metrics import metrics
+from app.domain.entities import FileData, ItemCandidate, RecipeSuggestion
+from app.domain.recipe_prompt import estimate_tokens
+
+EXTRACT_PROMPT = (
+    "Extract the grocery items from the input. Reply with a JSON array of objects with keys "
+    "name, quantity (number or null), unit (string or null), expiry_date (YYYY-MM-DD or null), "
+    "storage_location (fridge, freezer, pantry or null) and confidence (0 to 1)."
+)
+BATCH_EXTRACT_PROMPT = (
+    "Each numbered input below is a separate receipt, note or photo. Extract the grocery items of every "
+    "input. Reply with a JSON array with one object per input, with keys input (its number) and items "
+    "(an array of objects with keys name, quantity, unit, expiry_date, storage_location and confidence, "
+    "as for a single input)."
+)
+RECIPE_PROMPT = (
+    "Suggest recipes using the listed ingredients. Reply with a JSON array of objects with keys "
+    "title, steps (array of strings), use_items (ingredients from the list) and missing_items."
+)
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+# Statuses that blame the input rather than the provider or its credentials.
+INPUT_REJECTED_STATUS = {400, 413, 422}
+# Upper bounds (estimated prompt tokens) of the per-size latency histograms.
+PROMPT_SIZE_BUCKETS = (256, 1024, 4096)
+
+
+class GeminiLLMClient:
+    """``LLMClient`` backed by the Gemini ``generateContent`` HTTP API.
+
+    One pooled ``httpx.AsyncClient`` is shared by every request in the
+    process and a semaphore caps in-flight calls. Timeouts, 429s and 5xx
+    responses are retried with full-jitter exponential backoff (or the
+    server's ``Retry-After``); when retries run out, or the server asks for a
+    wait longer than ``max_retry_after_seconds``, the call raises
+    ``ServiceUnavailableError`` rather than holding the request open.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: str,
+        model: str,
+        base_url: str,
+        timeout_seconds: float = 20.0,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        max_retry_after_seconds: float = 10.0,
+        http: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._api_key = api_key
+        prompts = (EXTRACT_PROMPT + BATCH_EXTRACT_PROMPT + RECIPE_PROMPT).encode()
+        self.version = f"{model}:{hashlib.sha256(prompts).hexdigest()[:12]}"
+        self._path = f"/v1beta/models/{model}:generateContent"
+        self._stream_path = f"/v1beta/models/{model}:streamGenerateContent"
+        self._http = http or httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(timeout_seconds),
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._backoff_seconds = backoff_seconds
+        self._max_retry_after = max_retry_after_seconds
+        self._latency = metrics.histogram("llm.request_seconds")
+        self._prompt_tokens = metrics.histogram("llm.prompt_tokens")
+        self._retries = metrics.counter("llm.retries")
+        self._failures = metrics.counter("llm.failures")
+
+    async def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]:
+        payload = await self._generate([{"text": EXTRACT_PROMPT}, {"text": text}])
+        return _to_candidates(payload, source="text")
+
+    async def extract_candidates_from_images(self, images: list[FileData]) -> list[ItemCandidate]:
+        parts: list[dict] = [{"text": EXTRACT_PROMPT}, *(_image_part(image) for image in images)]
+        payload = await self._generate(parts)
+        return _to_candidates(payload, source="image")
+
+    async def extract_candidates_batch(self, inputs: list[str | FileData]) -> list[list[ItemCandidate] | None]:
+        # One request for several independent inputs; results come back per input.
+        parts: list[dict] = [{"text": BATCH_EXTRACT_PROMPT}]
+        for number, item in enumerate(inputs, start=1):
+            parts.append({"text": f"Input {number}:"})
+            parts.append({"text": item} if isinstance(item, str) else _image_part(item))
+        payload = await self._generate(parts)
+        if not isinstance(payload, list):
+            raise ServiceUnavailableError("LLM reply was not a list")
+        # None marks an input the reply left out or garbled; that caller fails
+        # rather than getting an empty extraction.
+        results: list[list[ItemCandidate] | None] = [None] * len(inputs)
+        for entry in payload:
+            number = entry.get("input") if isinstance(entry, dict) else None
+            if isinstance(number, int) and 1 <= number <= len(inputs) and isinstance(entry.get("items"), list):
+                source = "text" if isinstance(inputs[number - 1], str) else "image"
+                results[number - 1] = _to_candidates(entry["items"], source=source)
+        return results
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        payload = await self._generate(_recipe_parts(items, prefer_expiring_first))
+        return _to_recipes(payload)
+
+    async def stream_recipes(self, items: list[str], prefer_expiring_first: bool) -> AsyncIterator[RecipeSuggestion]:
+        # Server-sent chunks carry fragments of the JSON array; each recipe is
+        # yielded as soon as its object closes. Retries only happen before the
+        # stream opens, never after a recipe has been handed out.
+        response = await self._send(_recipe_parts(items, prefer_expiring_first), stream=True)
+        scanner = JsonArrayScanner()
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                for entry in scanner.feed(_chunk_text(line[5:])):
+                    for recipe in _to_recipes([entry]):
+                        yield recipe
+        except httpx.TransportError as exc:
+            self._failures.inc()
+            raise ServiceUnavailableError("LLM stream interrupted") from exc
+        finally:
+            await response.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def _generate(self, parts: list[dict]) -> Any:
+        return _parse_response(await self._send(parts))
+
+    async def _send(self, parts: list[dict], *, stream: bool = False) -> httpx.Response:
+        body = {
+            "contents": [{"role": "user", "parts": parts}],
+            "generationConfig": {"responseMimeType": "application/json"},
+        }
+        request = self._http.build_request(
+            "POST",
+            self._stream_path if stream else self._path,
+            params={"alt": "sse"} if stream else None,
+            json=body,
+            headers={"x-goog-api-key": self._api_key},
+        )
+        # Text parts only; images are billed separately and not estimated.
+        tokens = sum(estimate_tokens(part["text"]) for part in parts if "text" in part)
+        self._prompt_tokens.observe(tokens)
+        by_size = metrics.histogram(f"llm.request_seconds.prompt_{_size_bucket(tokens)}")
+        for attempt in range(self._max_retries + 1):
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    started = time.perf_counter()
+                    response = await self._http.send(request, stream=stream)
+                    elapsed = time.perf_counter() - started
+                    self._latency.observe(elapsed)
+                    by_size.observe(elapsed)
+                if response.status_code < 400:
+                    return response
+                if stream:
+                    await response.aclose()
+                if response.status_code not in RETRYABLE_STATUS:
+                    self._failures.inc()
+                    error = (
+                        RequestRejectedError
+                        if response.status_code in INPUT_REJECTED_STATUS
+                        else ServiceUnavailableError
+                    )
+                    raise error(f"LLM request rejected with status {response.status_code}")
+                retry_after = _retry_after(response)
+            except httpx.TransportError:
+                pass
+            if attempt == self._max_retries:
+                break
+            if retry_after is not None and retry_after > self._max_retry_after:
+                self._failures.inc()
+                raise ServiceUnavailableError(f"LLM provider busy, retry after {retry_after:.0f}s")
+            self._retries.inc()
+            # Backoff happens outside the semaphore so waiting retries do not hold slots.
+            await asyncio.sleep(
+                retry_after if retry_after is not None else random.uniform(0, self._backoff_seconds * 2**attempt)
+            )
+        self._failures.inc()
+        raise ServiceUnavailableError("LLM provider unavailable, retry shortly")
+
+
+class JsonArrayScanner:
+    """Incrementally pulls complete objects out of a streamed JSON array.
+
+    ``feed`` takes the next text fragment and returns the top-level array
+    elements whose closing brace it contained; text outside the array and
+    elements that fail to parse are skipped.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._position = 0
+        self._depth = 0
+        self._start: int | None = None
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> list[Any]:
+        self._buffer += text
+        found = []
+        for index in range(self._position, len(self._buffer)):
+            char = self._buffer[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+                if self._depth == 2 and char == "{":
+                    self._start = index
+            elif char in "]}":
+                if self._depth == 2 and char == "}" and self._start is not None:
+                    try:
+                        found.append(json.loads(self._buffer[self._start : index + 1]))
+                    except ValueError:
+                        pass
+                    self._start = None
+                self._depth -= 1
+        # Keep only the element still being received.
+        if self._start is None:
+            self._buffer, self._position = "", 0
+        else:
+            self._buffer, self._position = self._buffer[self._start :], len(self._buffer) - self._start
+            self._start = 0
+        return found
+
+
+def _recipe_parts(items: list[str], prefer_expiring_first: bool) -> list[dict]:
+    order = "Ingredients are listed soonest-expiring first; prefer using them. " if prefer_expiring_first else ""
+    return [{"text": RECIPE_PROMPT}, {"text": order + "Ingredients: " + ", ".join(items)}]
+
+
+def _size_bucket(tokens: int) -> str:
+    for limit in PROMPT_SIZE_BUCKETS:
+        if tokens <= limit:
+            return f"le_{limit}"
+    return f"gt_{PROMPT_SIZE_BUCKETS[-1]}"
+
+
+def _chunk_text(data: str) -> str:
+    try:
+        parts = json.loads(data)["candidates"][0]["content"]["parts"]
+        return "".join(part.get("text", "") for part in parts)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return ""
+
+
+def _image_part(image: FileData) -> dict:
+    mime_type = mimetypes.guess_type(image.filename)[0] or "image/jpeg"
+    return {"inline_data": {"mime_type": mime_type, "data": base64.b64encode(image.content).decode()}}
+
+
+def _parse_response(response: httpx.Response) -> Any:
+    try:
+        text = response.json()["candidates"][0]["content"]["parts"][0]["text"]
+        return json.loads(text)
+    except (KeyError, IndexError, TypeError, ValueError) as exc:
+        raise ServiceUnavailableError("Malformed LLM response") from exc
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _optional_float(value: Any) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _optional_date(value: Any) -> date | None:
+    try:
+        return date.fromisoformat(value) if isinstance(value, str) else None
+    except ValueError:
+        return None
+
+
+def _optional_str(value: Any) -> str | None:
+    return value if isinstance(value, str) and value else None
+
+
+def _strings(value: Any) -> list[str]:
+    return [item for item in value if isinstance(item, str)] if isinstance(value, list) else []
+
+
+def _to_candidates(payload: Any, *, source: str) -> list[ItemCandidate]:
+    # A reply of the wrong shape is a failed extraction, not an empty one.
+    if not isinstance(payload, list):
+        raise ServiceUnavailableError("LLM reply was not a list")
+    return [
+        ItemCandidate(
+            name=entry["name"].strip(),
+            quantity=_optional_float(entry.get("quantity")),
+            unit=_optional_str(entry.get("unit")),
+            expiry_date=_optional_date(entry.get("expiry_date")),
+            storage_location=_optional_str(entry.get("storage_location")),
+            confidence=_optional_float(entry.get("confidence")),
+            source=source,
+        )
+        for entry in payload
+        if isinstance(entry, dict) and isinstance(entry.get("name"), str) and entry["name"].strip()
+    ]
+
+
+def _to_recipes(payload: Any) -> list[RecipeSuggestion]:
+    if not isinstance(payload, list):
+        return []
+    return [
+        RecipeSuggestion(
+            title=entry["title"],
+            steps=_strings(entry.get("steps")),
+            use_items=_strings(entry.get("use_items")),
+            missing_items=_strings(entry.get("missing_items")),
+        )
+        for entry in payload
+        if isinstance(entry, dict) and isinstance(entry.get("title"), str)
+    ]
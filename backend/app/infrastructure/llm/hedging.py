@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import time
+from typing import AsyncIterator, Awaitable, Callable, Protocol, TypeVar
+
+from app.application.errors import RequestRejectedError, ServiceUnavailableError
+from app.application.ports import LLMClient
+from app.core.metrics import Histogram, metrics
+from app.domain.entities import FileData, ItemCandidate, RecipeSuggestion
+from app.infrastructure.llm.batching import BatchExtractor
+
+T = TypeVar("T")
+R = TypeVar("R", ItemCandidate, RecipeSuggestion)
+
+# Successful calls seen before the latency percentile replaces ``max_delay_seconds``.
+WARM_SAMPLES = 20
+
+
+class HedgeableClient(LLMClient, BatchExtractor, Protocol):
+    pass
+
+
+class CircuitBreaker:
+    """Skips a provider after ``failure_threshold`` consecutive failures.
+
+    An open breaker rejects calls for ``reset_seconds``, then lets a single
+    trial call through: success closes it, failure opens it again. A call
+    cancelled before it finished (a hedge that lost) counts as neither.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial = False
+        self._opened = metrics.counter(f"llm.breaker.{name}.opened")
+        self._open = metrics.gauge(f"llm.breaker.{name}.open")
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self._trial else "open"
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if self._trial or self._clock() - self._opened_at < self._reset_seconds:
+            return False
+        self._trial = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+        self._open.set(0)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._trial or self._failures >= self._threshold:
+            if self._opened_at is None:
+                self._opened.inc()
+            self._opened_at = self._clock()
+            self._trial = False
+            self._open.set(1)
+
+    def release(self) -> None:
+        self._trial = False
+
+
+@dataclass(slots=True)
+class _Provider:
+    name: str
+    client: HedgeableClient
+    breaker: CircuitBreaker
+
+
+class HedgedLLMClient:
+    """Routes each call to the first healthy provider and hedges slow ones.
+
+    Providers are tried in order, skipping any whose circuit breaker is open.
+    If the chosen provider has not answered within its recent ``percentile``
+    latency for that kind of call (clamped to ``min_delay_seconds`` ..
+    ``max_delay_seconds``, and ``max_delay_seconds`` until it has
+    ``WARM_SAMPLES`` samples), the call is also sent to the next provider and
+    the first answer wins; the other call is cancelled. A failed call fails
+    over to the next provider at once; when every provider failed, the last
+    error is raised. A ``RequestRejectedError`` blames the input, so it is
+    raised as is, without failing over or counting against the breaker.
+    Hedges are counted in ``llm.hedge.sent`` and answers from a later
+    provider in ``llm.hedge.won``.
+
+    Answers from any provider but the first are marked ``provisional`` so
+    the caches keep only primary answers.
+    """
+
+    def __init__(
+        self,
+        providers: list[tuple[str, HedgeableClient]],
+        *,
+        percentile: float = 0.95,
+        min_delay_seconds: float = 0.5,
+        max_delay_seconds: float = 5.0,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not providers:
+            raise ValueError("at least one provider is required")
+        self.version = providers[0][1].version
+        self._providers = [
+            _Provider(
+                name,
+                client,
+                CircuitBreaker(name, failure_threshold=failure_threshold, reset_seconds=reset_seconds, clock=clock),
+            )
+            for name, client in providers
+        ]
+        self._percentile = percentile
+        self._min_delay = min_delay_seconds
+        self._max_delay = max_delay_seconds
+        self._latency: dict[tuple[str, str], Histogram] = {}
+        self._hedges = metrics.counter("llm.hedge.sent")
+        self._won = metrics.counter("llm.hedge.won")
+        self._skipped = metrics.counter("llm.hedge.skipped_open")
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        return next(provider.breaker for provider in self._providers if provider.name == name)
+
+    async def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]:
+        primary, candidates = await self._call("text", lambda client: client.extract_candidates_from_text(text))
+        return _marked(candidates, primary)
+
+    async def extract_candidates_from_images(self, images: list[FileData]) -> list[ItemCandidate]:
+        primary, candidates = await self._call(
+            "images", lambda client: client.extract_candidates_from_images(images)
+        )
+        return _marked(candidates, primary)
+
+    async def extract_candidates_batch(self, inputs: list[str | FileData]) -> list[list[ItemCandidate] | None]:
+        primary, results = await self._call("batch", lambda client: client.extract_candidates_batch(inputs))
+        return [None if candidates is None else _marked(candidates, primary) for candidates in results]
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        primary, recipes = await self._call(
+            "recipes", lambda client: client.suggest_recipes(items, prefer_expiring_first)
+        )
+        return _marked(recipes, primary)
+
+    async def stream_recipes(self, items: list[str], prefer_expiring_first: bool) -> AsyncIterator[RecipeSuggestion]:
+        # Streams race to their first recipe; the rest comes from the winner.
+        primary, (stream, first) = await self._call(
+            "stream", lambda client: _first(client.stream_recipes(items, prefer_expiring_first))
+        )
+        try:
+            if first is None:
+                return
+            yield _marked([first], primary)[0]
+            async for recipe in stream:
+                yield _marked([recipe], primary)[0]
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(provider.client.aclose() for provider in self._providers))
+
+    def _delay(self, provider: _Provider, operation: str) -> float:
+        latency = self._latency.get((provider.name, operation))
+        if latency is None or latency.count < WARM_SAMPLES:
+            return self._max_delay
+        return min(self._max_delay, max(self._min_delay, latency.percentile(self._percentile) or 0.0))
+
+    def _observe(self, provider: _Provider, operation: str, seconds: float) -> None:
+        key = (provider.name, operation)
+        if key not in self._latency:
+            self._latency[key] = Histogram(f"{provider.name}.{operation}", window=256)
+        self._latency[key].observe(seconds)
+
+    async def _call(self, operation: str, fn: Callable[[HedgeableClient], Awaitable[T]]) -> tuple[bool, T]:
+        """Returns whether the first provider answered, and its answer."""
+        remaining = iter(self._providers)
+        # task -> (provider, start time, whether it holds the breaker's trial call)
+        running: dict[asyncio.Task, tuple[_Provider, float, bool]] = {}
+
+        def launch() -> _Provider | None:
+            for provider in remaining:
+                trial = provider.breaker.state == "open"
+                if provider.breaker.allow():
+                    task = asyncio.ensure_future(fn(provider.client))
+                    task.add_done_callback(_retrieve)
+                    running[task] = (provider, time.perf_counter(), trial)
+                    return provider
+                self._skipped.inc()
+            return None
+
+        first = launch()
+        if first is None:
+            raise ServiceUnavailableError("No LLM provider available")
+        delay: float | None = self._delay(first, operation)
+        last_error: BaseException | None = None
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # Slower than usual: race the next provider against it.
+                    if launch() is None:
+                        delay = None
+                    else:
+                        self._hedges.inc()
+                    continue
+                for task in done:
+                    provider, started, trial = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        provider.breaker.record_success()
+                        self._observe(provider, operation, time.perf_counter() - started)
+                        if provider is not first:
+                            self._won.inc()
+                        return provider is self._providers[0], task.result()
+                    if isinstance(error, RequestRejectedError):
+                        # One caller's bad input says nothing about the provider.
+                        if trial:
+                            provider.breaker.release()
+                        raise error
+                    provider.breaker.record_failure()
+                    last_error = error
+                if not running:
+                    launch()
+        finally:
+            for task, (provider, started, trial) in running.items():
+                # The loser took at least this long; keeps its percentile honest.
+                self._observe(provider, operation, time.perf_counter() - started)
+                if trial:
+                    provider.breaker.release()
+                task.cancel()
+        if last_error is None:
+            raise ServiceUnavailableError("No LLM provider available")
+        raise last_error
+
+
+def _marked(results: list[R], primary: bool) -> list[R]:
+    if not primary:
+        for result in results:
+            result.provisional = True
+    return results
+
+
+def _retrieve(task: asyncio.Task) -> None:
+    # Losers may still fail after the race is decided; nobody awaits them.
+    if not task.cancelled():
+        task.exception()
+
+
+async def _first(stream: AsyncIterator[T]) -> tuple[AsyncIterator[T], T | None]:
+    try:
+        return stream, await anext(stream)
+    except StopAsyncIteration:
+        return stream, None
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+from typing import AsyncIterator, Protocol
+
+from app.application.ports import LLMClient
+from app.core.metrics import metrics
+from app.domain.entities import FileData, ItemCandidate, RecipeSuggestion
+from app.infrastructure.recipes.engine import RecipeIndex
+
+
+class ClosableLLMClient(LLMClient, Protocol):
+    async def aclose(self) -> None: ...
+
+
+class LocalRecipeClient:
+    """Answers recipe suggestions from a local :class:`RecipeIndex`.
+
+    In ``"local"`` mode suggestions come straight from the index and the LLM
+    is only used for extraction. In ``"prefilter"`` mode the index picks the
+    items its best recipes use, and only those are sent to the LLM. Either
+    way, a fridge with nothing in the corpus is passed to the inner client
+    unchanged. Ranking time is recorded in ``recipes.local.seconds``.
+    """
+
+    def __init__(self, inner: ClosableLLMClient, index: RecipeIndex, *, mode: str = "local", limit: int = 5) -> None:
+        if mode not in ("local", "prefilter"):
+            raise ValueError(f"unknown recipe engine mode: {mode}")
+        self.version = inner.version
+        self._inner = inner
+        self._index = index
+        self._mode = mode
+        self._limit = limit
+        self._seconds = metrics.histogram("recipes.local.seconds")
+
+    async def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]:
+        return await self._inner.extract_candidates_from_text(text)
+
+    async def extract_candidates_from_images(self, images: list[FileData]) -> list[ItemCandidate]:
+        return await self._inner.extract_candidates_from_images(images)
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        recipes = self._rank(items, prefer_expiring_first)
+        if self._mode == "local" and recipes:
+            return recipes
+        return await self._inner.suggest_recipes(self._shortlist(items, recipes), prefer_expiring_first)
+
+    async def stream_recipes(self, items: list[str], prefer_expiring_first: bool) -> AsyncIterator[RecipeSuggestion]:
+        recipes = self._rank(items, prefer_expiring_first)
+        if self._mode == "local" and recipes:
+            for recipe in recipes:
+                yield recipe
+            return
+        async for recipe in self._inner.stream_recipes(self._shortlist(items, recipes), prefer_expiring_first):
+            yield recipe
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+    def _rank(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        started = time.perf_counter()
+        recipes = self._index.rank(items, prefer_expiring_first, self._limit)
+        self._seconds.observe(time.perf_counter() - started)
+        return recipes
+
+    @staticmethod
+    def _shortlist(items: list[str], recipes: list[RecipeSuggestion]) -> list[str]:
+        # Keeps the caller's order, so the most urgent items still lead the prompt.
+        used = {item for recipe in recipes for item in recipe.use_items}
+        return [item for item in items if item in used] or items
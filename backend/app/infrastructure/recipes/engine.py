@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import orjson
+
+from app.domain.entities import RecipeSuggestion
+from app.domain.policies import normalize_extraction_text
+
+CORPUS_PATH = Path(__file__).with_name("corpus.json")
+
+# Substring matches shorter than this are too ambiguous ("파" is in "파프리카").
+_MIN_SUBSTRING = 2
+# Item names are free text; the memo of resolved names is reset past this size.
+_MAX_MATCHES = 50_000
+
+
+@dataclass(slots=True)
+class Recipe:
+    title: str
+    ingredients: list[str]
+    steps: list[str]
+
+
+def _normalize(name: str) -> str:
+    return normalize_extraction_text(name).casefold()
+
+
+class RecipeIndex:
+    """Inverted index from ingredient to the recipes that use it.
+
+    Postings are sorted ``int32`` arrays of recipe ids, so scoring a fridge
+    touches only the recipes sharing an ingredient with it: every matched
+    item adds its weight to its posting list in one vectorized step. Item
+    names are matched to ingredients through the corpus aliases (English and
+    Korean), then by token, then by the longest alias contained in the name.
+    """
+
+    def __init__(self, recipes: list[Recipe], aliases: dict[str, list[str]] | None = None) -> None:
+        self._recipes = recipes
+        self._names: list[str] = []
+        self._ids: dict[str, int] = {}
+        recipe_ingredients: list[np.ndarray] = []
+        for recipe in recipes:
+            ids = list(dict.fromkeys(self._intern(ingredient) for ingredient in recipe.ingredients))
+            recipe_ingredients.append(np.array(ids, dtype=np.int32))
+        self._recipe_ingredients = recipe_ingredients
+        self._sizes = np.array([len(ids) for ids in recipe_ingredients], dtype=np.int32)
+
+        postings: list[list[int]] = [[] for _ in self._names]
+        for recipe_id, ids in enumerate(recipe_ingredients):
+            for ingredient_id in ids:
+                postings[ingredient_id].append(recipe_id)
+        self._postings = [np.array(ids, dtype=np.int32) for ids in postings]
+
+        self._lookup: dict[str, int] = {_normalize(name): ingredient_id for name, ingredient_id in self._ids.items()}
+        for canonical, names in (aliases or {}).items():
+            ingredient_id = self._ids.get(_normalize(canonical))
+            if ingredient_id is None:
+                continue
+            for name in names:
+                self._lookup.setdefault(_normalize(name), ingredient_id)
+        # Longest first, so "파프리카" wins over "파" and "배추김치" over "김치".
+        self._substrings = sorted(
+            (key for key in self._lookup if len(key) >= _MIN_SUBSTRING), key=len, reverse=True
+        )
+        self._matches: dict[str, int | None] = {}
+
+    @classmethod
+    def from_file(cls, path: Path = CORPUS_PATH) -> RecipeIndex:
+        data = orjson.loads(path.read_bytes())
+        recipes = [Recipe(title=r["title"], ingredients=r["ingredients"], steps=r["steps"]) for r in data["recipes"]]
+        return cls(recipes, data.get("aliases"))
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def match(self, item_name: str) -> int | None:
+        key = _normalize(item_name)
+        if key not in self._matches:
+            if len(self._matches) >= _MAX_MATCHES:
+                self._matches.clear()
+            self._matches[key] = self._match(key)
+        return self._matches[key]
+
+    def _match(self, key: str) -> int | None:
+        if key in self._lookup:
+            return self._lookup[key]
+        for token in key.split():
+            if token in self._lookup:
+                return self._lookup[token]
+        for alias in self._substrings:
+            if alias in key:
+                return self._lookup[alias]
+        return None
+
+    def rank(self, items: list[str], prefer_expiring_first: bool, limit: int) -> list[RecipeSuggestion]:
+        """Best ``limit`` recipes for ``items``, given in the order callers rank them.
+
+        A recipe scores the summed weight of the items it uses, minus half a
+        point per ingredient the fridge lacks. With ``prefer_expiring_first``
+        the first item weighs 2 and later ones decay towards 1, so among
+        recipes using as many items, the one using the soonest-expiring wins.
+        """
+        matched: dict[int, str] = {}
+        for item in items:
+            ingredient_id = self.match(item)
+            if ingredient_id is not None and ingredient_id not in matched:
+                matched[ingredient_id] = item
+        if not matched or limit <= 0:
+            return []
+
+        weights = np.zeros(len(self._recipes), dtype=np.float32)
+        hits = np.zeros(len(self._recipes), dtype=np.int32)
+        for rank, ingredient_id in enumerate(matched):
+            postings = self._postings[ingredient_id]
+            weight = 1.0 + 1.0 / (1 + rank) if prefer_expiring_first else 1.0
+            weights[postings] += weight
+            hits[postings] += 1
+        scores = weights - 0.5 * (self._sizes - hits)
+
+        candidates = np.flatnonzero(hits)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        # Equal scores keep corpus order, so the same fridge gets the same list.
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [self._suggestion(int(recipe_id), matched) for recipe_id in order]
+
+    def _suggestion(self, recipe_id: int, matched: dict[int, str]) -> RecipeSuggestion:
+        recipe = self._recipes[recipe_id]
+        ingredient_ids = self._recipe_ingredients[recipe_id]
+        return RecipeSuggestion(
+            title=recipe.title,
+            steps=list(recipe.steps),
+            use_items=[matched[int(i)] for i in ingredient_ids if int(i) in matched],
+            missing_items=[self._names[i] for i in ingredient_ids if int(i) not in matched],
+        )
+
+    def _intern(self, ingredient: str) -> int:
+        name = _normalize(ingredient)
+        if name not in self._ids:
+            self._ids[name] = len(self._names)
+            self._names.append(name)
+        return self._ids[name]
@@ -0,0 +1,114 @@
+from datetime import date, datetime
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.extraction_cache import ExtractionCache as ExtractionCacheModel
+from app.domain.entities import ItemCandidate
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.repositories.unit_of_work import after_commit
+
+
+def _to_row(candidate: ItemCandidate) -> dict:
+    return {
+        "name": candidate.name,
+        "quantity": candidate.quantity,
+        "unit": candidate.unit,
+        "expiry_date": candidate.expiry_date.isoformat() if candidate.expiry_date else None,
+        "storage_location": candidate.storage_location,
+        "confidence": candidate.confidence,
+        "source": candidate.source,
+        "category": candidate.category,
+    }
+
+
+def _to_domain(row: dict) -> ItemCandidate:
+    expiry_date = row.get("expiry_date")
+    return ItemCandidate(
+        name=row["name"],
+        quantity=row.get("quantity"),
+        unit=row.get("unit"),
+        expiry_date=date.fromisoformat(expiry_date) if expiry_date else None,
+        storage_location=row.get("storage_location"),
+        confidence=row.get("confidence"),
+        source=row.get("source", "text"),
+        category=row.get("category"),
+    )
+
+
+class SqlExtractionCacheRepository:
+    """Extraction results by content key, in ``extraction_cache`` behind an LRU.
+
+    Keys already cover the content and the extractor version, so entries
+    never go stale; rows from retired versions or past the retention period
+    are removed by ``prune_batch``.
+    """
+
+    def __init__(self, db: AsyncSession, lru: TTLCache[str, list[ItemCandidate]] | None = None) -> None:
+        self._db = db
+        self._lru = lru
+
+    async def get_many(self, keys: list[str]) -> dict[str, list[ItemCandidate]]:
+        found: dict[str, list[ItemCandidate]] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            cached = self._lru.get(key) if self._lru is not None else None
+            if cached is None:
+                missing.append(key)
+            else:
+                found[key] = cached
+        if missing:
+            result = await self._db.execute(
+                select(ExtractionCacheModel.key, ExtractionCacheModel.candidates).where(
+                    ExtractionCacheModel.key.in_(missing)
+                )
+            )
+            for key, rows in result.all():
+                found[key] = [_to_domain(row) for row in rows]
+                if self._lru is not None:
+                    self._lru.set(key, found[key])
+        return found
+
+    async def put_many(self, model_version: str, entries: dict[str, list[ItemCandidate]]) -> None:
+        if not entries:
+            return
+        await self._db.execute(
+            insert(ExtractionCacheModel)
+            .values(
+                [
+                    {
+                        "key": key,
+                        "model_version": model_version,
+                        "candidates": [_to_row(candidate) for candidate in candidates],
+                    }
+                    for key, candidates in entries.items()
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[ExtractionCacheModel.key])
+        )
+        if self._lru is not None:
+            after_commit(self._db, lambda: [self._lru.set(key, value) for key, value in entries.items()])
+
+    async def prune_batch(self, model_version: str, cutoff: datetime, limit: int) -> int:
+        # Spelled as two ranges rather than ``!=`` so both halves, and the
+        # retention check, can each use an index.
+        candidates = await self._db.execute(
+            select(ExtractionCacheModel.key)
+            .where(
+                or_(
+                    ExtractionCacheModel.model_version < model_version,
+                    ExtractionCacheModel.model_version > model_version,
+                    ExtractionCacheModel.created_at < cutoff,
+                )
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        keys = list(candidates.scalars().all())
+        if not keys:
+            return 0
+        await self._db.execute(delete(ExtractionCacheModel).where(ExtractionCacheModel.key.in_(keys)))
+        if self._lru is not None:
+            after_commit(self._db, lambda: [self._lru.pop(key) for key in keys])
+        return len(keys)
@@ -1,11 +1,18 @@
 import uuid
+from datetime import date, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.fridge import Fridge as FridgeModel
+from app.db.models.fridge_item import FridgeItem as FridgeItemModel
 from app.db.models.fridge_member import FridgeMember as FridgeMemberModel
-from app.domain.entities import Fridge, FridgeMember
+from app.db.models.user import User as UserModel
+from app.domain.entities import Fridge, FridgeMember, FridgeSummary
+from app.infrastructure.cache_bus import InvalidationBus
+from app.infrastructure.repositories.loader import BatchLoader, session_lock
+from app.infrastructure.repositories.membership_cache import MembershipCache
+from app.infrastructure.repositories.unit_of_work import after_commit
 
 
 def _to_domain(model: FridgeModel) -> Fridge:
@@ -17,51 +24,193 @@ def _to_domain(model: FridgeModel) -> Fridge:
     )
 
 
+# FridgeMember field order, for building members straight from rows.
+_MEMBER_COLUMNS = (
+    FridgeMemberModel.id,
+    FridgeMemberModel.fridge_id,
+    FridgeMemberModel.user_id,
+    FridgeMemberModel.role,
+    FridgeMemberModel.created_at,
+)
+
+
 class SqlFridgeRepository:
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        membership_cache: MembershipCache | None = None,
+        invalidation_bus: InvalidationBus | None = None,
+    ) -> None:
         self._db = db
+        self._membership_cache = membership_cache
+        self._invalidation_bus = invalidation_bus
+        lock = session_lock(db)
+        self._fridges: BatchLoader[uuid.UUID, Fridge | None] = BatchLoader(self._load_fridges, lock=lock)
+        self._memberships: BatchLoader[tuple[uuid.UUID, uuid.UUID], bool] = BatchLoader(
+            self._load_memberships, default=False, lock=lock
+        )
+        self._members: BatchLoader[uuid.UUID, list[FridgeMember]] = BatchLoader(
+            self._load_members, default=[], lock=lock
+        )
 
     async def get_by_id(self, fridge_id: uuid.UUID) -> Fridge | None:
-        result = await self._db.execute(select(FridgeModel).where(FridgeModel.id == fridge_id))
-        model = result.scalar_one_or_none()
-        return _to_domain(model) if model else None
+        return await self._fridges.load(fridge_id)
 
     async def create(self, name: str, owner_user_id: uuid.UUID) -> Fridge:
-        model = FridgeModel(name=name, owner_user_id=owner_user_id)
-        self._db.add(model)
-        await self._db.commit()
-        await self._db.refresh(model)
-        member = FridgeMemberModel(fridge_id=model.id, user_id=owner_user_id, role="owner")
-        self._db.add(member)
-        await self._db.commit()
-        return _to_domain(model)
+        result = await self._db.execute(
+            insert(FridgeModel).values(name=name, owner_user_id=owner_user_id).returning(FridgeModel)
+        )
+        fridge = _to_domain(result.scalar_one())
+        await self._db.execute(
+            insert(FridgeMemberModel).values(fridge_id=fridge.id, user_id=owner_user_id, role="owner")
+        )
+        await self._publish_membership(fridge.id, owner_user_id)
+        self._fridges.prime(fridge.id, fridge)
+        self._memberships.prime((fridge.id, owner_user_id), True)
+        after_commit(self._db, lambda: self._invalidate_membership(fridge.id, owner_user_id))
+        return fridge
 
     async def list_members(self, fridge_id: uuid.UUID) -> list[FridgeMember]:
+        return list(await self._members.load(fridge_id))
+
+    async def add_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID, role: str) -> None:
+        await self._db.execute(insert(FridgeMemberModel).values(fridge_id=fridge_id, user_id=user_id, role=role))
+        await self._publish_membership(fridge_id, user_id)
+        self._memberships.prime((fridge_id, user_id), True)
+        self._members.clear(fridge_id)
+        after_commit(self._db, lambda: self._invalidate_membership(fridge_id, user_id))
+
+    async def is_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        if self._membership_cache is None:
+            return await self._memberships.load((fridge_id, user_id))
+        return await self._membership_cache.is_member(
+            fridge_id,
+            user_id,
+            load_pair=lambda fid, uid: self._memberships.load((fid, uid)),
+            load_user_fridges=self._user_fridge_ids,
+        )
+
+    async def reserve_item_slots(self, fridge_id: uuid.UUID, count: int, limit: int) -> bool:
+        # Counter checks are a single guarded UPDATE: the row only changes when
+        # the quota still has room, so concurrent writers cannot overshoot it.
         result = await self._db.execute(
-            select(FridgeMemberModel).where(FridgeMemberModel.fridge_id == fridge_id)
+            update(FridgeModel)
+            .where(FridgeModel.id == fridge_id, FridgeModel.item_count + count <= limit)
+            .values(item_count=FridgeModel.item_count + count)
+            .returning(FridgeModel.item_count)
+            .execution_options(synchronize_session=False)
         )
-        members = result.scalars().all()
-        return [
-            FridgeMember(
-                id=member.id,
-                fridge_id=member.fridge_id,
-                user_id=member.user_id,
-                role=member.role,
-                created_at=member.created_at,
+        return result.scalar_one_or_none() is not None
+
+    async def reserve_membership(self, user_id: uuid.UUID, limit: int) -> bool:
+        result = await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id, UserModel.membership_count < limit)
+            .values(membership_count=UserModel.membership_count + 1)
+            .returning(UserModel.membership_count)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def reserve_owned_fridge(self, user_id: uuid.UUID, limit: int) -> bool:
+        result = await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id, UserModel.owned_fridge_count < limit)
+            .values(owned_fridge_count=UserModel.owned_fridge_count + 1)
+            .returning(UserModel.owned_fridge_count)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none() is not None
+
+    def _invalidate_membership(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        if self._membership_cache is not None:
+            self._membership_cache.invalidate(fridge_id, user_id)
+
+    async def _publish_membership(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        # Sent inside the write transaction; other replicas see it on commit.
+        if self._invalidation_bus is not None:
+            await self._invalidation_bus.publish(self._db, "membership", f"{fridge_id}:{user_id}")
+
+    async def _user_fridge_ids(self, user_id: uuid.UUID) -> list[uuid.UUID]:
+        result = await self._db.execute(
+            select(FridgeMemberModel.fridge_id).where(FridgeMemberModel.user_id == user_id)
+        )
+        return list(result.scalars().all())
+
+    async def _load_fridges(self, fridge_ids: list[uuid.UUID]) -> dict[uuid.UUID, Fridge]:
+        result = await self._db.execute(select(FridgeModel).where(FridgeModel.id.in_(fridge_ids)))
+        return {model.id: _to_domain(model) for model in result.scalars().all()}
+
+    async def _load_memberships(
+        self, keys: list[tuple[uuid.UUID, uuid.UUID]]
+    ) -> dict[tuple[uuid.UUID, uuid.UUID], bool]:
+        result = await self._db.execute(
+            select(FridgeMemberModel.fridge_id, FridgeMemberModel.user_id).where(
+                tuple_(FridgeMemberModel.fridge_id, FridgeMemberModel.user_id).in_(keys)
             )
-            for member in members
-        ]
+        )
+        return {(row[0], row[1]): True for row in result.all()}
 
-    async def add_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID, role: str) -> None:
-        member = FridgeMemberModel(fridge_id=fridge_id, user_id=user_id, role=role)
-        self._db.add(member)
-        await self._db.commit()
+    async def _load_members(self, fridge_ids: list[uuid.UUID]) -> dict[uuid.UUID, list[FridgeMember]]:
+        result = await self._db.execute(
+            select(*_MEMBER_COLUMNS).where(FridgeMemberModel.fridge_id.in_(fridge_ids))
+        )
+        members: dict[uuid.UUID, list[FridgeMember]] = {}
+        for row in result.all():
+            members.setdefault(row.fridge_id, []).append(FridgeMember(*row))
+        return members
 
-    async def is_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    async def list_for_user(self, user_id: uuid.UUID, expiring_days: int) -> list[FridgeSummary]:
+        # One round trip: the user's memberships drive per-fridge aggregates
+        # that are joined back, instead of counting members/items per fridge.
+        cutoff = date.today() + timedelta(days=expiring_days)
+        mine = (
+            select(FridgeMemberModel.fridge_id, FridgeMemberModel.role)
+            .where(FridgeMemberModel.user_id == user_id)
+            .cte("mine")
+        )
+        member_counts = (
+            select(FridgeMemberModel.fridge_id, func.count().label("member_count"))
+            .join(mine, mine.c.fridge_id == FridgeMemberModel.fridge_id)
+            .group_by(FridgeMemberModel.fridge_id)
+            .subquery("member_counts")
+        )
+        item_counts = (
+            select(
+                FridgeItemModel.fridge_id,
+                func.count().label("item_count"),
+                func.count().filter(FridgeItemModel.expiry_date <= cutoff).label("expiring_count"),
+            )
+            .join(mine, mine.c.fridge_id == FridgeItemModel.fridge_id)
+            .group_by(FridgeItemModel.fridge_id)
+            .subquery("item_counts")
+        )
         result = await self._db.execute(
-            select(FridgeMemberModel.id).where(
-                FridgeMemberModel.fridge_id == fridge_id,
-                FridgeMemberModel.user_id == user_id,
+            select(
+                FridgeModel.id,
+                FridgeModel.name,
+                FridgeModel.owner_user_id,
+                mine.c.role,
+                func.coalesce(member_counts.c.member_count, 0),
+                func.coalesce(item_counts.c.item_count, 0),
+                func.coalesce(item_counts.c.expiring_count, 0),
+                FridgeModel.created_at,
             )
+            .join(mine, mine.c.fridge_id == FridgeModel.id)
+            .outerjoin(member_counts, member_counts.c.fridge_id == FridgeModel.id)
+            .outerjoin(item_counts, item_counts.c.fridge_id == FridgeModel.id)
+            .order_by(FridgeModel.created_at)
         )
-        return result.scalar_one_or_none() is not None
+        return [
+            FridgeSummary(
+                id=row[0],
+                name=row[1],
+                owner_user_id=row[2],
+                role=row[3],
+                member_count=row[4],
+                item_count=row[5],
+                expiring_count=row[6],
+                created_at=row[7],
+            )
+            for row in result.all()
+        ]
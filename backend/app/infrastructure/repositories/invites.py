@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.invite_code import InviteCode as InviteCodeModel
@@ -32,18 +32,19 @@ class SqlInviteRepository:
         created_by: uuid.UUID,
         max_uses: int,
     ) -> InviteCode:
-        model = InviteCodeModel(
-            fridge_id=fridge_id,
-            code=code,
-            expires_at=expires_at,
-            created_by=created_by,
-            max_uses=max_uses,
-            used_count=0,
+        result = await self._db.execute(
+            insert(InviteCodeModel)
+            .values(
+                fridge_id=fridge_id,
+                code=code,
+                expires_at=expires_at,
+                created_by=created_by,
+                max_uses=max_uses,
+                used_count=0,
+            )
+            .returning(InviteCodeModel)
         )
-        self._db.add(model)
-        await self._db.commit()
-        await self._db.refresh(model)
-        return _to_domain(model)
+        return _to_domain(result.scalar_one())
 
     async def get_by_code(self, code: str) -> InviteCode | None:
         result = await self._db.execute(select(InviteCodeModel).where(InviteCodeModel.code == code))
@@ -51,9 +52,9 @@ class SqlInviteRepository:
         return _to_domain(model) if model else None
 
     async def increment_used(self, invite_id: uuid.UUID) -> None:
-        result = await self._db.execute(select(InviteCodeModel).where(InviteCodeModel.id == invite_id))
-        model = result.scalar_one_or_none()
-        if not model:
-            return
-        model.used_count += 1
-        await self._db.commit()
+        await self._db.execute(
+            update(InviteCodeModel)
+            .where(InviteCodeModel.id == invite_id)
+            .values(used_count=InviteCodeModel.used_count + 1)
+            .execution_options(synchronize_session=False)
+        )
@@ -1,90 +1,185 @@
+from collections import Counter
 import uuid
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import delete, exists, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.models.fridge import Fridge as FridgeModel
 from app.db.models.fridge_item import FridgeItem as FridgeItemModel
-from app.domain.entities import FridgeItem
-
-
-def _to_domain(model: FridgeItemModel) -> FridgeItem:
-    return FridgeItem(
-        id=model.id,
-        fridge_id=model.fridge_id,
-        name=model.name,
-        category=model.category,
-        quantity=model.quantity,
-        unit=model.unit,
-        purchase_date=model.purchase_date,
-        expiry_date=model.expiry_date,
-        storage_location=model.storage_location,
-        status=model.status,
-        notes=model.notes,
-        created_at=model.created_at,
-        updated_at=model.updated_at,
-    )
+from app.db.models.fridge_item_archive import FridgeItemArchive as FridgeItemArchiveModel
+from app.db.models.item_image import ItemImage as ItemImageModel
+from app.db.models.notification import Notification as NotificationModel
+from app.domain.entities import ArchivedItem, FridgeItem
+from app.infrastructure.repositories.recipe_cache import SqlRecipeCacheRepository
+
+# Field order of FridgeItem (and, plus archived_at, ArchivedItem), so rows
+# selected with these columns build entities positionally.
+_ITEM_FIELDS = (
+    "id",
+    "fridge_id",
+    "name",
+    "category",
+    "quantity",
+    "unit",
+    "purchase_date",
+    "expiry_date",
+    "storage_location",
+    "status",
+    "notes",
+    "created_at",
+    "updated_at",
+)
+_ITEM_COLUMNS = tuple(FridgeItemModel.__table__.c[name] for name in _ITEM_FIELDS)
+_ARCHIVED_ITEM_COLUMNS = (
+    *(FridgeItemArchiveModel.__table__.c[name] for name in _ITEM_FIELDS),
+    FridgeItemArchiveModel.__table__.c.archived_at,
+)
+
+
+def _to_domain(row) -> FridgeItem:
+    # Rows are plain column tuples; no ORM instances or identity map involved.
+    return FridgeItem(*row)
 
 
 class SqlItemRepository:
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        recipe_cache: SqlRecipeCacheRepository | None = None,
+    ) -> None:
         self._db = db
+        self._recipe_cache = recipe_cache
 
     async def create_items(self, fridge_id: uuid.UUID, items: list[dict]) -> list[FridgeItem]:
-        models: list[FridgeItemModel] = []
-        for item in items:
-            model = FridgeItemModel(fridge_id=fridge_id, **item)
-            self._db.add(model)
-            models.append(model)
-        await self._db.commit()
-        for model in models:
-            await self._db.refresh(model)
-        return [_to_domain(model) for model in models]
+        if not items:
+            return []
+        # Ids are assigned here so the RETURNING rows can be put back in input order.
+        rows = [{**item, "id": uuid.uuid4(), "fridge_id": fridge_id} for item in items]
+        result = await self._db.execute(insert(FridgeItemModel).values(rows).returning(*_ITEM_COLUMNS))
+        created = {row.id: row for row in result.all()}
+        await self._invalidate_recipes(fridge_id)
+        return [_to_domain(created[row["id"]]) for row in rows]
 
     async def list_items(self, fridge_id: uuid.UUID) -> list[FridgeItem]:
-        result = await self._db.execute(select(FridgeItemModel).where(FridgeItemModel.fridge_id == fridge_id))
-        return [_to_domain(model) for model in result.scalars().all()]
+        result = await self._db.execute(select(*_ITEM_COLUMNS).where(FridgeItemModel.fridge_id == fridge_id))
+        return [_to_domain(row) for row in result.all()]
 
     async def get_by_id(self, item_id: uuid.UUID) -> FridgeItem | None:
-        result = await self._db.execute(select(FridgeItemModel).where(FridgeItemModel.id == item_id))
-        model = result.scalar_one_or_none()
-        return _to_domain(model) if model else None
+        result = await self._db.execute(select(*_ITEM_COLUMNS).where(FridgeItemModel.id == item_id))
+        row = result.one_or_none()
+        return _to_domain(row) if row else None
 
     async def update_item(self, item_id: uuid.UUID, updates: dict) -> FridgeItem | None:
-        result = await self._db.execute(select(FridgeItemModel).where(FridgeItemModel.id == item_id))
-        model = result.scalar_one_or_none()
-        if not model:
+        if not updates:
+            return await self.get_by_id(item_id)
+        result = await self._db.execute(
+            update(FridgeItemModel)
+            .where(FridgeItemModel.id == item_id)
+            .values(**updates)
+            .returning(*_ITEM_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        if row is None:
             return None
-        for key, value in updates.items():
-            setattr(model, key, value)
-        await self._db.commit()
-        await self._db.refresh(model)
-        return _to_domain(model)
+        await self._invalidate_recipes(row.fridge_id)
+        return _to_domain(row)
 
     async def delete_item(self, item_id: uuid.UUID) -> bool:
-        result = await self._db.execute(select(FridgeItemModel).where(FridgeItemModel.id == item_id))
-        model = result.scalar_one_or_none()
-        if not model:
+        result = await self._db.execute(
+            delete(FridgeItemModel)
+            .where(FridgeItemModel.id == item_id)
+            .returning(FridgeItemModel.fridge_id)
+            .execution_options(synchronize_session=False)
+        )
+        fridge_id = result.scalar_one_or_none()
+        if fridge_id is None:
             return False
-        await self._db.delete(model)
-        await self._db.commit()
+        await self._release_item_slots(Counter({fridge_id: 1}))
+        await self._invalidate_recipes(fridge_id)
         return True
 
     async def list_expiring(self, fridge_id: uuid.UUID, days: int) -> list[FridgeItem]:
         cutoff = date.today() + timedelta(days=days)
         result = await self._db.execute(
-            select(FridgeItemModel)
+            select(*_ITEM_COLUMNS)
             .where(FridgeItemModel.fridge_id == fridge_id)
             .where(FridgeItemModel.expiry_date.is_not(None))
             .where(FridgeItemModel.expiry_date <= cutoff)
         )
-        return [_to_domain(model) for model in result.scalars().all()]
+        return [_to_domain(row) for row in result.all()]
 
     async def list_expiring_all(self, days: int) -> list[FridgeItem]:
         cutoff = date.today() + timedelta(days=days)
         result = await self._db.execute(
-            select(FridgeItemModel)
+            select(*_ITEM_COLUMNS)
             .where(FridgeItemModel.expiry_date.is_not(None))
             .where(FridgeItemModel.expiry_date <= cutoff)
         )
-        return [_to_domain(model) for model in result.scalars().all()]
+        return [_to_domain(row) for row in result.all()]
+
+    async def archive_batch(self, cutoff: date, limit: int) -> int:
+        # Consumed items untouched since the cutoff, and items that expired
+        # before it, move to the archive table. Items that still own images
+        # stay in place; notifications keep their row but drop the item link.
+        cutoff_at = datetime.combine(cutoff, time.min, tzinfo=timezone.utc)
+        candidates = await self._db.execute(
+            select(FridgeItemModel.id)
+            .where(
+                or_(
+                    (FridgeItemModel.status == "consumed")
+                    & (func.coalesce(FridgeItemModel.updated_at, FridgeItemModel.created_at) < cutoff_at),
+                    FridgeItemModel.expiry_date < cutoff,
+                )
+            )
+            .where(~exists().where(ItemImageModel.item_id == FridgeItemModel.id))
+            .order_by(FridgeItemModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        item_ids = list(candidates.scalars().all())
+        if not item_ids:
+            return 0
+        await self._db.execute(
+            insert(FridgeItemArchiveModel).from_select(
+                list(_ITEM_FIELDS),
+                select(*_ITEM_COLUMNS).where(FridgeItemModel.id.in_(item_ids)),
+            )
+        )
+        await self._db.execute(
+            update(NotificationModel)
+            .where(NotificationModel.item_id.in_(item_ids))
+            .values(item_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = await self._db.execute(
+            delete(FridgeItemModel)
+            .where(FridgeItemModel.id.in_(item_ids))
+            .returning(FridgeItemModel.fridge_id)
+            .execution_options(synchronize_session=False)
+        )
+        await self._release_item_slots(Counter(deleted.scalars().all()))
+        return len(item_ids)
+
+    async def list_archived(self, fridge_id: uuid.UUID, limit: int) -> list[ArchivedItem]:
+        result = await self._db.execute(
+            select(*_ARCHIVED_ITEM_COLUMNS)
+            .where(FridgeItemArchiveModel.fridge_id == fridge_id)
+            .order_by(FridgeItemArchiveModel.archived_at.desc())
+            .limit(limit)
+        )
+        return [ArchivedItem(*row) for row in result.all()]
+
+    async def _release_item_slots(self, counts: Counter) -> None:
+        for fridge_id, count in counts.items():
+            await self._db.execute(
+                update(FridgeModel)
+                .where(FridgeModel.id == fridge_id)
+                .values(item_count=func.greatest(FridgeModel.item_count - count, 0))
+                .execution_options(synchronize_session=False)
+            )
+
+    async def _invalidate_recipes(self, fridge_id: uuid.UUID) -> None:
+        if self._recipe_cache is not None:
+            await self._recipe_cache.invalidate(fridge_id)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def session_lock(db: AsyncSession) -> asyncio.Lock:
+    # An AsyncSession runs one statement at a time, so every loader bound to
+    # the same session dispatches behind a single lock.
+    lock = db.info.get("loader_lock")
+    if lock is None:
+        lock = asyncio.Lock()
+        db.info["loader_lock"] = lock
+    return lock
+
+
+class BatchLoader(Generic[K, V]):
+    """DataLoader-style batching for lookups within one request.
+
+    Keys requested in the same event loop tick are collected and resolved by a
+    single call to ``batch_fn``, which returns a mapping for the keys it found.
+    Results are memoized for the loader's lifetime, so repeated lookups of a
+    key cost nothing; writers must ``clear``/``prime`` keys they change.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[dict[K, V]]],
+        *,
+        default: V | None = None,
+        max_batch_size: int = 500,
+        lock: asyncio.Lock | None = None,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._default = default
+        self._max_batch_size = max_batch_size
+        self._lock = lock
+        self._cache: dict[K, asyncio.Future] = {}
+        self._queue: list[tuple[K, asyncio.Future]] = []
+        self._task: asyncio.Task | None = None
+
+    async def load(self, key: K) -> V:
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            self._queue.append((key, future))
+            if len(self._queue) == 1:
+                loop.call_soon(self._schedule)
+        # Shield so one cancelled caller does not cancel the shared result.
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: list[K]) -> list[V]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._cache[key] = future
+
+    def clear(self, key: K) -> None:
+        future = self._cache.get(key)
+        if future is not None and future.done():
+            del self._cache[key]
+
+    def clear_all(self) -> None:
+        for key in [key for key, future in self._cache.items() if future.done()]:
+            del self._cache[key]
+
+    def _schedule(self) -> None:
+        self._task = asyncio.ensure_future(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        queued, self._queue = self._queue, []
+        pending = dict(queued)
+        keys = list(pending)
+        try:
+            for start in range(0, len(keys), self._max_batch_size):
+                chunk = keys[start : start + self._max_batch_size]
+                try:
+                    values = await self._call(chunk)
+                except Exception as exc:
+                    for key in chunk:
+                        future = pending[key]
+                        self._forget(key, future)
+                        if not future.done():
+                            future.set_exception(exc)
+                            future.exception()
+                    continue
+                for key in chunk:
+                    future = pending[key]
+                    if not future.done():
+                        future.set_result(values.get(key, self._default))
+        finally:
+            for key, future in pending.items():
+                if not future.done():
+                    self._forget(key, future)
+                    future.cancel()
+
+    async def _call(self, keys: list[K]) -> dict[K, V]:
+        if self._lock is None:
+            return await self._batch_fn(keys)
+        async with self._lock:
+            return await self._batch_fn(keys)
+
+    def _forget(self, key: K, future: asyncio.Future) -> None:
+        # Failures are not memoized; the next load of the key retries.
+        if self._cache.get(key) is future:
+            del self._cache[key]
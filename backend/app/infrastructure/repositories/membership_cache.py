@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Awaitable, Callable
+import uuid
+
+from app.infrastructure.cache import TTLCache
+
+MembershipLoader = Callable[[uuid.UUID, uuid.UUID], Awaitable[bool]]
+UserFridgesLoader = Callable[[uuid.UUID], Awaitable[list[uuid.UUID]]]
+
+
+class MembershipCache:
+    """Process-wide cache in front of ``FridgeRepository.is_member``.
+
+    In ``pair`` mode each (fridge, user) answer is cached, negatives included.
+    In ``user_set`` mode the first lookup for a user loads every fridge they
+    belong to, and later checks for any fridge are answered from that set.
+    Writers call ``invalidate`` after committing a membership change.
+    """
+
+    def __init__(self, *, mode: str, maxsize: int, ttl_seconds: float) -> None:
+        if mode not in ("pair", "user_set"):
+            raise ValueError(f"Unknown membership cache mode: {mode}")
+        self.mode = mode
+        self._entries: TTLCache = TTLCache("membership", maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    async def is_member(
+        self,
+        fridge_id: uuid.UUID,
+        user_id: uuid.UUID,
+        *,
+        load_pair: MembershipLoader,
+        load_user_fridges: UserFridgesLoader,
+    ) -> bool:
+        if self.mode == "user_set":
+            fridge_ids = self._entries.get(user_id)
+            if fridge_ids is None:
+                fridge_ids = frozenset(await load_user_fridges(user_id))
+                self._entries.set(user_id, fridge_ids)
+            return fridge_id in fridge_ids
+        key = (fridge_id, user_id)
+        cached = self._entries.get(key)
+        if cached is None:
+            cached = await load_pair(fridge_id, user_id)
+            self._entries.set(key, cached)
+        return cached
+
+    def invalidate(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        self._entries.pop((fridge_id, user_id))
+        self._entries.pop(user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def hits(self) -> int:
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self._entries.misses
+
+
+def build_membership_cache(mode: str, maxsize: int, ttl_seconds: float) -> MembershipCache | None:
+    if mode == "off":
+        return None
+    return MembershipCache(mode=mode, maxsize=maxsize, ttl_seconds=ttl_seconds)
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.notification import Notification as NotificationModel
@@ -40,14 +40,9 @@ class SqlNotificationRepository:
         item_id: uuid.UUID | None,
         notif_type: str,
     ) -> Notification:
-        model = NotificationModel(
-            user_id=user_id,
-            fridge_id=fridge_id,
-            item_id=item_id,
-            type=notif_type,
-            status="unread",
+        result = await self._db.execute(
+            insert(NotificationModel)
+            .values(user_id=user_id, fridge_id=fridge_id, item_id=item_id, type=notif_type, status="unread")
+            .returning(NotificationModel)
         )
-        self._db.add(model)
-        await self._db.commit()
-        await self._db.refresh(model)
-        return _to_domain(model)
+        return _to_domain(result.scalar_one())
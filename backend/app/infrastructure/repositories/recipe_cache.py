@@ -0,0 +1,114 @@
+import uuid
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.recipe_cache import RecipeCache as RecipeCacheModel
+from app.domain.entities import CachedRecipes, RecipeSuggestion
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.cache_bus import InvalidationBus
+from app.infrastructure.repositories.unit_of_work import after_commit
+
+
+class SqlRecipeCacheRepository:
+    """Per-fridge recipe suggestions in ``recipes_cache``, fronted by an LRU.
+
+    A fridge's entry is its rows ordered by ``position``, all carrying the
+    inventory fingerprint they were generated for. The LRU only ever holds
+    committed entries: writes and invalidations touch it after commit.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        lru: TTLCache[uuid.UUID, CachedRecipes] | None = None,
+        invalidation_bus: InvalidationBus | None = None,
+    ) -> None:
+        self._db = db
+        self._lru = lru
+        self._invalidation_bus = invalidation_bus
+
+    async def get(self, fridge_id: uuid.UUID) -> CachedRecipes | None:
+        if self._lru is not None:
+            cached = self._lru.get(fridge_id)
+            if cached is not None:
+                return cached
+        result = await self._db.execute(
+            select(
+                RecipeCacheModel.fingerprint,
+                RecipeCacheModel.title,
+                RecipeCacheModel.steps,
+                RecipeCacheModel.ingredients,
+                RecipeCacheModel.missing_items,
+                RecipeCacheModel.created_at,
+            )
+            .where(RecipeCacheModel.fridge_id == fridge_id)
+            .order_by(RecipeCacheModel.position)
+        )
+        rows = result.all()
+        if not rows:
+            return None
+        cached = CachedRecipes(
+            fingerprint=rows[0].fingerprint,
+            recipes=[RecipeSuggestion(row.title, row.steps, row.ingredients, row.missing_items) for row in rows],
+            created_at=min(row.created_at for row in rows),
+        )
+        if self._lru is not None:
+            self._lru.set(fridge_id, cached)
+        return cached
+
+    async def put(self, fridge_id: uuid.UUID, fingerprint: str, recipes: list[RecipeSuggestion]) -> None:
+        # Upsert by position and trim the tail, so concurrent refreshes of the
+        # same fridge overwrite each other instead of interleaving rows.
+        rows = [
+            {
+                "fridge_id": fridge_id,
+                "fingerprint": fingerprint,
+                "position": position,
+                "title": recipe.title[:255],
+                "ingredients": recipe.use_items,
+                "missing_items": recipe.missing_items,
+                "steps": recipe.steps,
+            }
+            for position, recipe in enumerate(recipes)
+        ]
+        if rows:
+            stmt = insert(RecipeCacheModel).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[RecipeCacheModel.fridge_id, RecipeCacheModel.position],
+                set_={
+                    "fingerprint": stmt.excluded.fingerprint,
+                    "title": stmt.excluded.title,
+                    "ingredients": stmt.excluded.ingredients,
+                    "missing_items": stmt.excluded.missing_items,
+                    "steps": stmt.excluded.steps,
+                    "created_at": stmt.excluded.created_at,
+                },
+            )
+            await self._db.execute(stmt)
+        await self._db.execute(
+            delete(RecipeCacheModel)
+            .where(RecipeCacheModel.fridge_id == fridge_id, RecipeCacheModel.position >= len(rows))
+            .execution_options(synchronize_session=False)
+        )
+        await self._publish(fridge_id)
+        after_commit(self._db, lambda: self._evict(fridge_id))
+
+    async def invalidate(self, fridge_id: uuid.UUID) -> None:
+        await self._db.execute(
+            delete(RecipeCacheModel)
+            .where(RecipeCacheModel.fridge_id == fridge_id)
+            .execution_options(synchronize_session=False)
+        )
+        await self._publish(fridge_id)
+        after_commit(self._db, lambda: self._evict(fridge_id))
+
+    def _evict(self, fridge_id: uuid.UUID) -> None:
+        # The next get reloads the committed rows, with their server timestamp.
+        if self._lru is not None:
+            self._lru.pop(fridge_id)
+
+    async def _publish(self, fridge_id: uuid.UUID) -> None:
+        if self._invalidation_bus is not None:
+            await self._invalidation_bus.publish(self._db, "recipes", str(fridge_id))
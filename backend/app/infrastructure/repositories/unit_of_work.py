@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def after_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    # Local cache evictions must wait for the commit: evicting earlier lets a
+    # concurrent reader repopulate the cache from pre-commit state.
+    db.info.setdefault("after_commit", []).append(callback)
+
+
+class SqlUnitOfWork:
+    """Owns the request's transaction.
+
+    Repositories sharing the session only flush; the use case decides when
+    the work is durable by calling ``commit`` once. Anything left uncommitted
+    is rolled back when the session closes at the end of the request.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def commit(self) -> None:
+        await self._db.commit()
+        for callback in self._db.info.pop("after_commit", []):
+            callback()
+
+    async def rollback(self) -> None:
+        self._db.info.pop("after_commit", None)
+        await self._db.rollback()
+
+    async def release(self) -> None:
+        # Ends a read-only phase so its pooled connection is free while the
+        # caller awaits something slow; the next query checks one out again.
+        if self._db.in_transaction():
+            await self.rollback()
@@ -0,0 +1,24 @@
+import uuid
+from datetime import date
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.upload_usage import UploadUsage as UploadUsageModel
+
+
+class SqlUsageRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def add_upload_bytes(self, user_id: uuid.UUID, usage_date: date, size: int, limit: int) -> bool:
+        if size > limit:
+            return False
+        stmt = insert(UploadUsageModel).values(user_id=user_id, usage_date=usage_date, bytes_used=size)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UploadUsageModel.user_id, UploadUsageModel.usage_date],
+            set_={"bytes_used": UploadUsageModel.bytes_used + stmt.excluded.bytes_used},
+            where=UploadUsageModel.bytes_used + stmt.excluded.bytes_used <= limit,
+        ).returning(UploadUsageModel.bytes_used)
+        result = await self._db.execute(stmt)
+        return result.scalar_one_or_none() is not None
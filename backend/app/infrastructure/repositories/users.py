@@ -1,10 +1,13 @@
+from datetime import datetime
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities import User
+from app.domain.entities import User, UserAuthState
 from app.db.models.user import User as UserModel
+from app.infrastructure.cache_bus import InvalidationBus
+from app.infrastructure.repositories.loader import BatchLoader, session_lock
 
 
 def _to_domain(model: UserModel) -> User:
@@ -19,8 +22,10 @@ def _to_domain(model: UserModel) -> User:
 
 
 class SqlUserRepository:
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, invalidation_bus: InvalidationBus | None = None) -> None:
         self._db = db
+        self._invalidation_bus = invalidation_bus
+        self._users: BatchLoader[uuid.UUID, User | None] = BatchLoader(self._load_users, lock=session_lock(db))
 
     async def get_by_email(self, email: str) -> User | None:
         result = await self._db.execute(select(UserModel).where(UserModel.email == email))
@@ -28,13 +33,35 @@ class SqlUserRepository:
         return _to_domain(model) if model else None
 
     async def get_by_id(self, user_id: uuid.UUID) -> User | None:
-        result = await self._db.execute(select(UserModel).where(UserModel.id == user_id))
-        model = result.scalar_one_or_none()
-        return _to_domain(model) if model else None
+        return await self._users.load(user_id)
 
     async def create(self, email: str, hashed_password: str, name: str | None, locale: str | None) -> User:
-        model = UserModel(email=email, hashed_password=hashed_password, name=name, locale=locale)
-        self._db.add(model)
-        await self._db.commit()
-        await self._db.refresh(model)
-        return _to_domain(model)
+        result = await self._db.execute(
+            insert(UserModel)
+            .values(email=email, hashed_password=hashed_password, name=name, locale=locale)
+            .returning(UserModel)
+        )
+        user = _to_domain(result.scalar_one())
+        self._users.prime(user.id, user)
+        return user
+
+    async def get_auth_state(self, user_id: uuid.UUID) -> UserAuthState:
+        result = await self._db.execute(select(UserModel.tokens_valid_after).where(UserModel.id == user_id))
+        row = result.one_or_none()
+        if row is None:
+            return UserAuthState(user_id=user_id, exists=False)
+        return UserAuthState(user_id=user_id, exists=True, tokens_valid_after=row[0])
+
+    async def revoke_tokens(self, user_id: uuid.UUID, revoked_at: datetime) -> None:
+        await self._db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(tokens_valid_after=revoked_at)
+            .execution_options(synchronize_session=False)
+        )
+        if self._invalidation_bus is not None:
+            await self._invalidation_bus.publish(self._db, "user_auth", str(user_id))
+
+    async def _load_users(self, user_ids: list[uuid.UUID]) -> dict[uuid.UUID, User]:
+        result = await self._db.execute(select(UserModel).where(UserModel.id.in_(user_ids)))
+        return {model.id: _to_domain(model) for model in result.scalars().all()}
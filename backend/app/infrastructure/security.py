@@ -1,12 +1,24 @@
+from app.core.config import settings
 from app.core.security import create_access_token, get_password_hash, verify_password
+from app.infrastructure.executor import BoundedExecutor
+
+# bcrypt is deliberately slow; run it off the event loop with bounded backlog.
+password_hash_executor = BoundedExecutor(
+    "password_hash",
+    max_workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_queue,
+)
 
 
 class PasswordHasherAdapter:
-    def hash(self, password: str) -> str:
-        return get_password_hash(password)
+    def __init__(self, executor: BoundedExecutor = password_hash_executor) -> None:
+        self._executor = executor
+
+    async def hash(self, password: str) -> str:
+        return await self._executor.run(get_password_hash, password)
 
-    def verify(self, password: str, hashed_password: str) -> bool:
-        return verify_password(password, hashed_password)
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._executor.run(verify_password, password, hashed_password)
 
 
 class TokenIssuerAdapter:
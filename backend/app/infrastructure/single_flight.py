@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+from app.core.metrics import metrics
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Future
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one computation.
+
+    The first caller for a key starts ``fn`` as its own task; callers that
+    arrive while it runs await the same task and get the same result or
+    exception. A cancelled caller only stops waiting; the computation is
+    cancelled once its last waiter is gone. Nothing is remembered after it
+    finishes, so this is coalescing, not caching. Counts land under
+    ``single_flight.<name>.leaders`` / ``.coalesced`` / ``.abandoned``.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._flights: dict[Hashable, _Flight] = {}
+        self._leaders = metrics.counter(f"single_flight.{name}.leaders")
+        self._coalesced = metrics.counter(f"single_flight.{name}.coalesced")
+        self._abandoned = metrics.counter(f"single_flight.{name}.abandoned")
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self._leaders.inc()
+        else:
+            self._coalesced.inc()
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                self._abandoned.inc()
+                self._forget(key, flight)
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
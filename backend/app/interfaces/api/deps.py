@@ -1,62 +1,222 @@
+from datetime import datetime, timezone
 from typing import AsyncGenerator
 import uuid
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.db.session import AsyncSessionLocal
-from app.domain.entities import User
+from app.core.metrics import metrics
+from app.db.session import AsyncSessionLocal, ReadSessionLocal, replica_lag
+from app.application.use_cases.recipes import refresh_recipes, store_recipes
+from app.domain.entities import CachedRecipes, ItemCandidate, Principal, RecipeSuggestion, User, UserAuthState
+from app.domain.policies import is_token_revoked
+from app.domain.recipe_prompt import PromptBudget
+from app.infrastructure.background import BackgroundJobs
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.cache_bus import InvalidationBus
 from app.infrastructure.llm.client import build_llm_client
+from app.infrastructure.repositories.extraction_cache import SqlExtractionCacheRepository
 from app.infrastructure.repositories.fridges import SqlFridgeRepository
 from app.infrastructure.repositories.invites import SqlInviteRepository
+from app.infrastructure.repositories.membership_cache import build_membership_cache
 from app.infrastructure.repositories.items import SqlItemRepository
 from app.infrastructure.repositories.notifications import SqlNotificationRepository
+from app.infrastructure.repositories.recipe_cache import SqlRecipeCacheRepository
+from app.infrastructure.repositories.unit_of_work import SqlUnitOfWork
+from app.infrastructure.repositories.usage import SqlUsageRepository
 from app.infrastructure.repositories.users import SqlUserRepository
+from app.infrastructure.single_flight import SingleFlight
 from app.infrastructure.storage.image_store import LocalImageStorage
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.api_v1_str}/auth/login")
 
+membership_cache = build_membership_cache(
+    settings.membership_cache_mode,
+    settings.membership_cache_size,
+    settings.membership_cache_ttl_seconds,
+)
+
+# Existence and revocation state per user, so authenticating a request does
+# not need the users table. Entries are dropped when tokens are revoked.
+user_auth_cache: TTLCache[uuid.UUID, UserAuthState] = TTLCache(
+    "user_auth",
+    maxsize=settings.auth_cache_size,
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+)
+
+# Users who wrote recently keep reading from the primary for a short window,
+# so replica lag never hides their own writes from them. The window is
+# per process; writes routed to another worker are not seen here.
+recent_writers: TTLCache[uuid.UUID, bool] = TTLCache(
+    "recent_writers",
+    maxsize=settings.auth_cache_size,
+    ttl_seconds=settings.read_your_writes_seconds,
+)
+
+# Recipe cache entries by fridge, in front of the recipes_cache table. The
+# TTL matches the freshness window; older entries are reloaded from the
+# table and refreshed in the background by recipe_jobs.
+recipe_lru: TTLCache[uuid.UUID, CachedRecipes] = TTLCache(
+    "recipes",
+    maxsize=settings.recipe_cache_size,
+    ttl_seconds=settings.recipe_cache_fresh_seconds,
+)
+recipe_jobs = BackgroundJobs("recipe_refresh")
+# Concurrent suggestion misses for one fridge inventory share an LLM call.
+# Per process: requests landing on different workers are not coalesced.
+recipe_flights = SingleFlight("recipes")
+# Bounds the ingredient list sent to the LLM; None sends every item.
+recipe_prompt_budget = (
+    PromptBudget(
+        max_tokens=settings.recipe_prompt_max_tokens,
+        max_items=settings.recipe_prompt_max_items,
+        diversity=settings.recipe_prompt_diversity,
+    )
+    if settings.recipe_prompt_max_tokens > 0
+    else None
+)
+
+# Extraction results by content key; entries never change once written, so
+# the TTL only bounds how long a cold key keeps memory.
+extraction_lru: TTLCache[str, list[ItemCandidate]] = TTLCache(
+    "extraction",
+    maxsize=settings.extraction_cache_size,
+    ttl_seconds=settings.extraction_cache_ttl_seconds,
+)
+
+# One client per process so its HTTP connection pool and concurrency limit
+# are shared by every request; closed in the app lifespan.
+llm_client = build_llm_client()
+
+# Keeps the caches above coherent across processes; see main.py for the listener.
+invalidation_bus = InvalidationBus(settings.cache_bus_channel) if settings.cache_bus_enabled else None
+
+
+def _evict_membership(key: str) -> None:
+    fridge_id, user_id = key.split(":")
+    membership_cache.invalidate(uuid.UUID(fridge_id), uuid.UUID(user_id))
+
+
+if invalidation_bus is not None:
+    if membership_cache is not None:
+        invalidation_bus.register("membership", evict=_evict_membership, flush=membership_cache.clear)
+    invalidation_bus.register(
+        "recipes",
+        evict=lambda key: recipe_lru.pop(uuid.UUID(key)),
+        flush=recipe_lru.clear,
+    )
+    invalidation_bus.register(
+        "user_auth",
+        evict=lambda key: user_auth_cache.pop(uuid.UUID(key)),
+        flush=user_auth_cache.clear,
+    )
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
 
 
+def get_uow(db: AsyncSession = Depends(get_db)) -> SqlUnitOfWork:
+    return SqlUnitOfWork(db)
+
+
 def get_user_repo(db: AsyncSession = Depends(get_db)) -> SqlUserRepository:
-    return SqlUserRepository(db)
+    return SqlUserRepository(db, invalidation_bus=invalidation_bus)
 
 
 def get_fridge_repo(db: AsyncSession = Depends(get_db)) -> SqlFridgeRepository:
-    return SqlFridgeRepository(db)
+    return SqlFridgeRepository(
+        db,
+        membership_cache=membership_cache,
+        invalidation_bus=invalidation_bus,
+    )
 
 
 def get_invite_repo(db: AsyncSession = Depends(get_db)) -> SqlInviteRepository:
     return SqlInviteRepository(db)
 
 
-def get_item_repo(db: AsyncSession = Depends(get_db)) -> SqlItemRepository:
-    return SqlItemRepository(db)
+def get_extraction_cache(db: AsyncSession = Depends(get_db)) -> SqlExtractionCacheRepository:
+    return SqlExtractionCacheRepository(db, lru=extraction_lru)
+
+
+def get_recipe_cache(db: AsyncSession = Depends(get_db)) -> SqlRecipeCacheRepository:
+    return SqlRecipeCacheRepository(db, lru=recipe_lru, invalidation_bus=invalidation_bus)
+
+
+def get_item_repo(
+    db: AsyncSession = Depends(get_db),
+    recipe_cache: SqlRecipeCacheRepository = Depends(get_recipe_cache),
+) -> SqlItemRepository:
+    return SqlItemRepository(db, recipe_cache=recipe_cache)
 
 
 def get_notification_repo(db: AsyncSession = Depends(get_db)) -> SqlNotificationRepository:
     return SqlNotificationRepository(db)
 
 
+def get_usage_repo(db: AsyncSession = Depends(get_db)) -> SqlUsageRepository:
+    return SqlUsageRepository(db)
+
+
 def get_llm_client():
-    return build_llm_client()
+    return llm_client
+
+
+async def _refresh_recipes(fridge_id: uuid.UUID, prefer_expiring_first: bool) -> None:
+    # Runs after the request that scheduled it has finished, on its own session.
+    async with AsyncSessionLocal() as db:
+        await refresh_recipes(
+            uow=SqlUnitOfWork(db),
+            item_repo=SqlItemRepository(db),
+            recipe_cache=SqlRecipeCacheRepository(db, lru=recipe_lru, invalidation_bus=invalidation_bus),
+            llm_client=llm_client,
+            coalescer=recipe_flights,
+            fridge_id=fridge_id,
+            prefer_expiring_first=prefer_expiring_first,
+            prompt_budget=recipe_prompt_budget,
+        )
+
+
+def schedule_recipe_refresh(fridge_id: uuid.UUID, prefer_expiring_first: bool) -> None:
+    recipe_jobs.schedule(
+        (fridge_id, prefer_expiring_first),
+        lambda: _refresh_recipes(fridge_id, prefer_expiring_first),
+    )
+
+
+async def _store_recipes(fridge_id: uuid.UUID, fingerprint: str, recipes: list[RecipeSuggestion]) -> None:
+    async with AsyncSessionLocal() as db:
+        await store_recipes(
+            uow=SqlUnitOfWork(db),
+            recipe_cache=SqlRecipeCacheRepository(db, lru=recipe_lru, invalidation_bus=invalidation_bus),
+            fridge_id=fridge_id,
+            fingerprint=fingerprint,
+            recipes=recipes,
+        )
+
+
+def schedule_recipe_store(fridge_id: uuid.UUID, fingerprint: str, recipes: list[RecipeSuggestion]) -> None:
+    recipe_jobs.schedule(
+        ("store", fridge_id, fingerprint),
+        lambda: _store_recipes(fridge_id, fingerprint, recipes),
+    )
 
 
 def get_image_storage() -> LocalImageStorage:
     return LocalImageStorage()
 
 
-async def get_current_user(
+async def get_current_principal(
+    request: Request,
     token: str = Depends(oauth2_scheme),
+    uow: SqlUnitOfWork = Depends(get_uow),
     user_repo: SqlUserRepository = Depends(get_user_repo),
-) -> User:
+) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -65,6 +225,7 @@ async def get_current_user(
     try:
         payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
         user_id: str | None = payload.get("sub")
+        issued_at_claim = payload.get("iat")
     except JWTError as exc:
         raise credentials_exception from exc
     if not user_id:
@@ -73,9 +234,73 @@ async def get_current_user(
         user_uuid = uuid.UUID(user_id)
     except ValueError as exc:
         raise credentials_exception from exc
-    user = await user_repo.get_by_id(user_uuid)
-    if not user:
+    issued_at = datetime.fromtimestamp(issued_at_claim, tz=timezone.utc) if issued_at_claim else None
+
+    auth_state = user_auth_cache.get(user_uuid)
+    if auth_state is None:
+        auth_state = await user_repo.get_auth_state(user_uuid)
+        await uow.release()
+        user_auth_cache.set(user_uuid, auth_state)
+    if not auth_state.exists or is_token_revoked(issued_at, auth_state.tokens_valid_after):
         raise credentials_exception
+    if request.method not in ("GET", "HEAD", "OPTIONS"):
+        recent_writers.set(user_uuid, True)
+    return Principal(user_id=user_uuid, issued_at=issued_at)
+
+
+async def get_read_db(
+    principal: Principal = Depends(get_current_principal),
+) -> AsyncGenerator[AsyncSession, None]:
+    # A replica further behind than the read-your-writes window could hide
+    # writes that window was meant to cover, so everyone reads the primary.
+    lagging = replica_lag is not None and replica_lag.behind
+    if lagging:
+        metrics.counter("db.reads.replica_behind").inc()
+    if lagging or recent_writers.get(principal.user_id):
+        metrics.counter("db.reads.primary").inc()
+        async with AsyncSessionLocal() as session:
+            yield session
+        return
+    metrics.counter("db.reads.replica").inc()
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+def get_read_uow(db: AsyncSession = Depends(get_read_db)) -> SqlUnitOfWork:
+    return SqlUnitOfWork(db)
+
+
+def get_read_user_repo(db: AsyncSession = Depends(get_read_db)) -> SqlUserRepository:
+    return SqlUserRepository(db)
+
+
+def get_read_fridge_repo(db: AsyncSession = Depends(get_read_db)) -> SqlFridgeRepository:
+    # No membership cache: a lagging replica's answer (say, not yet a member
+    # of a fridge just joined) would be cached and served to write paths too,
+    # after the join's invalidation already fired.
+    return SqlFridgeRepository(db)
+
+
+def get_read_item_repo(db: AsyncSession = Depends(get_read_db)) -> SqlItemRepository:
+    return SqlItemRepository(db)
+
+
+def get_read_recipe_cache(db: AsyncSession = Depends(get_read_db)) -> SqlRecipeCacheRepository:
+    # Lookups only; generated recipes are stored through schedule_recipe_store.
+    return SqlRecipeCacheRepository(db, lru=recipe_lru)
+
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    user_repo: SqlUserRepository = Depends(get_read_user_repo),
+) -> User:
+    user = await user_repo.get_by_id(principal.user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
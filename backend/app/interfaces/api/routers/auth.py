@@ -1,22 +1,40 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.application.errors import ConflictError, ValidationError
-from app.application.use_cases.auth import login_user, register_user
+from app.application.errors import ConflictError, ServiceUnavailableError, ValidationError
+from app.application.use_cases.auth import login_user, register_user, revoke_all_tokens
+from app.domain.entities import Principal
 from app.infrastructure.security import PasswordHasherAdapter, TokenIssuerAdapter
+from app.infrastructure.repositories.unit_of_work import SqlUnitOfWork
 from app.infrastructure.repositories.users import SqlUserRepository
-from app.interfaces.api.deps import get_current_user, get_db
+from app.interfaces.api.deps import (
+    get_current_principal,
+    get_current_user,
+    get_db,
+    get_uow,
+    get_user_repo,
+    user_auth_cache,
+)
 from app.schemas.auth import LoginRequest, Token
 from app.schemas.user import UserCreate, UserOut
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _overloaded(exc: ServiceUnavailableError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(exc),
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED)
 async def register_user_handler(payload: UserCreate, db: AsyncSession = Depends(get_db)) -> UserOut:
     repo = SqlUserRepository(db)
     try:
         user = await register_user(
+            uow=SqlUnitOfWork(db),
             repo=repo,
             hasher=PasswordHasherAdapter(),
             email=payload.email,
@@ -26,6 +44,8 @@ async def register_user_handler(payload: UserCreate, db: AsyncSession = Depends(
         )
     except ConflictError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except ServiceUnavailableError as exc:
+        raise _overloaded(exc) from exc
     return UserOut.model_validate(user)
 
 
@@ -42,9 +62,21 @@ async def login_handler(payload: LoginRequest, db: AsyncSession = Depends(get_db
         )
     except ValidationError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
+    except ServiceUnavailableError as exc:
+        raise _overloaded(exc) from exc
     return Token(access_token=token)
 
 
 @router.get("/me", response_model=UserOut)
 async def get_me(current_user=Depends(get_current_user)) -> UserOut:
     return UserOut.model_validate(current_user)
+
+
+@router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all_handler(
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
+    user_repo: SqlUserRepository = Depends(get_user_repo),
+) -> None:
+    await revoke_all_tokens(uow=uow, repo=user_repo, user_id=principal.user_id)
+    user_auth_cache.pop(principal.user_id)
@@ -0,0 +1,78 @@
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.application.errors import ForbiddenError, NotFoundError, ServiceUnavailableError
+from app.application.use_cases.dashboard import get_dashboard
+from app.core.config import settings
+from app.domain.entities import User
+from app.infrastructure.repositories.fridges import SqlFridgeRepository
+from app.infrastructure.repositories.items import SqlItemRepository
+from app.infrastructure.repositories.recipe_cache import SqlRecipeCacheRepository
+from app.infrastructure.repositories.unit_of_work import SqlUnitOfWork
+from app.interfaces.api.deps import (
+    get_current_user,
+    get_llm_client,
+    get_read_fridge_repo,
+    get_read_item_repo,
+    get_read_recipe_cache,
+    get_read_uow,
+    recipe_flights,
+    recipe_prompt_budget,
+    schedule_recipe_refresh,
+    schedule_recipe_store,
+)
+from app.schemas.dashboard import DashboardOut
+from app.schemas.fridge import MemberOut
+from app.schemas.item import ItemOut
+from app.schemas.recipe import RecipeSuggestion
+from app.schemas.user import UserOut
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("", response_model=DashboardOut)
+async def dashboard_handler(
+    fridge_id: uuid.UUID,
+    days: int = settings.default_expiring_days,
+    prefer_expiring_first: bool = True,
+    current_user: User = Depends(get_current_user),
+    uow: SqlUnitOfWork = Depends(get_read_uow),
+    fridge_repo: SqlFridgeRepository = Depends(get_read_fridge_repo),
+    item_repo: SqlItemRepository = Depends(get_read_item_repo),
+    recipe_cache: SqlRecipeCacheRepository = Depends(get_read_recipe_cache),
+    llm_client=Depends(get_llm_client),
+) -> DashboardOut:
+    try:
+        dashboard = await get_dashboard(
+            uow=uow,
+            fridge_repo=fridge_repo,
+            item_repo=item_repo,
+            recipe_cache=recipe_cache,
+            llm_client=llm_client,
+            coalescer=recipe_flights,
+            user=current_user,
+            fridge_id=fridge_id,
+            expiring_days=days,
+            prefer_expiring_first=prefer_expiring_first,
+            fresh_seconds=settings.recipe_cache_fresh_seconds,
+            schedule_refresh=schedule_recipe_refresh,
+            schedule_store=schedule_recipe_store,
+            prompt_budget=recipe_prompt_budget,
+        )
+    except ForbiddenError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ServiceUnavailableError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
+    return DashboardOut(
+        user=UserOut.model_validate(dashboard.user),
+        members=[
+            MemberOut(user_id=member.user_id, role=member.role, joined_at=member.created_at)
+            for member in dashboard.members
+        ],
+        items=[ItemOut.model_validate(item) for item in dashboard.items],
+        expiring=[ItemOut.model_validate(item) for item in dashboard.expiring],
+        recipes=[RecipeSuggestion.model_validate(recipe) for recipe in dashboard.recipes],
+    )
@@ -1,17 +1,33 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app.application.errors import ConflictError, ForbiddenError, NotFoundError, ValidationError
-from app.application.use_cases.fridges import create_fridge, list_members
+from app.application.errors import ConflictError, ForbiddenError, NotFoundError, QuotaExceededError, ValidationError
+from app.application.use_cases.fridges import create_fridge, list_members, list_my_fridges
 from app.application.use_cases.invites import create_invite_code, join_fridge_by_invite
 from app.core.config import settings
-from app.domain.entities import User
+from app.domain.entities import Principal
 from app.domain.invite import generate_invite_code
 from app.infrastructure.repositories.fridges import SqlFridgeRepository
 from app.infrastructure.repositories.invites import SqlInviteRepository
-from app.interfaces.api.deps import get_current_user, get_fridge_repo, get_invite_repo
-from app.schemas.fridge import FridgeCreate, FridgeOut, InviteOut, InviteRequest, JoinRequest, MemberOut
+from app.infrastructure.repositories.unit_of_work import SqlUnitOfWork
+from app.interfaces.api.deps import (
+    get_current_principal,
+    get_fridge_repo,
+    get_invite_repo,
+    get_read_fridge_repo,
+    get_uow,
+)
+from app.interfaces.api.serialization import list_response
+from app.schemas.fridge import (
+    FridgeCreate,
+    FridgeOut,
+    FridgeSummaryOut,
+    InviteOut,
+    InviteRequest,
+    JoinRequest,
+    MemberOut,
+)
 
 router = APIRouter(prefix="/fridges", tags=["fridges"])
 
@@ -19,17 +35,40 @@ router = APIRouter(prefix="/fridges", tags=["fridges"])
 @router.post("", response_model=FridgeOut, status_code=status.HTTP_201_CREATED)
 async def create_fridge_handler(
     payload: FridgeCreate,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
     fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
 ) -> FridgeOut:
-    fridge = await create_fridge(fridge_repo=fridge_repo, name=payload.name, owner_user_id=current_user.id)
+    try:
+        fridge = await create_fridge(
+            uow=uow,
+            fridge_repo=fridge_repo,
+            name=payload.name,
+            owner_user_id=principal.user_id,
+            max_fridges=settings.max_fridges_per_user,
+            max_memberships=settings.max_memberships_per_user,
+        )
+    except QuotaExceededError as exc:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)) from exc
     return FridgeOut.model_validate(fridge)
 
 
+@router.get("", response_model=list[FridgeSummaryOut])
+async def list_my_fridges_handler(
+    request: Request,
+    expiring_days: int = settings.default_expiring_days,
+    principal: Principal = Depends(get_current_principal),
+    fridge_repo: SqlFridgeRepository = Depends(get_read_fridge_repo),
+) -> Response:
+    fridges = await list_my_fridges(fridge_repo=fridge_repo, user_id=principal.user_id, expiring_days=expiring_days)
+    return list_response(FridgeSummaryOut, fridges, request)
+
+
 @router.post("/invite", response_model=InviteOut, status_code=status.HTTP_201_CREATED)
 async def create_invite_handler(
     payload: InviteRequest,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
     fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
     invite_repo: SqlInviteRepository = Depends(get_invite_repo),
 ) -> InviteOut:
@@ -37,10 +76,11 @@ async def create_invite_handler(
     max_uses = payload.max_uses or settings.invite_max_uses
     try:
         invite = await create_invite_code(
+            uow=uow,
             fridge_repo=fridge_repo,
             invite_repo=invite_repo,
             fridge_id=payload.fridge_id,
-            user_id=current_user.id,
+            user_id=principal.user_id,
             code=generate_invite_code(),
             expires_in_hours=expires_hours,
             max_uses=max_uses,
@@ -53,16 +93,19 @@ async def create_invite_handler(
 @router.post("/join", status_code=status.HTTP_200_OK)
 async def join_fridge_handler(
     payload: JoinRequest,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
     fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
     invite_repo: SqlInviteRepository = Depends(get_invite_repo),
 ) -> dict:
     try:
         fridge_id = await join_fridge_by_invite(
+            uow=uow,
             fridge_repo=fridge_repo,
             invite_repo=invite_repo,
             invite_code=payload.invite_code,
-            user_id=current_user.id,
+            user_id=principal.user_id,
+            max_memberships=settings.max_memberships_per_user,
         )
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
@@ -70,17 +113,19 @@ async def join_fridge_handler(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     except ValidationError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except QuotaExceededError as exc:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)) from exc
     return {"fridge_id": fridge_id, "role": "member"}
 
 
 @router.get("/{fridge_id}/members", response_model=list[MemberOut])
 async def list_members_handler(
     fridge_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
+    principal: Principal = Depends(get_current_principal),
+    fridge_repo: SqlFridgeRepository = Depends(get_read_fridge_repo),
 ) -> list[MemberOut]:
     try:
-        members = await list_members(fridge_repo=fridge_repo, fridge_id=fridge_id, user_id=current_user.id)
+        members = await list_members(fridge_repo=fridge_repo, fridge_id=fridge_id, user_id=principal.user_id)
     except ForbiddenError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
     except NotFoundError as exc:
@@ -1,134 +1,264 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Response, UploadFile, status
 
-from app.application.errors import ForbiddenError, NotFoundError
+from app.application.errors import (
+    ForbiddenError,
+    NotFoundError,
+    PayloadTooLargeError,
+    QuotaExceededError,
+    ServiceUnavailableError,
+)
 from app.application.use_cases.items import (
+    archive_stale_items,
     confirm_items,
     delete_item,
     ingest_candidates,
     list_expiring,
+    list_item_history,
     list_items,
+    prune_extraction_cache,
+    reserve_upload,
     update_item,
 )
 from app.core.config import settings
-from app.domain.entities import FileData, User
+from app.domain.entities import FileData, Principal
+from app.infrastructure.repositories.extraction_cache import SqlExtractionCacheRepository
 from app.infrastructure.repositories.fridges import SqlFridgeRepository
 from app.infrastructure.repositories.items import SqlItemRepository
-from app.interfaces.api.deps import get_current_user, get_fridge_repo, get_item_repo, get_llm_client, get_image_storage
-from app.schemas.item import ItemConfirmRequest, ItemIngestResponse, ItemOut, ItemUpdate
+from app.infrastructure.repositories.unit_of_work import SqlUnitOfWork
+from app.infrastructure.repositories.usage import SqlUsageRepository
+from app.interfaces.api.deps import (
+    get_current_principal,
+    get_extraction_cache,
+    get_fridge_repo,
+    get_image_storage,
+    get_item_repo,
+    get_llm_client,
+    get_read_fridge_repo,
+    get_read_item_repo,
+    get_uow,
+    get_usage_repo,
+    verify_cron_secret,
+)
+from app.interfaces.api.serialization import list_response
+from app.schemas.item import ArchivedItemOut, ItemConfirmRequest, ItemIngestResponse, ItemOut, ItemUpdate
 
 router = APIRouter(prefix="/items", tags=["items"])
 
 
+async def _read_uploads(
+    images: list[UploadFile],
+    user_id: uuid.UUID,
+    uow: SqlUnitOfWork,
+    usage_repo: SqlUsageRepository,
+) -> list[FileData]:
+    # The parsed form holds uploads in spooled temporary files, so the image
+    # count and daily quota are checked before any of them is read into memory.
+    try:
+        await reserve_upload(
+            uow=uow,
+            usage_repo=usage_repo,
+            user_id=user_id,
+            image_count=len(images),
+            total_bytes=sum(_upload_size(image) for image in images),
+            max_images=settings.max_images_per_item,
+            max_bytes_per_day=settings.max_upload_bytes_per_day,
+        )
+    except PayloadTooLargeError as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc)) from exc
+    return [FileData(filename=image.filename or "upload", content=await image.read()) for image in images]
+
+
+def _upload_size(image: UploadFile) -> int:
+    if image.size is not None:
+        return image.size
+    image.file.seek(0, 2)
+    size = image.file.tell()
+    image.file.seek(0)
+    return size
+
+
 @router.post("/ingest", response_model=ItemIngestResponse)
 async def ingest_items_handler(
     text: Annotated[str | None, Form()] = None,
     images: Annotated[list[UploadFile] | None, File()] = None,
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
+    usage_repo: SqlUsageRepository = Depends(get_usage_repo),
+    extraction_cache: SqlExtractionCacheRepository = Depends(get_extraction_cache),
     llm_client=Depends(get_llm_client),
     image_storage=Depends(get_image_storage),
 ) -> ItemIngestResponse:
     if not text and not images:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Provide text or images")
-    image_names: list[str] = []
-    if images:
-        for image in images:
-            content = await image.read()
-            file_data = FileData(filename=image.filename or "upload", content=content)
-            await image_storage.save(file_data)
-            image_names.append(image.filename or "upload")
-    candidates = await ingest_candidates(llm_client=llm_client, text=text, image_names=image_names)
+    files = await _read_uploads(images or [], principal.user_id, uow, usage_repo)
+    for file_data in files:
+        await image_storage.save(file_data)
+    try:
+        candidates = await ingest_candidates(
+            uow=uow,
+            llm_client=llm_client,
+            extraction_cache=extraction_cache,
+            text=text,
+            images=files,
+        )
+    except ServiceUnavailableError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
     return ItemIngestResponse(candidates=[candidate for candidate in candidates])
 
 
 @router.post("/image", response_model=ItemIngestResponse)
 async def image_only_handler(
     image: UploadFile = File(...),
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
+    usage_repo: SqlUsageRepository = Depends(get_usage_repo),
+    extraction_cache: SqlExtractionCacheRepository = Depends(get_extraction_cache),
     llm_client=Depends(get_llm_client),
     image_storage=Depends(get_image_storage),
 ) -> ItemIngestResponse:
-    content = await image.read()
-    file_data = FileData(filename=image.filename or "upload", content=content)
-    await image_storage.save(file_data)
-    candidates = await ingest_candidates(
-        llm_client=llm_client,
-        text=None,
-        image_names=[image.filename or "upload"],
-    )
+    files = await _read_uploads([image], principal.user_id, uow, usage_repo)
+    await image_storage.save(files[0])
+    try:
+        candidates = await ingest_candidates(
+            uow=uow,
+            llm_client=llm_client,
+            extraction_cache=extraction_cache,
+            text=None,
+            images=files,
+        )
+    except ServiceUnavailableError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
     return ItemIngestResponse(candidates=[candidate for candidate in candidates])
 
 
 @router.post("/confirm", response_model=list[ItemOut], status_code=status.HTTP_201_CREATED)
 async def confirm_items_handler(
     payload: ItemConfirmRequest,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
     fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
     item_repo: SqlItemRepository = Depends(get_item_repo),
 ) -> list[ItemOut]:
     try:
         items = await confirm_items(
+            uow=uow,
             fridge_repo=fridge_repo,
             item_repo=item_repo,
             fridge_id=payload.fridge_id,
-            user_id=current_user.id,
+            user_id=principal.user_id,
             items=[item.model_dump() for item in payload.items],
             expiring_days=settings.default_expiring_days,
+            max_items=settings.max_items_per_fridge,
         )
     except ForbiddenError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except QuotaExceededError as exc:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)) from exc
     return [ItemOut.model_validate(item) for item in items]
 
 
 @router.get("", response_model=list[ItemOut])
 async def list_items_handler(
+    request: Request,
     fridge_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
-    item_repo: SqlItemRepository = Depends(get_item_repo),
-) -> list[ItemOut]:
+    principal: Principal = Depends(get_current_principal),
+    fridge_repo: SqlFridgeRepository = Depends(get_read_fridge_repo),
+    item_repo: SqlItemRepository = Depends(get_read_item_repo),
+) -> Response:
     try:
-        items = await list_items(fridge_repo=fridge_repo, item_repo=item_repo, fridge_id=fridge_id, user_id=current_user.id)
+        items = await list_items(fridge_repo=fridge_repo, item_repo=item_repo, fridge_id=fridge_id, user_id=principal.user_id)
     except ForbiddenError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
-    return [ItemOut.model_validate(item) for item in items]
+    return list_response(ItemOut, items, request)
 
 
 @router.get("/expiring", response_model=list[ItemOut])
 async def expiring_items_handler(
+    request: Request,
     fridge_id: uuid.UUID,
     days: int = settings.default_expiring_days,
-    current_user: User = Depends(get_current_user),
-    fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
-    item_repo: SqlItemRepository = Depends(get_item_repo),
-) -> list[ItemOut]:
+    principal: Principal = Depends(get_current_principal),
+    fridge_repo: SqlFridgeRepository = Depends(get_read_fridge_repo),
+    item_repo: SqlItemRepository = Depends(get_read_item_repo),
+) -> Response:
     try:
         items = await list_expiring(
             fridge_repo=fridge_repo,
             item_repo=item_repo,
             fridge_id=fridge_id,
-            user_id=current_user.id,
+            user_id=principal.user_id,
             days=days,
         )
     except ForbiddenError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
-    return [ItemOut.model_validate(item) for item in items]
+    return list_response(ItemOut, items, request)
+
+
+@router.get("/history", response_model=list[ArchivedItemOut])
+async def item_history_handler(
+    request: Request,
+    fridge_id: uuid.UUID,
+    limit: int = 100,
+    principal: Principal = Depends(get_current_principal),
+    fridge_repo: SqlFridgeRepository = Depends(get_read_fridge_repo),
+    item_repo: SqlItemRepository = Depends(get_read_item_repo),
+) -> Response:
+    try:
+        items = await list_item_history(
+            fridge_repo=fridge_repo,
+            item_repo=item_repo,
+            fridge_id=fridge_id,
+            user_id=principal.user_id,
+            limit=limit,
+        )
+    except ForbiddenError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    return list_response(ArchivedItemOut, items, request)
+
+
+@router.post("/cron/archive")
+async def cron_archive_handler(
+    _: None = Depends(verify_cron_secret),
+    uow: SqlUnitOfWork = Depends(get_uow),
+    item_repo: SqlItemRepository = Depends(get_item_repo),
+    extraction_cache: SqlExtractionCacheRepository = Depends(get_extraction_cache),
+    llm_client=Depends(get_llm_client),
+) -> dict:
+    archived = await archive_stale_items(
+        uow=uow,
+        item_repo=item_repo,
+        older_than_days=settings.archive_after_days,
+        batch_size=settings.archive_batch_size,
+    )
+    pruned = await prune_extraction_cache(
+        uow=uow,
+        extraction_cache=extraction_cache,
+        model_version=llm_client.version,
+        older_than_days=settings.extraction_cache_retention_days,
+        batch_size=settings.archive_batch_size,
+    )
+    return {"archived": archived, "extraction_cache_pruned": pruned}
 
 
 @router.put("/{item_id}", response_model=ItemOut)
 async def update_item_handler(
     item_id: uuid.UUID,
     payload: ItemUpdate,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
     fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
     item_repo: SqlItemRepository = Depends(get_item_repo),
 ) -> ItemOut:
     try:
         item = await update_item(
+            uow=uow,
             fridge_repo=fridge_repo,
             item_repo=item_repo,
             item_id=item_id,
-            user_id=current_user.id,
+            user_id=principal.user_id,
             updates=payload.model_dump(exclude_unset=True),
             expiring_days=settings.default_expiring_days,
         )
@@ -142,12 +272,19 @@ async def update_item_handler(
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_item_handler(
     item_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
     fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
     item_repo: SqlItemRepository = Depends(get_item_repo),
 ) -> None:
     try:
-        await delete_item(fridge_repo=fridge_repo, item_repo=item_repo, item_id=item_id, user_id=current_user.id)
+        await delete_item(
+            uow=uow,
+            fridge_repo=fridge_repo,
+            item_repo=item_repo,
+            item_id=item_id,
+            user_id=principal.user_id,
+        )
     except ForbiddenError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
     except NotFoundError as exc:
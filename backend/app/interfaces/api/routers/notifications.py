@@ -5,7 +5,14 @@ from app.core.config import settings
 from app.infrastructure.repositories.fridges import SqlFridgeRepository
 from app.infrastructure.repositories.items import SqlItemRepository
 from app.infrastructure.repositories.notifications import SqlNotificationRepository
-from app.interfaces.api.deps import get_fridge_repo, get_item_repo, get_notification_repo, verify_cron_secret
+from app.infrastructure.repositories.unit_of_work import SqlUnitOfWork
+from app.interfaces.api.deps import (
+    get_fridge_repo,
+    get_item_repo,
+    get_notification_repo,
+    get_uow,
+    verify_cron_secret,
+)
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -14,11 +21,13 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 async def cron_expiring_handler(
     days: int = settings.default_expiring_days,
     _: None = Depends(verify_cron_secret),
+    uow: SqlUnitOfWork = Depends(get_uow),
     fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
     item_repo: SqlItemRepository = Depends(get_item_repo),
     notification_repo: SqlNotificationRepository = Depends(get_notification_repo),
 ) -> dict:
     created = await generate_expiry_notifications(
+        uow=uow,
         fridge_repo=fridge_repo,
         item_repo=item_repo,
         notification_repo=notification_repo,
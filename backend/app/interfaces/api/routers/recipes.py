@@ -1,11 +1,32 @@
+import time
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
-from app.application.errors import ForbiddenError
-from app.application.use_cases.recipes import suggest_recipes
-from app.domain.entities import User
+from app.application.errors import ForbiddenError, ServiceUnavailableError
+from app.application.use_cases.recipes import stream_recipes, suggest_recipes
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.domain.entities import Principal, RecipeSuggestion
 from app.infrastructure.repositories.fridges import SqlFridgeRepository
 from app.infrastructure.repositories.items import SqlItemRepository
-from app.interfaces.api.deps import get_current_user, get_fridge_repo, get_item_repo, get_llm_client
+from app.infrastructure.repositories.recipe_cache import SqlRecipeCacheRepository
+from app.infrastructure.repositories.unit_of_work import SqlUnitOfWork
+from app.interfaces.api.deps import (
+    get_current_principal,
+    get_fridge_repo,
+    get_item_repo,
+    get_llm_client,
+    get_recipe_cache,
+    get_uow,
+    recipe_flights,
+    recipe_prompt_budget,
+    schedule_recipe_refresh,
+    schedule_recipe_store,
+)
+from app.interfaces.api.serialization import sse_event
+from app.schemas.recipe import RecipeSuggestion as RecipeSuggestionOut
 from app.schemas.recipe import RecipeSuggestRequest, RecipeSuggestResponse
 
 router = APIRouter(prefix="/recipes", tags=["recipes"])
@@ -14,20 +35,84 @@ router = APIRouter(prefix="/recipes", tags=["recipes"])
 @router.post("/suggest", response_model=RecipeSuggestResponse)
 async def suggest_recipes_handler(
     payload: RecipeSuggestRequest,
-    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
     fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
     item_repo: SqlItemRepository = Depends(get_item_repo),
+    recipe_cache: SqlRecipeCacheRepository = Depends(get_recipe_cache),
     llm_client=Depends(get_llm_client),
 ) -> RecipeSuggestResponse:
     try:
         recipes = await suggest_recipes(
+            uow=uow,
             fridge_repo=fridge_repo,
             item_repo=item_repo,
+            recipe_cache=recipe_cache,
             llm_client=llm_client,
+            coalescer=recipe_flights,
             fridge_id=payload.fridge_id,
-            user_id=current_user.id,
+            user_id=principal.user_id,
             prefer_expiring_first=payload.prefer_expiring_first,
+            fresh_seconds=settings.recipe_cache_fresh_seconds,
+            schedule_refresh=schedule_recipe_refresh,
+            prompt_budget=recipe_prompt_budget,
         )
     except ForbiddenError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    except ServiceUnavailableError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc)) from exc
     return RecipeSuggestResponse(recipes=[recipe for recipe in recipes])
+
+
+async def _recipe_events(recipes: AsyncIterator[RecipeSuggestion], started: float) -> AsyncIterator[bytes]:
+    count = 0
+    try:
+        async for recipe in recipes:
+            if count == 0:
+                metrics.histogram("recipes.stream.first_recipe_seconds").observe(time.perf_counter() - started)
+            count += 1
+            yield sse_event("recipe", RecipeSuggestionOut.model_validate(recipe).model_dump())
+    except ServiceUnavailableError as exc:
+        # Headers are already sent, so failures travel as an event.
+        metrics.counter("recipes.stream.errors").inc()
+        yield sse_event("error", {"detail": str(exc)})
+        return
+    metrics.histogram("recipes.stream.total_seconds").observe(time.perf_counter() - started)
+    yield sse_event("done", {"count": count})
+
+
+@router.post("/suggest/stream", response_class=StreamingResponse)
+async def stream_recipes_handler(
+    payload: RecipeSuggestRequest,
+    principal: Principal = Depends(get_current_principal),
+    uow: SqlUnitOfWork = Depends(get_uow),
+    fridge_repo: SqlFridgeRepository = Depends(get_fridge_repo),
+    item_repo: SqlItemRepository = Depends(get_item_repo),
+    recipe_cache: SqlRecipeCacheRepository = Depends(get_recipe_cache),
+    llm_client=Depends(get_llm_client),
+) -> StreamingResponse:
+    """Same suggestions as ``/suggest``, sent as ``recipe`` events as each one
+    is generated, then a ``done`` event (or an ``error`` event)."""
+    started = time.perf_counter()
+    try:
+        recipes = await stream_recipes(
+            uow=uow,
+            fridge_repo=fridge_repo,
+            item_repo=item_repo,
+            recipe_cache=recipe_cache,
+            llm_client=llm_client,
+            fridge_id=payload.fridge_id,
+            user_id=principal.user_id,
+            prefer_expiring_first=payload.prefer_expiring_first,
+            fresh_seconds=settings.recipe_cache_fresh_seconds,
+            schedule_refresh=schedule_recipe_refresh,
+            schedule_store=schedule_recipe_store,
+            prompt_budget=recipe_prompt_budget,
+        )
+    except ForbiddenError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    return StreamingResponse(
+        _recipe_events(recipes, started),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable
+
+from fastapi import Request, Response
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed to serve application/msgpack
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def negotiate(accept: str | None) -> str:
+    """Pick JSON or MessagePack from an Accept header, honouring q-values."""
+    best, best_q = JSON_MEDIA_TYPE, -1.0
+    for part in (accept or "").split(","):
+        media_type, *params = (piece.strip() for piece in part.split(";"))
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        media_type = media_type.lower()
+        if media_type in MSGPACK_MEDIA_TYPES and msgpack is not None:
+            candidate = MSGPACK_MEDIA_TYPES[0]
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            candidate = JSON_MEDIA_TYPE
+        else:
+            continue
+        if q > best_q:
+            best, best_q = candidate, q
+    return best
+
+
+def encode_list(model: type[BaseModel], items: Iterable[Any], media_type: str = JSON_MEDIA_TYPE) -> bytes:
+    # One validation pass over the whole list (entities are read by attribute),
+    # then a single encode; FastAPI's response_model pass is skipped entirely.
+    adapter = list_adapter(model)
+    validated = adapter.validate_python(items, from_attributes=True)
+    if media_type in MSGPACK_MEDIA_TYPES:
+        return msgpack.packb(adapter.dump_python(validated, mode="json"))
+    # OPT_UTC_Z keeps timestamps byte-identical to pydantic's own JSON ("Z").
+    return orjson.dumps(adapter.dump_python(validated), option=orjson.OPT_UTC_Z)
+
+
+def list_response(model: type[BaseModel], items: Iterable[Any], request: Request) -> Response:
+    media_type = negotiate(request.headers.get("accept"))
+    return Response(
+        content=encode_list(model, items, media_type),
+        media_type=media_type,
+        headers={"Vary": "Accept"},
+    )
+
+
+def sse_event(event: str, data: Any) -> bytes:
+    # One Server-Sent Event; orjson output never contains raw newlines.
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data, option=orjson.OPT_UTC_Z) + b"\n\n"
@@ -1,16 +1,49 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.replica import monitor_replica_lag
+from app.db.session import read_engine, replica_lag
+from app.infrastructure.cache_bus import asyncpg_dsn
+from app.infrastructure.security import password_hash_executor
+from app.interfaces.api.deps import invalidation_bus, llm_client, recipe_jobs, verify_cron_secret
 from app.interfaces.api.routers.auth import router as auth_router
+from app.interfaces.api.routers.dashboard import router as dashboard_router
 from app.interfaces.api.routers.fridges import router as fridges_router
 from app.interfaces.api.routers.items import router as items_router
 from app.interfaces.api.routers.notifications import router as notifications_router
 from app.interfaces.api.routers.recipes import router as recipes_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks: list[asyncio.Task] = []
+    if invalidation_bus is not None:
+        tasks.append(asyncio.create_task(invalidation_bus.listen(asyncpg_dsn(settings.database_url))))
+    if replica_lag is not None:
+        # A reading older than the read-your-writes window cannot vouch for it.
+        poll_seconds = min(settings.replica_lag_poll_seconds, settings.read_your_writes_seconds)
+        tasks.append(asyncio.create_task(monitor_replica_lag(read_engine, poll_seconds, replica_lag)))
+    yield
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await recipe_jobs.aclose()
+    password_hash_executor.shutdown()
+    await llm_client.aclose()
+
+
 def create_app() -> FastAPI:
-    app = FastAPI(title=settings.app_name, openapi_url=f"{settings.api_v1_str}/openapi.json")
+    app = FastAPI(
+        title=settings.app_name,
+        openapi_url=f"{settings.api_v1_str}/openapi.json",
+        lifespan=lifespan,
+    )
 
     if settings.cors_allow_origins:
         origins = [origin.strip() for origin in settings.cors_allow_origins.split(",") if origin.strip()]
@@ -27,11 +60,17 @@ def create_app() -> FastAPI:
     async def health_check():
         return {"status": "healthy"}
 
+    # Pool, cache and breaker internals; same secret as the cron routes.
+    @app.get("/metrics", dependencies=[Depends(verify_cron_secret)])
+    async def metrics_snapshot():
+        return metrics.snapshot()
+
     app.include_router(auth_router, prefix=settings.api_v1_str)
     app.include_router(fridges_router, prefix=settings.api_v1_str)
     app.include_router(items_router, prefix=settings.api_v1_str)
     app.include_router(recipes_router, prefix=settings.api_v1_str)
     app.include_router(notifications_router, prefix=settings.api_v1_str)
+    app.include_router(dashboard_router, prefix=settings.api_v1_str)
 
     return app
 
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+from app.schemas.fridge import MemberOut
+from app.schemas.item import ItemOut
+from app.schemas.recipe import RecipeSuggestion
+from app.schemas.user import UserOut
+
+
+class DashboardOut(BaseModel):
+    user: UserOut
+    members: list[MemberOut]
+    items: list[ItemOut]
+    expiring: list[ItemOut]
+    recipes: list[RecipeSuggestion]
@@ -17,6 +17,19 @@ class FridgeOut(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class FridgeSummaryOut(BaseModel):
+    id: uuid.UUID
+    name: str
+    owner_user_id: uuid.UUID
+    role: str
+    member_count: int
+    item_count: int
+    expiring_count: int
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
 class InviteOut(BaseModel):
     invite_code: str
     expires_at: datetime
@@ -6,6 +6,7 @@ from pydantic import BaseModel
 
 class ItemCandidate(BaseModel):
     name: str
+    category: str | None = None
     quantity: float | None = None
     unit: str | None = None
     expiry_date: date | None = None
@@ -64,3 +65,8 @@ class ItemOut(BaseModel):
     updated_at: datetime | None
 
     model_config = {"from_attributes": True}
+
+
+class ArchivedItemOut(ItemOut):
+    created_at: datetime | None
+    archived_at: datetime
@@ -0,0 +1,49 @@
+"""Throughput and LLM escalation rate of the local grocery text parser.
+
+Parses every line of ``grocery_corpus.txt`` (one pasted list per line, as
+users send them) ``ROUNDS`` times. Reports lines and fragments per second,
+the share of fragments escalated to the LLM, and the share of lines that
+needed no LLM call at all.
+
+    python -m benchmarks.grocery_text
+"""
+
+from datetime import date
+from pathlib import Path
+import time
+
+from app.domain.grocery_text import parse_grocery_text
+
+CORPUS = Path(__file__).with_name("grocery_corpus.txt")
+ROUNDS = 200
+
+
+def main() -> None:
+    lines = [line for line in CORPUS.read_text(encoding="utf-8").splitlines() if line.strip()]
+    today = date.today()
+
+    parsed = escalated = local_lines = 0
+    for line in lines:
+        candidates, unparsed = parse_grocery_text(line, today)
+        parsed += len(candidates)
+        escalated += len(unparsed)
+        local_lines += not unparsed
+    fragments = parsed + escalated
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for line in lines:
+            parse_grocery_text(line, today)
+    elapsed = time.perf_counter() - started
+
+    print(f"lines               {len(lines)}")
+    print(f"fragments           {fragments}")
+    print(f"lines/s             {len(lines) * ROUNDS / elapsed:,.0f}")
+    print(f"fragments/s         {fragments * ROUNDS / elapsed:,.0f}")
+    print(f"us per line         {elapsed / (len(lines) * ROUNDS) * 1e6:.1f}")
+    print(f"escalated fragments {escalated / fragments:.1%}")
+    print(f"lines without LLM   {local_lines / len(lines):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Throughput and latency of ``GeminiLLMClient`` against the local fake server.
+
+The fake answers after ``LATENCY`` seconds and fails ``ERROR_RATE`` of
+requests with 503, served in-process through ``httpx.ASGITransport``.
+``serial`` awaits one call at a time, the old blocking shape; the
+``limit`` rows fire ``REQUESTS`` calls at once under different concurrency
+limits, and ``batch`` rows do the same through ``BatchingLLMClient``,
+reporting how many HTTP requests reached the server. The ``tail`` rows give
+the primary a slow tail (``SLOW_RATE`` of calls take ``SLOW_SECONDS``) and
+compare it alone with ``HedgedLLMClient`` hedging to a second fake server,
+reporting how many hedges were sent.
+
+    python -m benchmarks.llm_client
+"""
+
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.core.metrics import metrics
+from app.infrastructure.llm.batching import BatchingLLMClient
+from app.infrastructure.llm.fake_server import create_fake_gemini_app
+from app.infrastructure.llm.gemini import GeminiLLMClient
+from app.infrastructure.llm.hedging import HedgedLLMClient
+
+REQUESTS = 100
+LATENCY = 0.05
+ERROR_RATE = 0.05
+LIMITS = (4, 16, 64)
+BATCH_SIZES = (8, 32)
+SLOW_RATE = 0.05
+SLOW_SECONDS = 1.0
+
+
+def make_client(max_concurrency: int, app=None) -> GeminiLLMClient:
+    app = app or create_fake_gemini_app(latency_seconds=LATENCY, error_rate=ERROR_RATE, seed=7)
+    http = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://fake")
+    return GeminiLLMClient(
+        api_key="bench",
+        model="fake",
+        base_url="http://fake",
+        max_concurrency=max_concurrency,
+        backoff_seconds=0.01,
+        http=http,
+    )
+
+
+async def timed_call(
+    client: GeminiLLMClient | BatchingLLMClient | HedgedLLMClient, latencies: list[float]
+) -> None:
+    start = time.perf_counter()
+    await client.extract_candidates_from_text("milk 1 l, eggs 6, rice 2 kg")
+    latencies.append(time.perf_counter() - start)
+
+
+def report(name: str, elapsed: float, latencies: list[float], sent: int | None = None, note: str = "") -> None:
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"  {name:<10} {elapsed:7.2f} s  {len(latencies) / elapsed:7.1f} req/s"
+        f"  p50 {statistics.median(latencies) * 1e3:7.1f} ms  p95 {p95 * 1e3:7.1f} ms  p99 {p99 * 1e3:7.1f} ms"
+        + (f"  {sent} HTTP requests" if sent is not None else "")
+        + note
+    )
+
+
+async def run() -> None:
+    print(f"{REQUESTS} requests, {LATENCY * 1e3:.0f} ms fake latency, {ERROR_RATE:.0%} 503s")
+    client = make_client(1)
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        await timed_call(client, latencies)
+    report("serial", time.perf_counter() - start, latencies)
+    await client.aclose()
+
+    for limit in LIMITS:
+        client = make_client(limit)
+        latencies = []
+        start = time.perf_counter()
+        await asyncio.gather(*(timed_call(client, latencies) for _ in range(REQUESTS)))
+        report(f"limit {limit}", time.perf_counter() - start, latencies)
+        await client.aclose()
+
+    for size in BATCH_SIZES:
+        app = create_fake_gemini_app(latency_seconds=LATENCY, error_rate=ERROR_RATE, seed=7)
+        client = BatchingLLMClient(make_client(16, app), window_seconds=0.02, max_batch_size=size)
+        latencies = []
+        start = time.perf_counter()
+        await asyncio.gather(*(timed_call(client, latencies) for _ in range(REQUESTS)))
+        report(f"batch {size}", time.perf_counter() - start, latencies, app.state.stats.requests)
+        await client.aclose()
+
+    for hedged in (False, True):
+        slow = create_fake_gemini_app(latency_seconds=LATENCY, slow_rate=SLOW_RATE, slow_seconds=SLOW_SECONDS, seed=7)
+        client = make_client(16, slow)
+        if hedged:
+            backup = make_client(16, create_fake_gemini_app(latency_seconds=LATENCY, seed=8))
+            client = HedgedLLMClient([("primary", client), ("secondary", backup)], max_delay_seconds=0.2)
+        latencies = []
+        start = time.perf_counter()
+        # Paced like live traffic, so the hedge delay can learn from earlier calls.
+        for _ in range(REQUESTS // 10):
+            await asyncio.gather(*(timed_call(client, latencies) for _ in range(10)))
+        hedges = f"  {metrics.counter('llm.hedge.sent').value} hedges" if hedged else ""
+        report("tail hedge" if hedged else "tail", time.perf_counter() - start, latencies, note=hedges)
+        await client.aclose()
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Latency of ranking recipes for a fridge with the local recipe engine.
+
+Builds a synthetic corpus (``CORPUS_SIZES`` recipes over ``VOCABULARY``
+ingredients) and ranks a 30-item fridge against it. ``index`` is
+``RecipeIndex.rank``; ``python`` scores every recipe with a dict lookup per
+ingredient, the scan the inverted index replaces. The bundled corpus is
+timed as well.
+
+    python -m benchmarks.recipe_engine
+"""
+
+import random
+import statistics
+import time
+
+from app.infrastructure.recipes.engine import Recipe, RecipeIndex
+
+CORPUS_SIZES = (1_000, 10_000, 100_000)
+VOCABULARY = 2_000
+FRIDGE_ITEMS = 30
+ROUNDS = 50
+LIMIT = 5
+
+
+def make_corpus(count: int, rng: random.Random) -> list[Recipe]:
+    return [
+        Recipe(
+            title=f"recipe {n}",
+            ingredients=[f"ingredient {rng.randrange(VOCABULARY)}" for _ in range(rng.randint(3, 10))],
+            steps=["Cook."],
+        )
+        for n in range(count)
+    ]
+
+
+def python_rank(corpus: list[Recipe], items: list[str], limit: int) -> list[str]:
+    weights = {item: 1.0 + 1.0 / (1 + rank) for rank, item in enumerate(items)}
+    scored = []
+    for recipe in corpus:
+        ingredients = set(recipe.ingredients)
+        used = [weights[name] for name in ingredients if name in weights]
+        if used:
+            scored.append((sum(used) - 0.5 * (len(ingredients) - len(used)), recipe.title))
+    scored.sort(key=lambda entry: entry[0], reverse=True)
+    return [title for _, title in scored[:limit]]
+
+
+def timed(fn) -> tuple[float, float]:
+    samples = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return statistics.median(samples) * 1000, samples[int(len(samples) * 0.95) - 1] * 1000
+
+
+def main() -> None:
+    rng = random.Random(7)
+    items = [f"ingredient {rng.randrange(VOCABULARY)}" for _ in range(FRIDGE_ITEMS)]
+    print(f"{'corpus':>8} {'path':>7} {'p50 ms':>8} {'p95 ms':>8}")
+    for size in CORPUS_SIZES:
+        corpus = make_corpus(size, rng)
+        index = RecipeIndex(corpus)
+        for path, fn in (
+            ("index", lambda: index.rank(items, True, LIMIT)),
+            ("python", lambda: python_rank(corpus, items, LIMIT)),
+        ):
+            p50, p95 = timed(fn)
+            print(f"{size:>8} {path:>7} {p50:>8.3f} {p95:>8.3f}")
+
+    bundled = RecipeIndex.from_file()
+    fridge = ["계란", "김치", "햇반", "대파", "양파", "두부", "우유", "식빵"]
+    p50, p95 = timed(lambda: bundled.rank(fridge, True, LIMIT))
+    print(f"{len(bundled):>8} {'bundled':>7} {p50:>8.3f} {p95:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Cost of turning ``FridgeItem`` lists into ``ItemOut`` response bodies.
+
+``fastapi`` mimics the old handler path: ``ItemOut.model_validate`` per item,
+a second validation against ``response_model``, ``jsonable_encoder`` and
+stdlib ``json``. ``orjson`` is the ``encode_list`` path used by list
+endpoints now; ``msgpack`` is reported when the optional package is present.
+
+    python -m benchmarks.serialization
+"""
+
+from datetime import date, datetime, timedelta, timezone
+import json
+import time
+import uuid
+
+from fastapi.encoders import jsonable_encoder
+
+from app.domain.entities import FridgeItem
+from app.interfaces.api import serialization
+from app.interfaces.api.serialization import encode_list, list_adapter
+from app.schemas.item import ItemOut
+
+SIZES = (1_000, 10_000)
+ROUNDS = 10
+
+
+def make_items(count: int) -> list[FridgeItem]:
+    fridge_id = uuid.uuid4()
+    today = date.today()
+    now = datetime.now(tz=timezone.utc)
+    return [
+        FridgeItem(
+            id=uuid.uuid4(),
+            fridge_id=fridge_id,
+            name=f"item {n}",
+            category="dairy",
+            quantity=1.0,
+            unit="ea",
+            purchase_date=today,
+            expiry_date=today + timedelta(days=n % 30),
+            storage_location="fridge",
+            status="fresh",
+            notes=None,
+            created_at=now,
+            updated_at=None,
+        )
+        for n in range(count)
+    ]
+
+
+def fastapi_path(items: list[FridgeItem]) -> bytes:
+    models = [ItemOut.model_validate(item) for item in items]
+    validated = list_adapter(ItemOut).validate_python(models, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def orjson_path(items: list[FridgeItem]) -> bytes:
+    return encode_list(ItemOut, items)
+
+
+def msgpack_path(items: list[FridgeItem]) -> bytes:
+    return encode_list(ItemOut, items, "application/msgpack")
+
+
+def measure(name: str, path, items: list[FridgeItem]) -> None:
+    body = path(items)
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        path(items)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<8} {best * 1e3:9.2f} ms  {best * 1e6 / len(items):7.2f} us/row  {len(body) / len(items):6.0f} B/row")
+
+
+def main() -> None:
+    paths = [("fastapi", fastapi_path), ("orjson", orjson_path)]
+    if serialization.msgpack is not None:
+        paths.append(("msgpack", msgpack_path))
+    for size in SIZES:
+        items = make_items(size)
+        print(f"{size} ItemOut rows, best of {ROUNDS}")
+        for name, path in paths:
+            measure(name, path, items)
+
+
+if __name__ == "__main__":
+    main()
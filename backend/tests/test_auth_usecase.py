@@ -0,0 +1,96 @@
+from dataclasses import dataclass, field
+import uuid
+
+import pytest
+
+from app.application.errors import ConflictError, ValidationError
+from app.application.use_cases.auth import login_user, register_user
+from app.domain.entities import User
+
+
+@dataclass
+class FakeUnitOfWork:
+    commits: int = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+
+@dataclass
+class FakeUserRepo:
+    users: dict[str, User] = field(default_factory=dict)
+
+    async def get_by_email(self, email: str) -> User | None:
+        return self.users.get(email)
+
+    async def create(self, email: str, hashed_password: str, name: str | None, locale: str | None) -> User:
+        user = User(id=uuid.uuid4(), email=email, hashed_password=hashed_password, name=name, locale=locale)
+        self.users[email] = user
+        return user
+
+
+class FakeHasher:
+    async def hash(self, password: str) -> str:
+        return f"hashed:{password}"
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return hashed_password == f"hashed:{password}"
+
+
+class FakeTokenIssuer:
+    def create_access_token(self, subject: str) -> str:
+        return f"token:{subject}"
+
+
+@pytest.mark.asyncio
+async def test_register_hashes_password_and_rejects_duplicates():
+    repo = FakeUserRepo()
+
+    user = await register_user(
+        uow=FakeUnitOfWork(),
+        repo=repo,
+        hasher=FakeHasher(),
+        email="a@example.com",
+        password="pw",
+        name=None,
+        locale=None,
+    )
+
+    assert user.hashed_password == "hashed:pw"
+    with pytest.raises(ConflictError):
+        await register_user(
+            uow=FakeUnitOfWork(),
+            repo=repo,
+            hasher=FakeHasher(),
+            email="a@example.com",
+            password="pw",
+            name=None,
+            locale=None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_login_verifies_password():
+    repo = FakeUserRepo()
+    user = await register_user(
+        uow=FakeUnitOfWork(),
+        repo=repo,
+        hasher=FakeHasher(),
+        email="a@example.com",
+        password="pw",
+        name=None,
+        locale=None,
+    )
+
+    token = await login_user(
+        repo=repo, hasher=FakeHasher(), token_issuer=FakeTokenIssuer(), email="a@example.com", password="pw"
+    )
+
+    assert token == f"token:{user.id}"
+    with pytest.raises(ValidationError):
+        await login_user(
+            repo=repo, hasher=FakeHasher(), token_issuer=FakeTokenIssuer(), email="a@example.com", password="bad"
+        )
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.repositories.loader import BatchLoader
+
+
+class RecordingBatch:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[list[int]] = []
+        self.fail = fail
+
+    async def __call__(self, keys: list[int]) -> dict[int, str]:
+        self.calls.append(list(keys))
+        if self.fail:
+            raise RuntimeError("boom")
+        return {key: f"v{key}" for key in keys if key != 0}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_batched_and_deduplicated():
+    batch = RecordingBatch()
+    loader = BatchLoader(batch)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+    assert results == ["v1", "v2", "v1"]
+    assert batch.calls == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_repeated_load_is_memoized_and_missing_uses_default():
+    batch = RecordingBatch()
+    loader = BatchLoader(batch, default="none")
+
+    assert await loader.load(0) == "none"
+    assert await loader.load(3) == "v3"
+    assert await loader.load(3) == "v3"
+    assert batch.calls == [[0], [3]]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_max_size():
+    batch = RecordingBatch()
+    loader = BatchLoader(batch, max_batch_size=2)
+
+    await loader.load_many([1, 2, 3])
+
+    assert batch.calls == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_memoized():
+    batch = RecordingBatch(fail=True)
+    loader = BatchLoader(batch)
+
+    with pytest.raises(RuntimeError):
+        await loader.load(1)
+    batch.fail = False
+
+    assert await loader.load(1) == "v1"
+    assert len(batch.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_prime_and_clear():
+    batch = RecordingBatch()
+    loader = BatchLoader(batch)
+
+    loader.prime(5, "primed")
+    assert await loader.load(5) == "primed"
+    loader.clear(5)
+    assert await loader.load(5) == "v5"
+    assert batch.calls == [[5]]
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.application.errors import ServiceUnavailableError
+from app.infrastructure.executor import BoundedExecutor
+
+
+@pytest.mark.asyncio
+async def test_run_executes_off_the_event_loop_thread():
+    executor = BoundedExecutor("test_exec_thread", max_workers=1, max_queue=0)
+    loop_thread = threading.get_ident()
+
+    worker_thread = await executor.run(threading.get_ident)
+
+    assert worker_thread != loop_thread
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_sheds_load_when_saturated():
+    executor = BoundedExecutor("test_exec_shed", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert executor.in_flight == 2
+
+    with pytest.raises(ServiceUnavailableError):
+        await executor.run(release.wait)
+
+    release.set()
+    assert await asyncio.gather(*running) == [True, True]
+    assert executor.in_flight == 0
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_callers_keep_their_slot_until_the_job_finishes():
+    executor = BoundedExecutor("test_exec_cancel", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    callers = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0.01)
+
+    # The queued job was cancelled with its caller; the running one was not.
+    assert executor.in_flight == 1
+    queued = asyncio.ensure_future(executor.run(release.wait))
+    await asyncio.sleep(0)
+    with pytest.raises(ServiceUnavailableError):
+        await executor.run(release.wait)
+
+    release.set()
+    assert await queued is True
+    await asyncio.sleep(0.01)
+    assert executor.in_flight == 0
+    executor.shutdown()
@@ -0,0 +1,100 @@
+import uuid
+
+import pytest
+
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.repositories.membership_cache import MembershipCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache("test-expiry", maxsize=10, ttl_seconds=5, clock=clock)
+
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    clock.now = 6
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache("test-lru", maxsize=2, ttl_seconds=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_counts_hits_and_misses():
+    cache = TTLCache("test-counters", maxsize=2, ttl_seconds=60)
+    hits, misses = cache.hits, cache.misses
+
+    cache.get("a")
+    cache.set("a", False)
+    assert cache.get("a") is False
+
+    assert cache.hits - hits == 1
+    assert cache.misses - misses == 1
+
+
+class MembershipSource:
+    def __init__(self, memberships: set[tuple[uuid.UUID, uuid.UUID]]) -> None:
+        self.memberships = memberships
+        self.pair_loads = 0
+        self.set_loads = 0
+
+    async def load_pair(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        self.pair_loads += 1
+        return (fridge_id, user_id) in self.memberships
+
+    async def load_user_fridges(self, user_id: uuid.UUID) -> list[uuid.UUID]:
+        self.set_loads += 1
+        return [fridge_id for fridge_id, member_id in self.memberships if member_id == user_id]
+
+
+async def _check(cache: MembershipCache, source: MembershipSource, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    return await cache.is_member(
+        fridge_id, user_id, load_pair=source.load_pair, load_user_fridges=source.load_user_fridges
+    )
+
+
+@pytest.mark.asyncio
+async def test_membership_cache_pair_mode_caches_negatives_until_invalidated():
+    fridge_id, user_id = uuid.uuid4(), uuid.uuid4()
+    source = MembershipSource(set())
+    cache = MembershipCache(mode="pair", maxsize=100, ttl_seconds=60)
+
+    assert await _check(cache, source, fridge_id, user_id) is False
+    source.memberships.add((fridge_id, user_id))
+    assert await _check(cache, source, fridge_id, user_id) is False
+    cache.invalidate(fridge_id, user_id)
+    assert await _check(cache, source, fridge_id, user_id) is True
+    assert source.pair_loads == 2
+
+
+@pytest.mark.asyncio
+async def test_membership_cache_user_set_mode_loads_once_per_fill():
+    user_id = uuid.uuid4()
+    fridges = [uuid.uuid4() for _ in range(3)]
+    source = MembershipSource({(fridge_id, user_id) for fridge_id in fridges})
+    cache = MembershipCache(mode="user_set", maxsize=100, ttl_seconds=60)
+
+    for fridge_id in fridges:
+        assert await _check(cache, source, fridge_id, user_id) is True
+    assert await _check(cache, source, uuid.uuid4(), user_id) is False
+
+    assert source.set_loads == 1
+    assert source.pair_loads == 0
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from app.core.metrics import metrics
+from app.infrastructure.cache_bus import InvalidationBus
+
+
+class RecordingSession:
+    def __init__(self) -> None:
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+
+def _message(cache: str, key: str, origin: str = "other") -> str:
+    return json.dumps({"origin": origin, "cache": cache, "key": key, "sent_at": 0.0})
+
+
+def _bus_with_recorder() -> tuple[InvalidationBus, list[str], list[str]]:
+    bus = InvalidationBus("test_channel")
+    evicted: list[str] = []
+    flushed: list[str] = []
+    bus.register("users", evict=evicted.append, flush=lambda: flushed.append("users"))
+    return bus, evicted, flushed
+
+
+def test_handle_evicts_key_from_registered_cache():
+    bus, evicted, _ = _bus_with_recorder()
+    lag = metrics.histogram("cache_bus.lag_seconds")
+    observed = lag.count
+
+    bus.handle(_message("users", "abc"))
+    bus.handle(_message("unknown", "abc"))
+
+    assert evicted == ["abc"]
+    assert lag.count == observed + 2
+
+
+def test_handle_skips_own_messages_and_bad_payloads():
+    bus, evicted, flushed = _bus_with_recorder()
+
+    bus.handle(_message("users", "abc", origin=bus.origin))
+    bus.handle("not json")
+
+    assert evicted == []
+    assert flushed == []
+
+
+def test_flush_all_clears_every_cache():
+    bus, _, flushed = _bus_with_recorder()
+    bus.register("other", evict=lambda key: None, flush=lambda: flushed.append("other"))
+
+    bus.flush_all()
+
+    assert flushed == ["users", "other"]
+
+
+@pytest.mark.asyncio
+async def test_publish_notifies_within_the_session():
+    bus, _, _ = _bus_with_recorder()
+    session = RecordingSession()
+
+    await bus.publish(session, "users", "abc")
+
+    (statement,) = session.statements
+    compiled = statement.compile(compile_kwargs={"literal_binds": True})
+    assert "pg_notify('test_channel'" in str(compiled)
+    assert '"key": "abc"' in str(compiled)
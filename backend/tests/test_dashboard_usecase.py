@@ -0,0 +1,214 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+import uuid
+
+import pytest
+
+from app.application.errors import ForbiddenError
+from app.application.use_cases.dashboard import get_dashboard
+from app.domain.entities import CachedRecipes, FridgeItem, FridgeMember, RecipeSuggestion, User
+from app.domain.recipe_prompt import PromptBudget
+from app.infrastructure.single_flight import SingleFlight
+
+
+@dataclass
+class FakeFridgeRepo:
+    members: list[FridgeMember]
+    membership_checks: int = 0
+
+    async def is_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        self.membership_checks += 1
+        return any(member.fridge_id == fridge_id and member.user_id == user_id for member in self.members)
+
+    async def list_members(self, fridge_id: uuid.UUID) -> list[FridgeMember]:
+        return [member for member in self.members if member.fridge_id == fridge_id]
+
+
+@dataclass
+class FakeItemRepo:
+    items: list[FridgeItem]
+    reads: int = 0
+
+    async def list_items(self, fridge_id: uuid.UUID) -> list[FridgeItem]:
+        self.reads += 1
+        return [item for item in self.items if item.fridge_id == fridge_id]
+
+
+@dataclass
+class FakeUnitOfWork:
+    releases: int = 0
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+    async def release(self) -> None:
+        self.releases += 1
+
+
+@dataclass
+class FakeRecipeCache:
+    entries: dict[uuid.UUID, CachedRecipes] = field(default_factory=dict)
+
+    async def get(self, fridge_id: uuid.UUID) -> CachedRecipes | None:
+        return self.entries.get(fridge_id)
+
+    async def put(self, fridge_id: uuid.UUID, fingerprint: str, recipes: list[RecipeSuggestion]) -> None:
+        self.entries[fridge_id] = CachedRecipes(fingerprint, recipes, datetime.now(tz=timezone.utc))
+
+
+@dataclass
+class FakeLLMClient:
+    uow: FakeUnitOfWork | None = None
+    calls: list[list[str]] = field(default_factory=list)
+    released_before_call: list[bool] = field(default_factory=list)
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        self.calls.append(items)
+        self.released_before_call.append(self.uow is not None and self.uow.releases > 0)
+        return [RecipeSuggestion(title="mix", steps=[], use_items=items, missing_items=[])]
+
+
+async def _dashboard(
+    *,
+    fridge_repo: FakeFridgeRepo,
+    item_repo: FakeItemRepo,
+    llm_client: FakeLLMClient,
+    user: User,
+    fridge_id: uuid.UUID,
+    uow: FakeUnitOfWork | None = None,
+    recipe_cache: FakeRecipeCache | None = None,
+    prompt_budget: PromptBudget | None = None,
+):
+    recipe_cache = recipe_cache if recipe_cache is not None else FakeRecipeCache()
+
+    def store(fridge_id: uuid.UUID, fingerprint: str, recipes: list[RecipeSuggestion]) -> None:
+        recipe_cache.entries[fridge_id] = CachedRecipes(fingerprint, recipes, datetime.now(tz=timezone.utc))
+
+    return await get_dashboard(
+        uow=uow or FakeUnitOfWork(),
+        fridge_repo=fridge_repo,
+        item_repo=item_repo,
+        recipe_cache=recipe_cache,
+        llm_client=llm_client,
+        coalescer=SingleFlight("test_dashboard"),
+        user=user,
+        fridge_id=fridge_id,
+        expiring_days=3,
+        prefer_expiring_first=True,
+        fresh_seconds=60.0,
+        schedule_refresh=lambda fridge_id, prefer: None,
+        schedule_store=store,
+        prompt_budget=prompt_budget,
+    )
+
+
+def _item(fridge_id: uuid.UUID, name: str, expiry_date: date | None) -> FridgeItem:
+    return FridgeItem(
+        id=uuid.uuid4(),
+        fridge_id=fridge_id,
+        name=name,
+        category=None,
+        quantity=None,
+        unit=None,
+        purchase_date=None,
+        expiry_date=expiry_date,
+        storage_location=None,
+        status="fresh",
+        notes=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dashboard_requires_membership():
+    user = User(id=uuid.uuid4(), email="a@example.com", hashed_password="x")
+    with pytest.raises(ForbiddenError):
+        await _dashboard(
+            fridge_repo=FakeFridgeRepo(members=[]),
+            item_repo=FakeItemRepo(items=[]),
+            llm_client=FakeLLMClient(),
+            user=user,
+            fridge_id=uuid.uuid4(),
+        )
+
+
+@pytest.mark.asyncio
+async def test_dashboard_reads_items_once_and_derives_expiring():
+    fridge_id = uuid.uuid4()
+    user = User(id=uuid.uuid4(), email="a@example.com", hashed_password="x")
+    today = date.today()
+    milk = _item(fridge_id, "milk", today + timedelta(days=1))
+    rice = _item(fridge_id, "rice", today + timedelta(days=30))
+    egg = _item(fridge_id, "egg", None)
+    fridge_repo = FakeFridgeRepo(members=[FridgeMember(id=uuid.uuid4(), fridge_id=fridge_id, user_id=user.id, role="owner")])
+    item_repo = FakeItemRepo(items=[rice, egg, milk])
+    uow = FakeUnitOfWork()
+    llm_client = FakeLLMClient(uow=uow)
+
+    dashboard = await _dashboard(
+        uow=uow,
+        fridge_repo=fridge_repo,
+        item_repo=item_repo,
+        llm_client=llm_client,
+        user=user,
+        fridge_id=fridge_id,
+    )
+
+    assert dashboard.user is user
+    assert len(dashboard.members) == 1
+    assert dashboard.expiring == [milk]
+    assert llm_client.calls == [["milk", "rice", "egg"]]
+    assert llm_client.released_before_call == [True]
+    assert fridge_repo.membership_checks == 1
+    assert item_repo.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_second_dashboard_load_is_served_from_the_recipe_cache():
+    fridge_id = uuid.uuid4()
+    user = User(id=uuid.uuid4(), email="a@example.com", hashed_password="x")
+    owner = FridgeMember(id=uuid.uuid4(), fridge_id=fridge_id, user_id=user.id, role="owner")
+    fridge_repo = FakeFridgeRepo(members=[owner])
+    item_repo = FakeItemRepo(items=[_item(fridge_id, "milk", date.today())])
+    recipe_cache = FakeRecipeCache()
+    llm_client = FakeLLMClient()
+
+    loads = [
+        await _dashboard(
+            fridge_repo=fridge_repo,
+            item_repo=item_repo,
+            llm_client=llm_client,
+            user=user,
+            fridge_id=fridge_id,
+            recipe_cache=recipe_cache,
+        )
+        for _ in range(2)
+    ]
+
+    assert len(llm_client.calls) == 1
+    assert loads[1].recipes == loads[0].recipes
+
+
+@pytest.mark.asyncio
+async def test_dashboard_recipes_respect_the_prompt_budget():
+    fridge_id = uuid.uuid4()
+    user = User(id=uuid.uuid4(), email="a@example.com", hashed_password="x")
+    owner = FridgeMember(id=uuid.uuid4(), fridge_id=fridge_id, user_id=user.id, role="owner")
+    today = date.today()
+    item_repo = FakeItemRepo(
+        items=[_item(fridge_id, "rice", None), _item(fridge_id, "milk", today), _item(fridge_id, "tofu", today)]
+    )
+    llm_client = FakeLLMClient()
+
+    await _dashboard(
+        fridge_repo=FakeFridgeRepo(members=[owner]),
+        item_repo=item_repo,
+        llm_client=llm_client,
+        user=user,
+        fridge_id=fridge_id,
+        prompt_budget=PromptBudget(max_tokens=100, max_items=2),
+    )
+
+    assert llm_client.calls == [["milk", "tofu"]]
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+import uuid
+
+import pytest
+
+from app.application.errors import ForbiddenError
+from app.application.use_cases.fridges import list_members, list_my_fridges
+from app.domain.entities import FridgeSummary
+
+
+@dataclass
+class FakeFridgeRepo:
+    summaries: dict[uuid.UUID, list[FridgeSummary]]
+    members: set[tuple[uuid.UUID, uuid.UUID]]
+
+    async def is_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        return (fridge_id, user_id) in self.members
+
+    async def list_for_user(self, user_id: uuid.UUID, expiring_days: int) -> list[FridgeSummary]:
+        return self.summaries.get(user_id, [])
+
+
+@pytest.mark.asyncio
+async def test_list_my_fridges_returns_summaries():
+    user_id = uuid.uuid4()
+    summary = FridgeSummary(
+        id=uuid.uuid4(),
+        name="home",
+        owner_user_id=user_id,
+        role="owner",
+        member_count=2,
+        item_count=5,
+        expiring_count=1,
+    )
+    fridge_repo = FakeFridgeRepo(summaries={user_id: [summary]}, members=set())
+
+    fridges = await list_my_fridges(fridge_repo=fridge_repo, user_id=user_id, expiring_days=3)
+
+    assert fridges == [summary]
+
+
+@pytest.mark.asyncio
+async def test_list_members_requires_membership():
+    fridge_repo = FakeFridgeRepo(summaries={}, members=set())
+
+    with pytest.raises(ForbiddenError):
+        await list_members(fridge_repo=fridge_repo, fridge_id=uuid.uuid4(), user_id=uuid.uuid4())
@@ -0,0 +1,109 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.application.errors import ServiceUnavailableError
+from app.core.metrics import metrics
+from app.domain.entities import FileData
+from app.infrastructure.llm.fake_server import create_fake_gemini_app
+from app.infrastructure.llm.gemini import GeminiLLMClient, JsonArrayScanner
+
+
+def _client(app, **kwargs) -> GeminiLLMClient:
+    http = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://fake")
+    options = {"max_concurrency": 4, "max_retries": 3, "backoff_seconds": 0.001} | kwargs
+    return GeminiLLMClient(api_key="test", model="fake", base_url="http://fake", http=http, **options)
+
+
+@pytest.mark.asyncio
+async def test_parses_candidates_and_recipes():
+    client = _client(create_fake_gemini_app())
+
+    candidates = await client.extract_candidates_from_text("milk 1 l, eggs 6")
+    images = await client.extract_candidates_from_images(
+        [FileData(filename="a.png", content=b"\x89PNG")]
+    )
+    recipes = await client.suggest_recipes(["milk", "eggs"], prefer_expiring_first=True)
+    await client.aclose()
+
+    assert [candidate.name for candidate in candidates] == ["milk", "eggs"]
+    assert candidates[0].source == "text"
+    assert len(images) == 1 and images[0].source == "image"
+    assert recipes[0].use_items == ["milk", "eggs"]
+
+
+@pytest.mark.asyncio
+async def test_records_prompt_size_per_call():
+    client = _client(create_fake_gemini_app())
+    tokens = metrics.histogram("llm.prompt_tokens")
+    small = metrics.histogram("llm.request_seconds.prompt_le_256")
+    before = (tokens.count, small.count)
+
+    await client.suggest_recipes(["milk", "eggs"], prefer_expiring_first=False)
+    await client.aclose()
+
+    assert (tokens.count, small.count) == (before[0] + 1, before[1] + 1)
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_failures():
+    app = create_fake_gemini_app(fail_first=2)
+    client = _client(app)
+
+    candidates = await client.extract_candidates_from_text("milk")
+
+    assert [candidate.name for candidate in candidates] == ["milk"]
+    assert app.state.stats.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries():
+    app = create_fake_gemini_app(fail_first=10)
+    client = _client(app, max_retries=1)
+
+    with pytest.raises(ServiceUnavailableError):
+        await client.extract_candidates_from_text("milk")
+    assert app.state.stats.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_fails_fast_when_retry_after_exceeds_the_cap():
+    app = create_fake_gemini_app(fail_first=10, retry_after=300)
+    client = _client(app, max_retry_after_seconds=1)
+
+    with pytest.raises(ServiceUnavailableError, match="retry after 300s"):
+        await asyncio.wait_for(client.extract_candidates_from_text("milk"), timeout=5)
+    assert app.state.stats.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrent_requests():
+    app = create_fake_gemini_app(latency_seconds=0.02)
+    client = _client(app, max_concurrency=2)
+
+    await asyncio.gather(*(client.extract_candidates_from_text("milk") for _ in range(8)))
+
+    assert app.state.stats.requests == 8
+    assert app.state.stats.peak_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_streams_recipes_as_they_complete():
+    app = create_fake_gemini_app()
+    client = _client(app)
+
+    titles = [recipe.title async for recipe in client.stream_recipes(["milk", "eggs"], prefer_expiring_first=True)]
+    await client.aclose()
+
+    assert titles == ["Quick mix with milk, eggs", "Milk soup", "Eggs soup"]
+
+
+def test_json_array_scanner_handles_arbitrary_chunk_boundaries():
+    text = '[{"title": "a \\"}\\" b", "steps": ["{x}"]}, {"title": "c"}]'
+    for size in (1, 3, 7, len(text)):
+        scanner = JsonArrayScanner()
+        found = []
+        for start in range(0, len(text), size):
+            found.extend(scanner.feed(text[start : start + size]))
+        assert found == [{"title": 'a "}" b', "steps": ["{x}"]}, {"title": "c"}]
@@ -0,0 +1,63 @@
+from datetime import date
+
+from app.domain.grocery_text import lookup_food, parse_grocery_text
+
+TODAY = date(2026, 10, 19)
+
+
+def _parsed(text: str) -> list[tuple]:
+    candidates, _ = parse_grocery_text(text, TODAY)
+    return [(c.name, c.quantity, c.unit) for c in candidates]
+
+
+def test_parses_korean_counts_and_units():
+    assert _parsed("우유 2개, 계란 10 개, 두부 1모") == [("우유", 2.0, "개"), ("계란", 10.0, "개"), ("두부", 1.0, "모")]
+    assert _parsed("계란10개\n대파 한 단; 삼겹살 600g") == [("계란", 10.0, "개"), ("대파", 1.0, "단"), ("삼겹살", 600.0, "g")]
+
+
+def test_parses_english_quantity_grammar():
+    assert _parsed("2 cartons of milk, a dozen eggs, 1kg beef, 3 apples, milk x2") == [
+        ("milk", 2.0, "carton"),
+        ("eggs", 12.0, "ea"),
+        ("beef", 1.0, "kg"),
+        ("apples", 3.0, None),
+        ("milk", 2.0, None),
+    ]
+
+
+def test_parses_relative_and_absolute_expiry():
+    candidates, unparsed = parse_grocery_text(
+        "삼겹살 600g 3일 후, 우유 (내일까지), tofu in 2 weeks, 오이 3개 10월 25일까지, 치즈 유통기한 1/5", TODAY
+    )
+
+    assert unparsed == []
+    assert [c.expiry_date for c in candidates] == [
+        date(2026, 10, 22),
+        date(2026, 10, 20),
+        date(2026, 11, 2),
+        date(2026, 10, 25),
+        date(2027, 1, 5),
+    ]
+
+
+def test_infers_category_and_storage():
+    candidates, _ = parse_grocery_text("냉동 만두 2봉지, 서울우유 1L, 라면 5개, 닭가슴살 (냉동)", TODAY)
+
+    assert [(c.name, c.category, c.storage_location) for c in candidates] == [
+        ("만두", "frozen", "freezer"),
+        ("서울우유", "dairy", "fridge"),
+        ("라면", "noodles", "pantry"),
+        ("닭가슴살", "meat", "freezer"),
+    ]
+    assert lookup_food("eggplant") == ("vegetables", "fridge")
+    assert lookup_food("eggnog") is None
+
+
+def test_escalates_what_the_grammar_cannot_account_for():
+    candidates, unparsed = parse_grocery_text(
+        "kimchi, mystery box, 우유 1L 2개, milk 10/25, the stuff mom brought yesterday", TODAY
+    )
+
+    assert [c.name for c in candidates] == ["kimchi"]
+    assert candidates[0].confidence == 0.9
+    assert unparsed == ["mystery box", "우유 1L 2개", "milk 10/25", "the stuff mom brought yesterday"]
@@ -4,18 +4,33 @@ import uuid
 
 import pytest
 
-from app.application.errors import ConflictError, NotFoundError, ValidationError
+from app.application.errors import ConflictError, NotFoundError, QuotaExceededError, ValidationError
 from app.application.use_cases.invites import join_fridge_by_invite
 from app.domain.entities import InviteCode
 
 
+@dataclass
+class FakeUnitOfWork:
+    commits: int = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+
 @dataclass
 class FakeFridgeRepo:
     members: set[tuple[uuid.UUID, uuid.UUID]]
+    membership_limit: int = 10
 
     async def is_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         return (fridge_id, user_id) in self.members
 
+    async def reserve_membership(self, user_id: uuid.UUID, limit: int) -> bool:
+        return sum(1 for _, member_id in self.members if member_id == user_id) < min(limit, self.membership_limit)
+
     async def add_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID, role: str) -> None:
         self.members.add((fridge_id, user_id))
 
@@ -39,10 +54,12 @@ async def test_join_fridge_invalid_code():
 
     with pytest.raises(NotFoundError):
         await join_fridge_by_invite(
+            uow=FakeUnitOfWork(),
             fridge_repo=fridge_repo,
             invite_repo=invite_repo,
             invite_code="missing",
             user_id=uuid.uuid4(),
+            max_memberships=10,
         )
 
 
@@ -63,10 +80,12 @@ async def test_join_fridge_expired():
 
     with pytest.raises(ValidationError):
         await join_fridge_by_invite(
+            uow=FakeUnitOfWork(),
             fridge_repo=fridge_repo,
             invite_repo=invite_repo,
             invite_code="abc",
             user_id=uuid.uuid4(),
+            max_memberships=10,
         )
 
 
@@ -87,10 +106,12 @@ async def test_join_fridge_used_up():
 
     with pytest.raises(ValidationError):
         await join_fridge_by_invite(
+            uow=FakeUnitOfWork(),
             fridge_repo=fridge_repo,
             invite_repo=invite_repo,
             invite_code="abc",
             user_id=uuid.uuid4(),
+            max_memberships=10,
         )
 
 
@@ -112,10 +133,12 @@ async def test_join_fridge_existing_member():
 
     with pytest.raises(ConflictError):
         await join_fridge_by_invite(
+            uow=FakeUnitOfWork(),
             fridge_repo=fridge_repo,
             invite_repo=invite_repo,
             invite_code="abc",
             user_id=user_id,
+            max_memberships=10,
         )
 
 
@@ -135,13 +158,45 @@ async def test_join_fridge_success():
     fridge_repo = FakeFridgeRepo(members=set())
     invite_repo = FakeInviteRepo(invite=invite)
 
+    uow = FakeUnitOfWork()
     returned = await join_fridge_by_invite(
+        uow=uow,
         fridge_repo=fridge_repo,
         invite_repo=invite_repo,
         invite_code="abc",
         user_id=user_id,
+        max_memberships=10,
     )
 
     assert returned == fridge_id
     assert (fridge_id, user_id) in fridge_repo.members
     assert invite.used_count == 1
+    assert uow.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_join_fridge_membership_quota():
+    fridge_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    invite = InviteCode(
+        id=uuid.uuid4(),
+        fridge_id=fridge_id,
+        code="abc",
+        expires_at=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+        created_by=uuid.uuid4(),
+        used_count=0,
+        max_uses=2,
+    )
+    fridge_repo = FakeFridgeRepo(members={(uuid.uuid4(), user_id)})
+    invite_repo = FakeInviteRepo(invite=invite)
+
+    with pytest.raises(QuotaExceededError):
+        await join_fridge_by_invite(
+            uow=FakeUnitOfWork(),
+            fridge_repo=fridge_repo,
+            invite_repo=invite_repo,
+            invite_code="abc",
+            user_id=user_id,
+            max_memberships=1,
+        )
+    assert invite.used_count == 0
@@ -1,21 +1,48 @@
-from dataclasses import dataclass
-from datetime import date, timedelta
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
 import uuid
 
 import pytest
 
-from app.application.errors import ForbiddenError
-from app.application.use_cases.items import confirm_items
-from app.domain.entities import FridgeItem
+from app.application.errors import ForbiddenError, PayloadTooLargeError, QuotaExceededError
+from app.application.use_cases.items import (
+    archive_stale_items,
+    confirm_items,
+    ingest_candidates,
+    prune_extraction_cache,
+    reserve_upload,
+)
+from app.domain.entities import FileData, FridgeItem, ItemCandidate
+
+
+@dataclass
+class FakeUnitOfWork:
+    commits: int = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+    async def release(self) -> None:
+        pass
 
 
 @dataclass
 class FakeFridgeRepo:
     members: set[tuple[uuid.UUID, uuid.UUID]]
+    item_count: int = 0
 
     async def is_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         return (fridge_id, user_id) in self.members
 
+    async def reserve_item_slots(self, fridge_id: uuid.UUID, count: int, limit: int) -> bool:
+        if self.item_count + count > limit:
+            return False
+        self.item_count += count
+        return True
+
 
 @dataclass
 class FakeItemRepo:
@@ -50,12 +77,14 @@ async def test_confirm_items_requires_membership():
 
     with pytest.raises(ForbiddenError):
         await confirm_items(
+            uow=FakeUnitOfWork(),
             fridge_repo=fridge_repo,
             item_repo=item_repo,
             fridge_id=uuid.uuid4(),
             user_id=uuid.uuid4(),
             items=[{"name": "milk"}],
             expiring_days=3,
+            max_items=100,
         )
 
 
@@ -71,14 +100,265 @@ async def test_confirm_items_sets_status():
         {"name": "rice", "expiry_date": date.today() + timedelta(days=10)},
     ]
 
+    uow = FakeUnitOfWork()
     created = await confirm_items(
+        uow=uow,
         fridge_repo=fridge_repo,
         item_repo=item_repo,
         fridge_id=fridge_id,
         user_id=user_id,
         items=items,
         expiring_days=3,
+        max_items=100,
     )
 
     assert created[0].status == "expiring"
     assert created[1].status == "fresh"
+    assert uow.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_confirm_items_enforces_fridge_quota():
+    fridge_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    fridge_repo = FakeFridgeRepo(members={(fridge_id, user_id)}, item_count=9)
+    item_repo = FakeItemRepo(created=[])
+
+    with pytest.raises(QuotaExceededError):
+        await confirm_items(
+            uow=FakeUnitOfWork(),
+            fridge_repo=fridge_repo,
+            item_repo=item_repo,
+            fridge_id=fridge_id,
+            user_id=user_id,
+            items=[{"name": "milk"}, {"name": "egg"}],
+            expiring_days=3,
+            max_items=10,
+        )
+    assert item_repo.created == []
+
+
+@dataclass
+class FakeUsageRepo:
+    used: int = 0
+
+    async def add_upload_bytes(self, user_id: uuid.UUID, usage_date: date, size: int, limit: int) -> bool:
+        if self.used + size > limit:
+            return False
+        self.used += size
+        return True
+
+
+@pytest.mark.asyncio
+async def test_reserve_upload_limits_image_count_and_daily_bytes():
+    usage_repo = FakeUsageRepo()
+    user_id = uuid.uuid4()
+
+    with pytest.raises(PayloadTooLargeError):
+        await reserve_upload(
+            uow=FakeUnitOfWork(),
+            usage_repo=usage_repo, user_id=user_id, image_count=3, total_bytes=10, max_images=2, max_bytes_per_day=100
+        )
+    await reserve_upload(
+        uow=FakeUnitOfWork(),
+        usage_repo=usage_repo, user_id=user_id, image_count=1, total_bytes=80, max_images=2, max_bytes_per_day=100
+    )
+    with pytest.raises(PayloadTooLargeError):
+        await reserve_upload(
+            uow=FakeUnitOfWork(),
+            usage_repo=usage_repo, user_id=user_id, image_count=1, total_bytes=30, max_images=2, max_bytes_per_day=100
+        )
+    assert usage_repo.used == 80
+
+
+@dataclass
+class FakeArchiveRepo:
+    remaining: int
+    batches: list[int]
+
+    async def archive_batch(self, cutoff: date, limit: int) -> int:
+        moved = min(self.remaining, limit)
+        self.remaining -= moved
+        self.batches.append(moved)
+        return moved
+
+
+@pytest.mark.asyncio
+async def test_archive_stale_items_drains_in_batches():
+    item_repo = FakeArchiveRepo(remaining=5, batches=[])
+
+    archived = await archive_stale_items(uow=FakeUnitOfWork(), item_repo=item_repo, older_than_days=30, batch_size=2)
+
+    assert archived == 5
+    assert item_repo.batches == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_archive_stale_items_stops_on_exact_multiple():
+    item_repo = FakeArchiveRepo(remaining=4, batches=[])
+
+    archived = await archive_stale_items(uow=FakeUnitOfWork(), item_repo=item_repo, older_than_days=30, batch_size=2)
+
+    assert archived == 4
+    assert item_repo.batches == [2, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_archive_stale_items_rejects_empty_batches():
+    item_repo = FakeArchiveRepo(remaining=5, batches=[])
+
+    with pytest.raises(ValueError):
+        await archive_stale_items(uow=FakeUnitOfWork(), item_repo=item_repo, older_than_days=30, batch_size=0)
+    assert item_repo.batches == []
+
+
+@dataclass
+class FakePruneCache:
+    rows: dict[str, tuple[str, datetime]]
+    batches: list[int] = field(default_factory=list)
+
+    async def prune_batch(self, model_version: str, cutoff: datetime, limit: int) -> int:
+        stale = [
+            key
+            for key, (version, created_at) in self.rows.items()
+            if version != model_version or created_at < cutoff
+        ][:limit]
+        for key in stale:
+            del self.rows[key]
+        self.batches.append(len(stale))
+        return len(stale)
+
+
+@pytest.mark.asyncio
+async def test_prune_extraction_cache_drops_old_versions_and_expired_rows():
+    now = datetime.now(timezone.utc)
+    cache = FakePruneCache(
+        rows={
+            "fresh": ("fake-2", now),
+            "retired": ("fake-1", now),
+            "expired": ("fake-2", now - timedelta(days=120)),
+            "retired-expired": ("fake-1", now - timedelta(days=120)),
+        }
+    )
+
+    pruned = await prune_extraction_cache(
+        uow=FakeUnitOfWork(), extraction_cache=cache, model_version="fake-2", older_than_days=90, batch_size=2
+    )
+
+    assert pruned == 3
+    assert list(cache.rows) == ["fresh"]
+    assert cache.batches == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_prune_extraction_cache_rejects_empty_batches():
+    cache = FakePruneCache(rows={})
+
+    with pytest.raises(ValueError):
+        await prune_extraction_cache(
+            uow=FakeUnitOfWork(), extraction_cache=cache, model_version="fake-2", older_than_days=90, batch_size=0
+        )
+    assert cache.batches == []
+
+
+@dataclass
+class FakeExtractionCache:
+    entries: dict[str, list[ItemCandidate]] = field(default_factory=dict)
+
+    async def get_many(self, keys: list[str]) -> dict[str, list[ItemCandidate]]:
+        return {key: self.entries[key] for key in keys if key in self.entries}
+
+    async def put_many(self, model_version: str, entries: dict[str, list[ItemCandidate]]) -> None:
+        self.entries.update(entries)
+
+
+@dataclass
+class FakeExtractor:
+    version: str = "fake-1"
+    calls: list[str] = field(default_factory=list)
+    provisional: bool = False
+
+    async def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]:
+        self.calls.append(text)
+        return [ItemCandidate(name=chunk.strip(), provisional=self.provisional) for chunk in text.split(",")]
+
+    async def extract_candidates_from_images(self, images: list[FileData]) -> list[ItemCandidate]:
+        self.calls.extend(image.filename for image in images)
+        return [
+            ItemCandidate(name=image.content.decode(), source="image", provisional=self.provisional)
+            for image in images
+            if image.content
+        ]
+
+
+@pytest.mark.asyncio
+async def test_ingest_reuses_cached_extractions():
+    cache = FakeExtractionCache()
+    extractor = FakeExtractor()
+    photo = FileData(filename="a.jpg", content=b"egg")
+
+    async def ingest(text: str | None, images: list[FileData]) -> list[str]:
+        uow = FakeUnitOfWork()
+        candidates = await ingest_candidates(
+            uow=uow, llm_client=extractor, extraction_cache=cache, text=text, images=images
+        )
+        return [candidate.name for candidate in candidates]
+
+    first = await ingest("mystery box, leftover stew", [photo])
+    again = await ingest("  mystery box,   leftover stew ", [FileData(filename="copy.jpg", content=b"egg")])
+    more = await ingest(None, [FileData(filename="b.jpg", content=b"kimchi"), photo])
+
+    assert first == again == ["mystery box", "leftover stew", "egg"]
+    assert more == ["kimchi", "egg"]
+    assert extractor.calls == ["mystery box, leftover stew", "a.jpg", "b.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_ingest_cache_is_keyed_by_extractor_version():
+    cache = FakeExtractionCache()
+    photo = FileData(filename="a.jpg", content=b"egg")
+
+    for extractor in (FakeExtractor(version="v1"), FakeExtractor(version="v2")):
+        await ingest_candidates(
+            uow=FakeUnitOfWork(), llm_client=extractor, extraction_cache=cache, text=None, images=[photo]
+        )
+        assert extractor.calls == ["a.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_ingest_escalates_only_unparsed_fragments():
+    cache = FakeExtractionCache()
+    extractor = FakeExtractor()
+
+    simple = await ingest_candidates(
+        uow=FakeUnitOfWork(), llm_client=extractor, extraction_cache=cache, text="우유 2개, 계란 10 개", images=[]
+    )
+    mixed = await ingest_candidates(
+        uow=FakeUnitOfWork(),
+        llm_client=extractor,
+        extraction_cache=cache,
+        text="두부 1모, mystery box, 김치",
+        images=[],
+    )
+
+    assert [(c.name, c.quantity, c.unit) for c in simple] == [("우유", 2.0, "개"), ("계란", 10.0, "개")]
+    assert [c.name for c in mixed] == ["두부", "김치", "mystery box"]
+    assert extractor.calls == ["mystery box"]
+    assert cache.entries and all(len(candidates) == 1 for candidates in cache.entries.values())
+
+
+@pytest.mark.asyncio
+async def test_ingest_does_not_cache_provisional_or_empty_extractions():
+    cache = FakeExtractionCache()
+    extractor = FakeExtractor(provisional=True)
+
+    candidates = await ingest_candidates(
+        uow=FakeUnitOfWork(),
+        llm_client=extractor,
+        extraction_cache=cache,
+        text="mystery box",
+        images=[FileData(filename="blank.jpg", content=b"")],
+    )
+
+    assert [candidate.name for candidate in candidates] == ["mystery box"]
+    assert cache.entries == {}
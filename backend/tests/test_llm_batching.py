@@ -0,0 +1,123 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import httpx
+import pytest
+
+from app.application.errors import ServiceUnavailableError
+from app.domain.entities import FileData, ItemCandidate, RecipeSuggestion
+from app.infrastructure.llm.batching import BatchingLLMClient
+from app.infrastructure.llm.fake_server import create_fake_gemini_app
+from app.infrastructure.llm.gemini import GeminiLLMClient
+
+
+@dataclass
+class FakeBatchExtractor:
+    version: str = "fake-1"
+    batches: list[list[str]] = field(default_factory=list)
+    error: Exception | None = None
+    left_out: set[str] = field(default_factory=set)
+
+    async def extract_candidates_batch(self, inputs: list[str | FileData]) -> list[list[ItemCandidate] | None]:
+        names = [item if isinstance(item, str) else item.filename for item in inputs]
+        self.batches.append(names)
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return [None if name in self.left_out else [ItemCandidate(name=name)] for name in names]
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        return []
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_concurrent_inputs_share_one_request():
+    inner = FakeBatchExtractor()
+    client = BatchingLLMClient(inner, window_seconds=0.01, max_batch_size=8)
+
+    text, images = await asyncio.gather(
+        client.extract_candidates_from_text("milk"),
+        client.extract_candidates_from_images([FileData("a.jpg", b"a"), FileData("b.jpg", b"b")]),
+    )
+
+    assert [candidate.name for candidate in text] == ["milk"]
+    assert [candidate.name for candidate in images] == ["a.jpg", "b.jpg"]
+    assert inner.batches == [["milk", "a.jpg", "b.jpg"]]
+
+
+@pytest.mark.asyncio
+async def test_full_batches_are_sent_without_waiting():
+    inner = FakeBatchExtractor()
+    client = BatchingLLMClient(inner, window_seconds=10, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(client.extract_candidates_from_text(str(n)) for n in range(4))), timeout=1
+    )
+
+    assert [candidates[0].name for candidates in results] == ["0", "1", "2", "3"]
+    assert inner.batches == [["0", "1"], ["2", "3"]]
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_every_caller_in_the_batch():
+    inner = FakeBatchExtractor(error=RuntimeError("llm down"))
+    client = BatchingLLMClient(inner, window_seconds=0.01, max_batch_size=8)
+
+    results = await asyncio.gather(
+        client.extract_candidates_from_text("milk"),
+        client.extract_candidates_from_text("egg"),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert len(inner.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_input_left_out_of_the_reply_fails_only_its_caller():
+    inner = FakeBatchExtractor(left_out={"tofu"})
+    client = BatchingLLMClient(inner, window_seconds=0.01, max_batch_size=8)
+
+    milk, tofu = await asyncio.gather(
+        client.extract_candidates_from_text("milk"),
+        client.extract_candidates_from_text("tofu"),
+        return_exceptions=True,
+    )
+
+    assert [candidate.name for candidate in milk] == ["milk"]
+    assert isinstance(tofu, ServiceUnavailableError)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_is_dropped_before_dispatch():
+    inner = FakeBatchExtractor()
+    client = BatchingLLMClient(inner, window_seconds=0.01, max_batch_size=8)
+
+    cancelled = asyncio.create_task(client.extract_candidates_from_text("gone"))
+    kept = asyncio.create_task(client.extract_candidates_from_text("milk"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert [candidate.name for candidate in await kept] == ["milk"]
+    assert inner.batches == [["milk"]]
+
+
+@pytest.mark.asyncio
+async def test_gemini_batch_results_are_split_per_input():
+    app = create_fake_gemini_app()
+    http = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://fake")
+    gemini = GeminiLLMClient(api_key="test", model="fake", base_url="http://fake", http=http)
+    client = BatchingLLMClient(gemini, window_seconds=0.01, max_batch_size=8)
+
+    text, image = await asyncio.gather(
+        client.extract_candidates_from_text("milk 1 l, eggs 6"),
+        client.extract_candidates_from_images([FileData("a.png", b"\x89PNG")]),
+    )
+    await client.aclose()
+
+    assert [(candidate.name, candidate.source) for candidate in text] == [("milk", "text"), ("eggs", "text")]
+    assert [candidate.source for candidate in image] == ["image"]
+    assert app.state.stats.requests == 1
@@ -0,0 +1,209 @@
+import asyncio
+from dataclasses import dataclass
+
+import httpx
+import pytest
+
+from app.application.errors import RequestRejectedError, ServiceUnavailableError
+from app.domain.entities import FileData, ItemCandidate, RecipeSuggestion
+from app.infrastructure.llm.fake_server import create_fake_gemini_app
+from app.infrastructure.llm.gemini import GeminiLLMClient
+from app.infrastructure.llm.hedging import WARM_SAMPLES, CircuitBreaker, HedgedLLMClient
+
+
+@dataclass
+class FakeProvider:
+    name: str
+    latency: float = 0.0
+    fail: bool = False
+    reject: bool = False
+    version: str = "fake-1"
+    calls: int = 0
+    cancelled: int = 0
+
+    async def _answer(self) -> str:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise ServiceUnavailableError(f"{self.name} down")
+        if self.reject:
+            raise RequestRejectedError(f"{self.name} refused the input")
+        return self.name
+
+    async def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]:
+        return [ItemCandidate(name=await self._answer())]
+
+    async def extract_candidates_from_images(self, images: list[FileData]) -> list[ItemCandidate]:
+        return [ItemCandidate(name=await self._answer(), source="image")]
+
+    async def extract_candidates_batch(self, inputs: list[str | FileData]) -> list[list[ItemCandidate]]:
+        name = await self._answer()
+        return [[ItemCandidate(name=name)] for _ in inputs]
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        return [RecipeSuggestion(title=await self._answer(), steps=[], use_items=items, missing_items=[])]
+
+    async def stream_recipes(self, items: list[str], prefer_expiring_first: bool):
+        for recipe in await self.suggest_recipes(items, prefer_expiring_first):
+            yield recipe
+
+    async def aclose(self) -> None:
+        pass
+
+
+@dataclass
+class FakeClock:
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _hedged(*providers: FakeProvider, **options) -> HedgedLLMClient:
+    options.setdefault("min_delay_seconds", 0.01)
+    options.setdefault("max_delay_seconds", 0.05)
+    return HedgedLLMClient([(provider.name, provider) for provider in providers], **options)
+
+
+async def _text(client: HedgedLLMClient) -> str:
+    return (await client.extract_candidates_from_text("milk"))[0].name
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    primary, secondary = FakeProvider("primary"), FakeProvider("secondary")
+    client = _hedged(primary, secondary)
+
+    assert await _text(client) == "primary"
+    assert secondary.calls == 0
+    assert not (await client.extract_candidates_from_text("milk"))[0].provisional
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_the_loser_cancelled():
+    primary, secondary = FakeProvider("primary", latency=1.0), FakeProvider("secondary", latency=0.01)
+    client = _hedged(primary, secondary)
+
+    candidates = await client.extract_candidates_from_text("milk")
+    await asyncio.sleep(0)
+
+    assert [(c.name, c.provisional) for c in candidates] == [("secondary", True)]
+    assert primary.cancelled == 1
+    assert client.breaker("primary").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_follows_the_primary_latency_percentile():
+    primary, secondary = FakeProvider("primary", latency=0.005), FakeProvider("secondary")
+    client = _hedged(primary, secondary, min_delay_seconds=0.001, max_delay_seconds=1.0)
+
+    for _ in range(WARM_SAMPLES):
+        assert await _text(client) == "primary"
+    primary.latency = 0.5
+
+    assert await _text(client) == "secondary"
+    assert secondary.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_fail_over_and_open_the_breaker():
+    clock = FakeClock()
+    primary, secondary = FakeProvider("primary", fail=True), FakeProvider("secondary")
+    client = _hedged(primary, secondary, failure_threshold=2, reset_seconds=10, clock=clock)
+
+    assert [await _text(client) for _ in range(3)] == ["secondary"] * 3
+    assert primary.calls == 2
+    assert client.breaker("primary").state == "open"
+
+    clock.now = 11
+    primary.fail = False
+    assert await _text(client) == "primary"
+    assert client.breaker("primary").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_failed_trial_reopens_the_breaker():
+    clock = FakeClock()
+    primary, secondary = FakeProvider("primary", fail=True), FakeProvider("secondary")
+    client = _hedged(primary, secondary, failure_threshold=1, reset_seconds=10, clock=clock)
+
+    await _text(client)
+    clock.now = 11
+    await _text(client)
+    await _text(client)
+
+    assert primary.calls == 2
+    assert client.breaker("primary").state == "open"
+
+
+@pytest.mark.asyncio
+async def test_all_providers_failing_raises():
+    client = _hedged(FakeProvider("primary", fail=True), FakeProvider("secondary", fail=True), failure_threshold=1)
+
+    with pytest.raises(ServiceUnavailableError):
+        await _text(client)
+    with pytest.raises(ServiceUnavailableError, match="No LLM provider"):
+        await _text(client)
+
+
+@pytest.mark.asyncio
+async def test_rejected_input_neither_fails_over_nor_trips_the_breaker():
+    primary, secondary = FakeProvider("primary", reject=True), FakeProvider("secondary")
+    client = _hedged(primary, secondary, failure_threshold=1)
+
+    for _ in range(2):
+        with pytest.raises(RequestRejectedError):
+            await _text(client)
+
+    assert (primary.calls, secondary.calls) == (2, 0)
+    assert client.breaker("primary").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_streams_race_to_the_first_recipe():
+    primary, secondary = FakeProvider("primary", latency=1.0), FakeProvider("secondary", latency=0.01)
+    client = _hedged(primary, secondary)
+
+    recipes = [recipe async for recipe in client.stream_recipes(["egg"], True)]
+
+    await asyncio.sleep(0)
+    assert [(recipe.title, recipe.provisional) for recipe in recipes] == [("secondary", True)]
+    assert primary.cancelled == 1
+
+
+def test_breaker_allows_one_trial_at_a_time():
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_seconds=5, clock=clock)
+
+    breaker.record_failure()
+    assert not breaker.allow()
+    clock.now = 5
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_hedges_a_slow_fake_server_to_a_fast_one():
+    def gemini(app) -> GeminiLLMClient:
+        http = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://fake")
+        return GeminiLLMClient(api_key="k", model="fake", base_url="http://fake", http=http)
+
+    slow = create_fake_gemini_app(latency_seconds=1.0)
+    fast = create_fake_gemini_app(latency_seconds=0.01)
+    client = HedgedLLMClient(
+        [("primary", gemini(slow)), ("secondary", gemini(fast))], min_delay_seconds=0.02, max_delay_seconds=0.05
+    )
+
+    candidates = await client.extract_candidates_from_text("milk, eggs")
+    await client.aclose()
+
+    assert [candidate.name for candidate in candidates] == ["milk", "eggs"]
+    assert slow.state.stats.requests == fast.state.stats.requests == 1
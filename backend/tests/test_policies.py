@@ -1,6 +1,14 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
+import uuid
 
-from app.domain.policies import determine_status
+from app.domain.entities import FridgeItem
+from app.domain.policies import (
+    determine_status,
+    extraction_cache_key,
+    is_token_revoked,
+    normalize_extraction_text,
+    recipe_fingerprint,
+)
 
 
 def test_determine_status_fresh_no_expiry():
@@ -20,3 +28,46 @@ def test_determine_status_expiring_threshold():
 def test_determine_status_fresh_above_threshold():
     today = date.today()
     assert determine_status(today + timedelta(days=5), today, 3) == "fresh"
+
+
+def test_token_not_revoked_without_revocation():
+    assert not is_token_revoked(datetime.now(tz=timezone.utc), None)
+
+
+def test_token_issued_before_revocation_is_revoked():
+    revoked_at = datetime(2026, 1, 1, 12, 0, 0, 500_000, tzinfo=timezone.utc)
+    assert is_token_revoked(revoked_at - timedelta(seconds=5), revoked_at)
+    assert is_token_revoked(None, revoked_at)
+
+
+def test_token_issued_after_revocation_is_valid():
+    revoked_at = datetime(2026, 1, 1, 12, 0, 0, 500_000, tzinfo=timezone.utc)
+    assert not is_token_revoked(revoked_at.replace(microsecond=0), revoked_at)
+    assert not is_token_revoked(revoked_at + timedelta(seconds=1), revoked_at)
+
+
+def _item(name: str, expiry_date: date | None) -> FridgeItem:
+    return FridgeItem(uuid.uuid4(), uuid.uuid4(), name, None, None, None, None, expiry_date, None, "fresh", None)
+
+
+def test_recipe_fingerprint_ignores_listing_order():
+    milk, egg = _item("milk", date(2026, 1, 2)), _item("egg", date(2026, 1, 1))
+    assert recipe_fingerprint([milk, egg], True) == recipe_fingerprint([egg, milk], True)
+    assert recipe_fingerprint([milk, egg], True) != recipe_fingerprint([milk, egg], False)
+
+
+def test_recipe_fingerprint_tracks_expiry_order():
+    before = [_item("milk", date(2026, 1, 2)), _item("egg", date(2026, 1, 1))]
+    after = [_item("milk", date(2026, 1, 2)), _item("egg", date(2026, 1, 3))]
+    assert recipe_fingerprint(before, True) != recipe_fingerprint(after, True)
+
+
+def test_normalize_extraction_text_folds_width_and_whitespace():
+    assert normalize_extraction_text("  우유\u3000２개,\n  milk ") == "우유 2개, milk"
+
+
+def test_extraction_cache_key_depends_on_version_and_kind():
+    key = extraction_cache_key("v1", "text", b"milk")
+    assert key != extraction_cache_key("v2", "text", b"milk")
+    assert key != extraction_cache_key("v1", "image", b"milk")
+    assert len(key) == 64
@@ -0,0 +1,192 @@
+"""Plan regression tests for repository queries.
+
+Seeds a realistic dataset into the Postgres database named by
+``TEST_DATABASE_URL`` and asserts, via ``EXPLAIN (FORMAT JSON)``, that each
+repository query reaches its table through an index. Skipped when no test
+database is configured. The database is wiped: point it at a scratch DB.
+"""
+
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if not TEST_DATABASE_URL:
+    pytest.skip("TEST_DATABASE_URL not set", allow_module_level=True)
+
+os.environ.setdefault("DATABASE_URL", TEST_DATABASE_URL)
+os.environ.setdefault("JWT_SECRET_KEY", "test")
+
+from datetime import date, timedelta  # noqa: E402
+import hashlib  # noqa: E402
+import json  # noqa: E402
+import uuid  # noqa: E402
+
+import pytest_asyncio  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+import app.db.models  # noqa: E402,F401
+from app.infrastructure.repositories.fridges import SqlFridgeRepository  # noqa: E402
+from app.infrastructure.repositories.invites import SqlInviteRepository  # noqa: E402
+from app.infrastructure.repositories.items import SqlItemRepository  # noqa: E402
+from app.infrastructure.repositories.notifications import SqlNotificationRepository  # noqa: E402
+from app.infrastructure.repositories.users import SqlUserRepository  # noqa: E402
+
+USERS = 2_000
+FRIDGES = 1_000
+ITEMS_PER_FRIDGE = 60
+MEMBERS_PER_FRIDGE = 3
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (id, email, hashed_password)
+    SELECT md5('user' || g)::uuid, 'user' || g || '@example.com', 'x'
+    FROM generate_series(1, {USERS}) AS g
+    """,
+    f"""
+    INSERT INTO fridges (id, name, owner_user_id)
+    SELECT md5('fridge' || g)::uuid, 'fridge ' || g, md5('user' || (g % {USERS} + 1))::uuid
+    FROM generate_series(1, {FRIDGES}) AS g
+    """,
+    f"""
+    INSERT INTO fridge_members (id, fridge_id, user_id, role)
+    SELECT gen_random_uuid(), md5('fridge' || f)::uuid,
+           md5('user' || ((f * {MEMBERS_PER_FRIDGE} + m) % {USERS} + 1))::uuid,
+           CASE WHEN m = 0 THEN 'owner' ELSE 'member' END
+    FROM generate_series(1, {FRIDGES}) AS f, generate_series(0, {MEMBERS_PER_FRIDGE - 1}) AS m
+    ON CONFLICT DO NOTHING
+    """,
+    f"""
+    INSERT INTO fridge_items (id, fridge_id, name, status, expiry_date)
+    SELECT md5('item' || f || '-' || i)::uuid, md5('fridge' || f)::uuid, 'item ' || i,
+           CASE WHEN i % 50 = 0 THEN 'consumed' ELSE 'fresh' END,
+           CASE WHEN i % 10 = 0 THEN NULL ELSE current_date + ((f * 7 + i * 13) % 370 - 5) END
+    FROM generate_series(1, {FRIDGES}) AS f, generate_series(1, {ITEMS_PER_FRIDGE}) AS i
+    """,
+    f"""
+    INSERT INTO notifications (id, user_id, fridge_id, item_id, type, status)
+    SELECT gen_random_uuid(), md5('user' || (f % {USERS} + 1))::uuid, md5('fridge' || f)::uuid,
+           md5('item' || f || '-' || i)::uuid, 'expiring', 'unread'
+    FROM generate_series(1, {FRIDGES}) AS f, generate_series(1, 20) AS i
+    """,
+    f"""
+    INSERT INTO fridge_items_archive (id, fridge_id, name, status, expiry_date)
+    SELECT gen_random_uuid(), md5('fridge' || f)::uuid, 'old item ' || i, 'consumed', current_date - 90
+    FROM generate_series(1, {FRIDGES}) AS f, generate_series(1, 20) AS i
+    """,
+    f"""
+    INSERT INTO invite_codes (id, fridge_id, code, expires_at, created_by, used_count, max_uses)
+    SELECT gen_random_uuid(), md5('fridge' || g)::uuid, 'code' || g, now() + interval '1 day',
+           md5('user' || (g % {USERS} + 1))::uuid, 0, 1
+    FROM generate_series(1, {FRIDGES}) AS g
+    """,
+]
+
+
+def _seed_id(prefix: str, n: int | str) -> uuid.UUID:
+    return uuid.UUID(hashlib.md5(f"{prefix}{n}".encode()).hexdigest())
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in SEED_SQL:
+            await conn.execute(text(statement))
+        await conn.execute(text("ANALYZE"))
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+class StatementRecorder:
+    def __init__(self, engine) -> None:
+        self.statements: list[tuple[str, object]] = []
+        self._engine = engine.sync_engine
+
+    def __enter__(self) -> "StatementRecorder":
+        event.listen(self._engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.lstrip().upper().startswith("EXPLAIN"):
+            self.statements.append((statement, parameters))
+
+
+def _scans(plan: dict) -> list[tuple[str, str]]:
+    found = []
+    if "Relation Name" in plan:
+        found.append((plan["Node Type"], plan["Relation Name"]))
+    for child in plan.get("Plans", []):
+        found.extend(_scans(child))
+    return found
+
+
+async def _explain(engine, statement: str, parameters) -> list[tuple[str, str]]:
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        raw = result.scalar_one()
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+    return _scans(plan[0]["Plan"])
+
+
+async def _assert_indexed(engine, call, tables: set[str]) -> None:
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    with StatementRecorder(engine) as recorder:
+        async with session_factory() as session:
+            await call(session)
+            await session.rollback()
+    checked = 0
+    for statement, parameters in recorder.statements:
+        for node_type, relation in await _explain(engine, statement, parameters):
+            if relation in tables:
+                checked += 1
+                assert node_type != "Seq Scan", f"{relation} scanned sequentially by:\n{statement}"
+    assert checked, f"no plan node touched {tables}"
+
+
+FRIDGE = _seed_id("fridge", 17)
+MEMBER = _seed_id("user", 17 * MEMBERS_PER_FRIDGE % USERS + 1)
+ITEM = _seed_id("item", "17-3")
+
+
+PLAN_CASES = {
+    "fridge_is_member": (lambda s: SqlFridgeRepository(s).is_member(FRIDGE, MEMBER), {"fridge_members"}),
+    "fridge_list_members": (lambda s: SqlFridgeRepository(s).list_members(FRIDGE), {"fridge_members"}),
+    "fridge_get_by_id": (lambda s: SqlFridgeRepository(s).get_by_id(FRIDGE), {"fridges"}),
+    "fridge_list_for_user": (
+        lambda s: SqlFridgeRepository(s).list_for_user(MEMBER, 3),
+        {"fridge_members", "fridge_items"},
+    ),
+    "item_list_items": (lambda s: SqlItemRepository(s).list_items(FRIDGE), {"fridge_items"}),
+    "item_get_by_id": (lambda s: SqlItemRepository(s).get_by_id(ITEM), {"fridge_items"}),
+    "item_list_expiring": (lambda s: SqlItemRepository(s).list_expiring(FRIDGE, 3), {"fridge_items"}),
+    "item_list_expiring_all": (lambda s: SqlItemRepository(s).list_expiring_all(3), {"fridge_items"}),
+    "item_archive_batch": (
+        lambda s: SqlItemRepository(s).archive_batch(date.today() - timedelta(days=30), 100),
+        {"fridge_items"},
+    ),
+    "item_list_archived": (lambda s: SqlItemRepository(s).list_archived(FRIDGE, 50), {"fridge_items_archive"}),
+    "notification_exists": (
+        lambda s: SqlNotificationRepository(s).exists(MEMBER, ITEM, "expiring"),
+        {"notifications"},
+    ),
+    "invite_get_by_code": (lambda s: SqlInviteRepository(s).get_by_code("code17"), {"invite_codes"}),
+    "user_get_by_email": (lambda s: SqlUserRepository(s).get_by_email("user17@example.com"), {"users"}),
+    "user_get_by_id": (lambda s: SqlUserRepository(s).get_by_id(MEMBER), {"users"}),
+}
+
+
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize("case", sorted(PLAN_CASES))
+async def test_repository_query_uses_index(engine, case):
+    call, tables = PLAN_CASES[case]
+    await _assert_indexed(engine, call, tables)
@@ -0,0 +1,113 @@
+from dataclasses import dataclass, field
+
+import pytest
+
+from app.domain.entities import FileData, ItemCandidate, RecipeSuggestion
+from app.infrastructure.llm.local import LocalRecipeClient
+from app.infrastructure.recipes.engine import Recipe, RecipeIndex
+
+RECIPES = [
+    Recipe(title="Kimchi fried rice", ingredients=["kimchi", "rice", "egg"], steps=["Fry."]),
+    Recipe(title="Steamed egg", ingredients=["egg", "green onion"], steps=["Steam."]),
+    Recipe(title="Milk pudding", ingredients=["milk", "egg", "sugar"], steps=["Bake."]),
+    Recipe(title="Tofu stew", ingredients=["tofu", "kimchi", "pork"], steps=["Simmer."]),
+]
+ALIASES = {"egg": ["계란", "달걀", "eggs"], "kimchi": ["김치"], "green onion": ["대파", "파"], "rice": ["밥"]}
+
+
+def _titles(recipes: list[RecipeSuggestion]) -> list[str]:
+    return [recipe.title for recipe in recipes]
+
+
+def test_matches_aliases_tokens_and_substrings():
+    index = RecipeIndex(RECIPES, ALIASES)
+
+    assert index.match("계란") == index.match("EGG") == index.match("organic eggs") == index.match("유기농달걀")
+    assert index.match("대파") == index.match("green onion")
+    assert index.match("파스타") is None
+    assert index.match("soap") is None
+
+
+def test_rank_reports_used_and_missing_items():
+    index = RecipeIndex(RECIPES, ALIASES)
+
+    recipes = index.rank(["김치", "밥", "계란"], prefer_expiring_first=False, limit=2)
+
+    assert _titles(recipes) == ["Kimchi fried rice", "Steamed egg"]
+    assert recipes[0].use_items == ["김치", "밥", "계란"]
+    assert recipes[0].missing_items == []
+    assert recipes[1].missing_items == ["green onion"]
+
+
+def test_rank_prefers_recipes_using_expiring_items():
+    index = RecipeIndex(RECIPES, ALIASES)
+
+    milk_first = index.rank(["milk", "tofu", "egg", "kimchi"], prefer_expiring_first=True, limit=1)
+    tofu_first = index.rank(["tofu", "milk", "egg", "kimchi"], prefer_expiring_first=True, limit=1)
+
+    assert _titles(milk_first) == ["Milk pudding"]
+    assert _titles(tofu_first) == ["Tofu stew"]
+
+
+def test_rank_without_matches_is_empty():
+    index = RecipeIndex(RECIPES, ALIASES)
+
+    assert index.rank(["soap"], prefer_expiring_first=True, limit=3) == []
+
+
+def test_bundled_corpus_loads():
+    index = RecipeIndex.from_file()
+
+    recipes = index.rank(["김치", "햇반", "계란"], prefer_expiring_first=True, limit=3)
+
+    assert len(index) > 50
+    assert recipes[0].title == "Kimchi fried rice"
+
+
+@dataclass
+class FakeLLM:
+    version: str = "fake-1"
+    asked: list[list[str]] = field(default_factory=list)
+
+    async def extract_candidates_from_text(self, text: str) -> list[ItemCandidate]:
+        return [ItemCandidate(name=text)]
+
+    async def extract_candidates_from_images(self, images: list[FileData]) -> list[ItemCandidate]:
+        return []
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        self.asked.append(items)
+        return [RecipeSuggestion(title="LLM dish", steps=[], use_items=items, missing_items=[])]
+
+    async def stream_recipes(self, items: list[str], prefer_expiring_first: bool):
+        for recipe in await self.suggest_recipes(items, prefer_expiring_first):
+            yield recipe
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_local_mode_answers_without_the_llm():
+    llm = FakeLLM()
+    client = LocalRecipeClient(llm, RecipeIndex(RECIPES, ALIASES), mode="local", limit=2)
+
+    recipes = await client.suggest_recipes(["계란", "대파"], True)
+    streamed = [recipe async for recipe in client.stream_recipes(["계란", "대파"], True)]
+    fallback = await client.suggest_recipes(["soap"], True)
+
+    assert _titles(recipes) == _titles(streamed) == ["Steamed egg", "Kimchi fried rice"]
+    assert _titles(fallback) == ["LLM dish"]
+    assert llm.asked == [["soap"]]
+    assert client.version == "fake-1"
+
+
+@pytest.mark.asyncio
+async def test_prefilter_mode_sends_only_matched_items():
+    llm = FakeLLM()
+    client = LocalRecipeClient(llm, RecipeIndex(RECIPES, ALIASES), mode="prefilter", limit=1)
+
+    await client.suggest_recipes(["soap", "계란", "ketchup", "대파"], True)
+    await client.suggest_recipes(["soap"], True)
+
+    assert llm.asked == [["계란", "대파"], ["soap"]]
@@ -0,0 +1,74 @@
+from datetime import date, timedelta
+import uuid
+
+from app.domain.entities import FridgeItem
+from app.domain.recipe_prompt import PromptBudget, clean_item_name, estimate_tokens, select_prompt_items
+
+TODAY = date(2026, 10, 19)
+
+
+def _item(name: str, days: int | None = None, category: str | None = None) -> FridgeItem:
+    return FridgeItem(
+        id=uuid.uuid4(),
+        fridge_id=uuid.uuid4(),
+        name=name,
+        category=category,
+        quantity=None,
+        unit=None,
+        purchase_date=None,
+        expiry_date=None if days is None else TODAY + timedelta(days=days),
+        storage_location=None,
+        status="fresh",
+        notes=None,
+    )
+
+
+def _select(items: list[FridgeItem], budget: PromptBudget | None, prefer_expiring_first: bool = True) -> list[str]:
+    return select_prompt_items(items, prefer_expiring_first=prefer_expiring_first, today=TODAY, budget=budget)
+
+
+def test_cleans_names():
+    assert clean_item_name("서울우유 1L (냉동)") == "서울우유"
+    assert clean_item_name("  Greek  yogurt [2 pack] 500g ") == "Greek yogurt"
+    assert clean_item_name("７up") == "7up"
+
+
+def test_estimates_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("eggs") == 1
+    assert estimate_tokens("milk, eggs") == 3
+    assert estimate_tokens("계란") == 2
+
+
+def test_dedupes_keeping_the_earliest_expiry():
+    items = [_item("Milk 1L", 5), _item("eggs", 3), _item("milk", 1), _item("(sale)"), _item("")]
+
+    assert _select(items, None) == ["Milk", "eggs", "(sale)"]
+    assert _select(items[1:], None) == ["milk", "eggs", "(sale)"]
+
+
+def test_budget_keeps_the_most_urgent_items():
+    items = [_item("tofu", 9), _item("milk", 0), _item("onion", 2), _item("rice")]
+
+    assert _select(items, PromptBudget(max_tokens=100, max_items=2)) == ["milk", "onion"]
+    assert _select(items, PromptBudget(max_tokens=4, max_items=10)) == ["milk", "onion"]
+    # An item that does not fit is skipped in favour of a shorter one.
+    assert _select(items, PromptBudget(max_tokens=3, max_items=10)) == ["milk", "tofu"]
+
+
+def test_diversity_spreads_picks_across_categories():
+    items = [
+        _item("milk", 1, "dairy"),
+        _item("yogurt", 1, "dairy"),
+        _item("cheese", 2, "dairy"),
+        _item("spinach", 4, "vegetables"),
+    ]
+
+    assert _select(items, PromptBudget(max_tokens=100, max_items=3, diversity=0)) == ["milk", "yogurt", "cheese"]
+    assert _select(items, PromptBudget(max_tokens=100, max_items=3)) == ["milk", "yogurt", "spinach"]
+
+
+def test_without_expiry_preference_keeps_inventory_order():
+    items = [_item("rice"), _item("tofu", 1), _item("onion", 5)]
+
+    assert _select(items, PromptBudget(max_tokens=100, max_items=2), prefer_expiring_first=False) == ["rice", "tofu"]
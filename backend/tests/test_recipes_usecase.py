@@ -0,0 +1,296 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+import uuid
+
+import pytest
+
+from app.application.use_cases.recipes import refresh_recipes, stream_recipes, suggest_recipes
+from app.domain.entities import CachedRecipes, FridgeItem, RecipeSuggestion
+from app.domain.policies import recipe_fingerprint
+from app.domain.recipe_prompt import PromptBudget
+from app.infrastructure.background import BackgroundJobs
+from app.infrastructure.single_flight import SingleFlight
+
+
+@dataclass
+class FakeUnitOfWork:
+    commits: int = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        pass
+
+    async def release(self) -> None:
+        pass
+
+
+@dataclass
+class FakeFridgeRepo:
+    members: set[tuple[uuid.UUID, uuid.UUID]]
+
+    async def is_member(self, fridge_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        return (fridge_id, user_id) in self.members
+
+
+@dataclass
+class FakeItemRepo:
+    items: list[FridgeItem]
+
+    async def list_items(self, fridge_id: uuid.UUID) -> list[FridgeItem]:
+        return [item for item in self.items if item.fridge_id == fridge_id]
+
+
+@dataclass
+class FakeRecipeCache:
+    entries: dict[uuid.UUID, CachedRecipes] = field(default_factory=dict)
+
+    async def get(self, fridge_id: uuid.UUID) -> CachedRecipes | None:
+        return self.entries.get(fridge_id)
+
+    async def put(self, fridge_id: uuid.UUID, fingerprint: str, recipes: list[RecipeSuggestion]) -> None:
+        self.entries[fridge_id] = CachedRecipes(fingerprint, recipes, datetime.now(tz=timezone.utc))
+
+
+@dataclass
+class FakeLLMClient:
+    calls: int = 0
+    prompts: list[list[str]] = field(default_factory=list)
+    provisional: bool = False
+
+    async def suggest_recipes(self, items: list[str], prefer_expiring_first: bool) -> list[RecipeSuggestion]:
+        self.calls += 1
+        self.prompts.append(items)
+        await asyncio.sleep(0)
+        return [
+            RecipeSuggestion(
+                title=f"mix {self.calls}", steps=[], use_items=items, missing_items=[], provisional=self.provisional
+            )
+        ]
+
+    async def stream_recipes(self, items: list[str], prefer_expiring_first: bool):
+        self.calls += 1
+        for name in items:
+            await asyncio.sleep(0)
+            yield RecipeSuggestion(
+                title=f"{name} soup", steps=[], use_items=[name], missing_items=[], provisional=self.provisional
+            )
+
+
+def _item(fridge_id: uuid.UUID, name: str, expiry_date: date | None) -> FridgeItem:
+    return FridgeItem(
+        id=uuid.uuid4(),
+        fridge_id=fridge_id,
+        name=name,
+        category=None,
+        quantity=None,
+        unit=None,
+        purchase_date=None,
+        expiry_date=expiry_date,
+        storage_location=None,
+        status="fresh",
+        notes=None,
+    )
+
+
+@dataclass
+class Scenario:
+    fridge_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    user_id: uuid.UUID = field(default_factory=uuid.uuid4)
+    cache: FakeRecipeCache = field(default_factory=FakeRecipeCache)
+    llm: FakeLLMClient = field(default_factory=FakeLLMClient)
+    refreshes: list[tuple[uuid.UUID, bool]] = field(default_factory=list)
+    flights: SingleFlight = field(default_factory=lambda: SingleFlight("test_recipes"))
+    commits: int = 0
+    stored: list[tuple[uuid.UUID, str, list[RecipeSuggestion]]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.fridge_repo = FakeFridgeRepo(members={(self.fridge_id, self.user_id)})
+        self.item_repo = FakeItemRepo(items=[_item(self.fridge_id, "milk", date.today() + timedelta(days=1))])
+
+    async def suggest(
+        self,
+        *,
+        prefer_expiring_first: bool = True,
+        fresh_seconds: float = 60.0,
+        prompt_budget: PromptBudget | None = None,
+    ):
+        uow = FakeUnitOfWork()
+        recipes = await suggest_recipes(
+            uow=uow,
+            fridge_repo=self.fridge_repo,
+            item_repo=self.item_repo,
+            recipe_cache=self.cache,
+            llm_client=self.llm,
+            coalescer=self.flights,
+            fridge_id=self.fridge_id,
+            user_id=self.user_id,
+            prefer_expiring_first=prefer_expiring_first,
+            fresh_seconds=fresh_seconds,
+            schedule_refresh=lambda fridge_id, prefer: self.refreshes.append((fridge_id, prefer)),
+            prompt_budget=prompt_budget,
+        )
+        self.commits += uow.commits
+        return recipes
+
+    async def stream(self) -> list[str]:
+        recipes = await stream_recipes(
+            uow=FakeUnitOfWork(),
+            fridge_repo=self.fridge_repo,
+            item_repo=self.item_repo,
+            recipe_cache=self.cache,
+            llm_client=self.llm,
+            fridge_id=self.fridge_id,
+            user_id=self.user_id,
+            prefer_expiring_first=True,
+            fresh_seconds=60.0,
+            schedule_refresh=lambda fridge_id, prefer: self.refreshes.append((fridge_id, prefer)),
+            schedule_store=lambda *entry: self.stored.append(entry),
+        )
+        titles = []
+        async for recipe in recipes:
+            titles.append(recipe.title)
+            assert self.stored == [], "cache is written only after the stream completes"
+        return titles
+
+
+@pytest.mark.asyncio
+async def test_repeat_suggestions_are_served_from_cache():
+    scenario = Scenario()
+
+    first = await scenario.suggest()
+    second = await scenario.suggest()
+
+    assert scenario.llm.calls == 1
+    assert second == first
+    assert scenario.refreshes == []
+
+
+@pytest.mark.asyncio
+async def test_prompt_budget_limits_the_items_sent():
+    scenario = Scenario()
+    scenario.item_repo.items += [
+        _item(scenario.fridge_id, "Milk 1L", date.today() + timedelta(days=3)),
+        _item(scenario.fridge_id, "rice", None),
+        _item(scenario.fridge_id, "egg", date.today()),
+    ]
+
+    await scenario.suggest(prompt_budget=PromptBudget(max_tokens=100, max_items=2))
+
+    assert scenario.llm.prompts == [["egg", "milk"]]
+
+
+@pytest.mark.asyncio
+async def test_provisional_recipes_are_not_cached():
+    scenario = Scenario(llm=FakeLLMClient(provisional=True))
+
+    await scenario.suggest()
+    titles = await scenario.stream()
+
+    assert titles == ["milk soup"]
+    assert scenario.cache.entries == {}
+    assert scenario.stored == []
+
+
+@pytest.mark.asyncio
+async def test_inventory_change_misses_cache():
+    scenario = Scenario()
+    await scenario.suggest()
+
+    scenario.item_repo.items.append(_item(scenario.fridge_id, "egg", None))
+    await scenario.suggest()
+    await scenario.suggest(prefer_expiring_first=False)
+
+    assert scenario.llm.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_and_refreshed():
+    scenario = Scenario()
+    await scenario.suggest()
+    entry = scenario.cache.entries[scenario.fridge_id]
+    entry.created_at -= timedelta(hours=1)
+
+    recipes = await scenario.suggest(fresh_seconds=60)
+
+    assert recipes == entry.recipes
+    assert scenario.llm.calls == 1
+    assert scenario.refreshes == [(scenario.fridge_id, True)]
+
+    uow = FakeUnitOfWork()
+    await refresh_recipes(
+        uow=uow,
+        item_repo=scenario.item_repo,
+        recipe_cache=scenario.cache,
+        llm_client=scenario.llm,
+        coalescer=scenario.flights,
+        fridge_id=scenario.fridge_id,
+        prefer_expiring_first=True,
+    )
+    refreshed = scenario.cache.entries[scenario.fridge_id]
+    assert refreshed.recipes[0].title == "mix 2"
+    assert refreshed.fingerprint == recipe_fingerprint(scenario.item_repo.items, True)
+    assert uow.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_llm_call():
+    scenario = Scenario()
+
+    results = await asyncio.gather(*(scenario.suggest() for _ in range(4)))
+
+    assert scenario.llm.calls == 1
+    assert all(recipes == results[0] for recipes in results)
+    assert scenario.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_recipes_then_stores_them():
+    scenario = Scenario()
+    scenario.item_repo.items.append(_item(scenario.fridge_id, "egg", None))
+
+    titles = await scenario.stream()
+
+    assert titles == ["milk soup", "egg soup"]
+    [(fridge_id, fingerprint, recipes)] = scenario.stored
+    assert fridge_id == scenario.fridge_id
+    assert fingerprint == recipe_fingerprint(scenario.item_repo.items, True)
+    assert [recipe.title for recipe in recipes] == titles
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_cached_recipes_without_llm():
+    scenario = Scenario()
+    await scenario.suggest()
+
+    titles = await scenario.stream()
+
+    assert titles == ["mix 1"]
+    assert scenario.llm.calls == 1
+    assert scenario.stored == []
+
+
+@pytest.mark.asyncio
+async def test_background_jobs_run_one_job_per_key():
+    jobs = BackgroundJobs("test_refresh")
+    started = asyncio.Event()
+    release = asyncio.Event()
+    runs: list[str] = []
+
+    async def job() -> None:
+        runs.append("run")
+        started.set()
+        await release.wait()
+
+    assert jobs.schedule("fridge", job) is True
+    await started.wait()
+    assert jobs.schedule("fridge", job) is False
+    release.set()
+    await jobs.drain()
+
+    assert runs == ["run"]
+    assert jobs.schedule("fridge", job) is True
+    await jobs.drain()
+    assert runs == ["run", "run"]
@@ -0,0 +1,71 @@
+from datetime import date, datetime, timezone
+import uuid
+
+import orjson
+import pytest
+
+from app.domain.entities import FridgeItem
+from app.interfaces.api import serialization
+from app.interfaces.api.serialization import encode_list, negotiate, sse_event
+from app.schemas.item import ItemOut
+
+
+def _item(name: str) -> FridgeItem:
+    return FridgeItem(
+        id=uuid.uuid4(),
+        fridge_id=uuid.uuid4(),
+        name=name,
+        category=None,
+        quantity=1.5,
+        unit="ea",
+        purchase_date=None,
+        expiry_date=date(2024, 5, 1),
+        storage_location="fridge",
+        status="fresh",
+        notes=None,
+        created_at=datetime(2024, 4, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_encode_list_matches_pydantic_json():
+    items = [_item("milk"), _item("egg")]
+
+    body = encode_list(ItemOut, items)
+
+    expected = [orjson.loads(ItemOut.model_validate(item).model_dump_json()) for item in items]
+    assert orjson.loads(body) == expected
+
+
+def test_negotiate_defaults_to_json():
+    assert negotiate(None) == "application/json"
+    assert negotiate("text/html") == "application/json"
+    assert negotiate("*/*") == "application/json"
+
+
+def test_negotiate_honours_q_values(monkeypatch):
+    monkeypatch.setattr(serialization, "msgpack", object())
+
+    assert negotiate("application/msgpack") == "application/msgpack"
+    assert negotiate("application/json, application/x-msgpack;q=0.5") == "application/json"
+    assert negotiate("application/json;q=0.5, application/msgpack") == "application/msgpack"
+
+
+def test_negotiate_falls_back_without_msgpack(monkeypatch):
+    monkeypatch.setattr(serialization, "msgpack", None)
+
+    assert negotiate("application/msgpack") == "application/json"
+
+
+def test_encode_list_msgpack_round_trip():
+    msgpack = pytest.importorskip("msgpack")
+    items = [_item("milk")]
+
+    body = encode_list(ItemOut, items, "application/msgpack")
+
+    assert msgpack.unpackb(body) == orjson.loads(encode_list(ItemOut, items))
+
+
+def test_sse_event_is_one_framed_event():
+    body = sse_event("recipe", {"title": "line\nbreak"})
+
+    assert body == b'event: recipe\ndata: {"title":"line\\nbreak"}\n\n'
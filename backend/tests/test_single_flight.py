@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.single_flight import SingleFlight
+
+
+class Gate:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        self.started.set()
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return f"result {self.calls}"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flights = SingleFlight("test_share")
+    gate = Gate()
+
+    waiters = [asyncio.create_task(flights.run("fridge", gate)) for _ in range(5)]
+    await gate.started.wait()
+    gate.release.set()
+
+    assert await asyncio.gather(*waiters) == ["result 1"] * 5
+    assert gate.calls == 1
+    assert len(flights) == 0
+
+
+@pytest.mark.asyncio
+async def test_failures_are_shared_and_not_remembered():
+    flights = SingleFlight("test_failure")
+    calls = 0
+
+    async def boom() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise RuntimeError("llm down")
+
+    results = await asyncio.gather(*(flights.run("fridge", boom) for _ in range(3)), return_exceptions=True)
+    assert [type(result) for result in results] == [RuntimeError] * 3
+    assert calls == 1
+
+    with pytest.raises(RuntimeError):
+        await flights.run("fridge", boom)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call():
+    flights = SingleFlight("test_cancel_one")
+    gate = Gate()
+
+    leader = asyncio.create_task(flights.run("fridge", gate))
+    await gate.started.wait()
+    follower = asyncio.create_task(flights.run("fridge", gate))
+    await asyncio.sleep(0)
+    leader.cancel()
+    gate.release.set()
+
+    assert await follower == "result 1"
+    assert leader.cancelled()
+    assert not gate.cancelled
+
+
+@pytest.mark.asyncio
+async def test_call_is_cancelled_when_every_caller_leaves():
+    flights = SingleFlight("test_cancel_all")
+    gate = Gate()
+
+    waiters = [asyncio.create_task(flights.run("fridge", gate)) for _ in range(2)]
+    await gate.started.wait()
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert gate.cancelled
+    assert len(flights) == 0